@@ -4,10 +4,10 @@ print("Importing modules...")
 import os
 import sys
 import traceback
-from scrappy_RA.utils import post_process_utils
-from scrappy_RA.scrapers.higher_ed.higher_ed import run_higher_ed_module
-from scrappy_RA.scrapers.umich.umich import run_umich_module
-from scrappy_RA.scrapers.berkeley.berkeley import run_berkeley_module
+from scrappy_RA.utils import debug_capture, post_process_utils, query_planner, rate_limiter, selenium_utils
+from scrappy_RA.scrapers.higher_ed.higher_ed import plan_higher_ed_module, run_higher_ed_module
+from scrappy_RA.scrapers.umich.umich import plan_umich_module, run_umich_module
+from scrappy_RA.scrapers.berkeley.berkeley import plan_berkeley_module, run_berkeley_module
 
 
 # --- CONFIGURATION ---
@@ -20,6 +20,21 @@ FETCH_HIGHER_ED_FLAG = True
 FETCH_UMICH_FLAG = False
 FETCH_BERKELEY_FLAG = False
 
+# Which HigherEd listing pages to search
+HIGHER_ED_PAGES = dict(search_remote_jobs_page=True, search_lab_jobs_page=True)
+
+# Keep Chrome profiles (challenge cookies, HTTP cache) between runs, and attach
+# to the browser daemon (python -m scrappy_RA.utils.browser_daemon) when it's
+# running. Set either to None to launch fresh browsers.
+BROWSER_USER_DATA_DIR = selenium_utils.USER_DATA_DIR
+BROWSER_DEBUGGER_ADDRESS = selenium_utils.DEBUGGER_ADDRESS
+
+# Debug HTML: pages that time out or fail a search are always kept; set a
+# sample rate (e.g. 0.05) to also keep a fraction of ordinary pages. Captures
+# are compressed into a ring buffer under debug_capture.DEBUG_CAPTURE_DIR.
+DEBUG_SAMPLE_RATE = 0.0
+DEBUG_MAX_CAPTURES = 200
+
 
 def has_results(result) -> bool:
     """True if a module's return value is a non-empty DataFrame."""
@@ -52,22 +67,46 @@ def run_module_safely(name, fn, **kwargs):
 
 if __name__ == '__main__':
     results = {}
+    selenium_utils.configure_browsers(BROWSER_USER_DATA_DIR, BROWSER_DEBUGGER_ADDRESS)
+    debug_capture.configure_debug_capture(sample_rate=DEBUG_SAMPLE_RATE, max_files=DEBUG_MAX_CAPTURES)
+
+    # Load the profile once and collect every search the enabled modules will
+    # run, so identical searches are issued once and shared
+    planner = query_planner.QueryPlanner()
+    if FETCH_HIGHER_ED_FLAG:
+        plan_higher_ed_module(planner, **HIGHER_ED_PAGES)
+    if FETCH_UMICH_FLAG:
+        plan_umich_module(planner)
+    if FETCH_BERKELEY_FLAG:
+        plan_berkeley_module(planner)
+    planner.print_plan()
 
     if FETCH_HIGHER_ED_FLAG:
         results['higher_ed'] = run_module_safely(
             'HigherEd', run_higher_ed_module,
-            search_remote_jobs_page=True,
-            search_lab_jobs_page=True,
+            **HIGHER_ED_PAGES,
             fetch_desc=True,
             desc_limit=100,  # will continue to fetch uncached descriptions on subsequent runs
-            ai_enrich=False
+            ai_enrich=False,
+            planner=planner,
+            incremental=True,  # stop at known pages, fill the rest from the last crawl
             )
 
     if FETCH_UMICH_FLAG:
-        results['umich'] = run_module_safely('UMich', run_umich_module)
+        results['umich'] = run_module_safely('UMich', run_umich_module, planner=planner)
 
     if FETCH_BERKELEY_FLAG:
-        results['berkeley'] = run_module_safely('Berkeley', run_berkeley_module)
+        results['berkeley'] = run_module_safely('Berkeley', run_berkeley_module, planner=planner)
+
+    # Every module is done with the browsers
+    selenium_utils.get_browser_manager().close()
+
+    planner.report()
+    rate_limiter.report_all()
+    selenium_utils.report_launches()
+    selenium_utils.report_page_weight()
+    selenium_utils.report_search_latencies()
+    debug_capture.get_debug_capture().report()
 
     # Only halt if every module that ran failed or returned nothing. The
     # combine/export step below is gated behind this same check.
@@ -0,0 +1,115 @@
+import asyncio
+from typing import AsyncIterator, Dict, List, Optional
+
+from bs4 import BeautifulSoup
+import polars as pl
+
+from scrappy_RA.scrapers.scraper import Scraper
+
+
+class AsyncScraper(Scraper):
+    """
+    asyncio counterpart to Scraper. Mix it in ahead of a requests-based
+    scraper (e.g. `class AsyncUMichScraper(AsyncScraper, UMichScraper)`) and
+    its blocking get_soup/parse_page run in worker threads, so many keyword
+    searches can be awaited at once. Requests are bounded by a per-host
+    semaphore and paced by the host's shared rate limiter.
+    """
+    def __init__(
+        self,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.semaphore = semaphore or asyncio.Semaphore(self.per_host_limit)
+
+    async def get_soup(self, url: str) -> BeautifulSoup:
+        """Fetch a page in a worker thread, holding a per-host slot. Pacing happens in the thread."""
+        async with self.semaphore:
+            return await asyncio.to_thread(super().get_soup, url)
+
+    async def parse_page(self, soup: BeautifulSoup, url: Optional[str] = None) -> List[Dict]:
+        """
+        Parse a page in a worker thread so the event loop stays responsive.
+        With `url`, reuses the HTTP cache's parse result on a 304.
+        """
+        if url is None:
+            return await asyncio.to_thread(super().parse_page, soup)
+        return await asyncio.to_thread(self.parse_page_cached, url, soup, super().parse_page)
+
+    async def scrape(self) -> pl.DataFrame:
+        """Collect iter_pages() into a DataFrame (incremental crawls as in Scraper.scrape)."""
+        self.start_crawl()
+        stopped_early = False
+        async for jobs_on_page in self.iter_pages():
+            self.jobs_from_search.extend(jobs_on_page)
+            if self.crawl_state and self.crawl_state.page_is_known(jobs_on_page):
+                print("Only known jobs older than the last crawl. Stopping.")
+                stopped_early = True
+                break
+        return self.finish_crawl(stopped_early)
+
+    async def iter_pages(self) -> AsyncIterator[List[Dict]]:
+        """
+        Yield each page's parsed jobs in page order. Fetches page 1, then every
+        remaining page concurrently if the pager gives the last page (and an
+        incremental crawl can't stop early); otherwise follows has_next_page
+        one page at a time.
+        """
+        page = 0
+        while True:
+            url = self.build_page_url(page)
+            soup = await self.get_soup(url)
+            if soup is None:
+                print("Failed to fetch page. Stopping.")
+                break
+
+            jobs_on_page = await self.parse_page(soup, url)
+            if not jobs_on_page:
+                print("No jobs found. Stopping.")
+                break
+            yield jobs_on_page
+
+            if not self.has_next_page(soup):
+                break
+
+            last_page = self.get_last_page(soup) if page == 0 and not self.stops_early() else None
+            if last_page is not None:
+                async for jobs_on_page in self._iter_pages_concurrent(range(1, last_page + 1)):
+                    yield jobs_on_page
+                break
+            page += 1
+
+    async def iter_jobs(self, unique_on: Optional[str] = None) -> AsyncIterator[Dict]:
+        """Async counterpart to Scraper.iter_jobs."""
+        seen = set()
+        async for jobs_on_page in self.iter_pages():
+            for job in jobs_on_page:
+                if unique_on:
+                    key = job.get(unique_on)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                yield job
+
+    async def _iter_pages_concurrent(self, pages) -> AsyncIterator[List[Dict]]:
+        """
+        Fetch and parse `pages` concurrently, yielding each page as soon as it
+        and every page before it are done, so output stays in page order.
+        """
+        async def fetch_and_parse(page):
+            url = self.build_page_url(page)
+            soup = await self.get_soup(url)
+            return None if soup is None else await self.parse_page(soup, url)
+
+        tasks = [asyncio.create_task(fetch_and_parse(p)) for p in pages]
+        try:
+            for page, task in zip(pages, tasks):
+                jobs_on_page = await task
+                if not jobs_on_page:
+                    print(f"No jobs on page {page + 1}. Stopping.")
+                    break
+                yield jobs_on_page
+        finally:
+            for task in tasks:
+                task.cancel()
@@ -1,33 +1,35 @@
 
 
-import os
 from pathlib import Path
-import yaml
 import polars as pl
 
 from . import berkeley_scraper
+from scrappy_RA.utils import query_planner
 
 BASE_DIR = Path(__file__).resolve().parent     # __file__ is a built-in variable, points to your .py file
 
 
-def run_berkeley_module(search_jobs_page=True):
+def plan_berkeley_module(planner, search_jobs_page=True):
+    """Register the searches run_berkeley_module will issue with `planner`."""
+    if search_jobs_page:
+        planner.add('Berkeley', berkeley_scraper.BASE_URL, planner.profile['SEARCH_KW_INDIVIDUAL_NODASH'])
+
+
+def run_berkeley_module(search_jobs_page=True, planner=None):
     print('Running UC Berkeley scraper...')
 
     # Get listings (mostly in-person)
     if search_jobs_page:
-        BASE_URL = 'https://careerspub.universityofcalifornia.edu/psc/ucb/EMPLOYEE/HRMS/c/HRS_HRAM_FL.HRS_CG_SEARCH_FL.GBL?Page=HRS_APP_SCHJOB_FL&Action=U'
         OUTPUT_FILE='./scrappy_RA/data_saved_locally/berkeley/berkeley_lab_jobs.csv'
         
-        # Get keywords from profile YAML
-        yaml_path = BASE_DIR / ".." / ".." / "profiles" / "profile1.yaml"
-        print(f"Profiles available: {os.listdir(yaml_path.parent)}")
-        with open(yaml_path, "r") as f:
-            profile = yaml.safe_load(f)
+        # Get keywords from the profile YAML (read once per run by the planner)
+        planner = planner or query_planner.QueryPlanner()
+        profile = planner.profile
         EXCLUSION_ROLE_KW = profile['EXCLUSION_ROLE_KW']
         SEARCH_KW = profile['SEARCH_KW_INDIVIDUAL_NODASH']
         
         jobs = berkeley_scraper.search_berkeley(
-            SEARCH_KW, OUTPUT_FILE, EXCLUSION_ROLE_KW
+            SEARCH_KW, OUTPUT_FILE, EXCLUSION_ROLE_KW, planner=planner
             )
      
     jobs.write_csv('./scrappy_RA/data_to_unify/berkeley_jobs.csv')
@@ -3,9 +3,9 @@
 import time
 import re
 import random
-from typing import Callable, List, Dict
+from typing import Callable, List, Dict, Optional
 from urllib.parse import urljoin
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import polars as pl
 from scrappy_RA.scrapers.scraper import Scraper
 
@@ -13,10 +13,33 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from scrappy_RA.utils import selenium_utils
+from scrappy_RA.utils import selenium_utils, gen_utils, query_planner
+
+
+BASE_URL = "https://careerspub.universityofcalifornia.edu/psc/ucb/EMPLOYEE/HRMS/c/HRS_HRAM_FL.HRS_CG_SEARCH_FL.GBL?Page=HRS_APP_SCHJOB_FL&Action=U"
 
 
 class UCBerkeleyScraper(Scraper):
+    # Incremental crawls track jobs by these columns
+    id_col = 'job_id'
+    date_col = 'posted_date'
+
+    # Only build the PeopleSoft result grid rows
+    parser_backend = "lxml"
+    restrict_parse = True
+    result_strainer = gen_utils.AnyOfStrainer(
+        SoupStrainer('li', class_=re.compile(r'\bps_grid-row\b')),
+        SoupStrainer('a', rel='next')
+    )
+
+    # Read the result grid in the browser (see Scraper.extract_page)
+    browser_extract = True
+    extract_spec = selenium_utils.PS_EXTRACT_SPEC
+
+    # Read the rows from PeopleSoft's AJAX responses (see capture_results),
+    # falling back to the grid
+    capture_network = True
+
     # Set UCBerkeley-specific defaults
     def __init__(
         self,
@@ -46,7 +69,7 @@ class UCBerkeleyScraper(Scraper):
                 
         # Call parent with only its recognized parameters
         super().__init__(
-            base_url="https://careerspub.universityofcalifornia.edu/psc/ucb/EMPLOYEE/HRMS/c/HRS_HRAM_FL.HRS_CG_SEARCH_FL.GBL?Page=HRS_APP_SCHJOB_FL&Action=U", 
+            base_url=BASE_URL, 
             kw_param_nm="",
             out_cols=['title', 'department', 'location', 'url', 'posted_date', 'job_id'],
             **kwargs
@@ -79,16 +102,11 @@ class UCBerkeleyScraper(Scraper):
         return False
     '''
     
-    def get_soup(self, url: str) -> BeautifulSoup:
-        """Fetch page using selenium-based soup fetcher."""
-        # self._ensure_driver()
-        
-        soup = selenium_utils.get_soup_selenium(
-            driver=self.driver,
-            url=url,
+    def _selenium_kwargs(self) -> Dict:
+        """Page-load options shared by fetch_html and load_page."""
+        return dict(
             wait_selectors=self.wait_selectors,
             wait_time=self.wait_time,
-            sleep_time=self.sleep_time,
             enable_scroll=self.enable_scroll,
             scroll_container_id=self.scroll_container_id,
             enable_search_box=self.enable_search_box,
@@ -98,7 +116,31 @@ class UCBerkeleyScraper(Scraper):
             no_results_id=self.no_results_id,
             save_debug_html=self.save_debug_html
             )
-        return soup
+
+    def fetch_html(self, url: str) -> str:
+        """Fetch page HTML using selenium."""
+        # self._ensure_driver()
+        
+        html = selenium_utils.get_html_selenium(driver=self.driver, url=url, **self._selenium_kwargs())
+        return html
+
+    def capture_results(self, url: str) -> Optional[List[Dict]]:
+        """Run the search and parse the rows out of PeopleSoft's AJAX responses."""
+        return selenium_utils.capture_ps_results(
+            self.driver,
+            url,
+            parse=lambda html: self.parse_page(self.make_soup(html)),
+            search_kw=self.search_kw[0],
+            search_box_id=self.search_box_id,
+            search_button_id=self.search_button_id,
+            no_results_id=self.no_results_id,
+            scroll_container_id=self.scroll_container_id,
+            wait_time=self.wait_time
+            )
+
+    def load_page(self, url: str) -> bool:
+        """Load a page in the browser for extract_page; False if it didn't load."""
+        return selenium_utils.load_page_selenium(driver=self.driver, url=url, **self._selenium_kwargs())
         
     def parse_page(self, soup: BeautifulSoup) -> List[Dict]:
         """
@@ -183,19 +225,29 @@ class UCBerkeleyScraper(Scraper):
                 continue
                                         
         return jobs_on_page
+
+    def jobs_from_rows(self, rows: List[Dict]) -> List[Dict]:
+        """Build job records from grid rows extracted with PS_EXTRACT_SPEC."""
+        return selenium_utils.ps_jobs_from_rows(rows, self.base_url)
         
         
-def search_berkeley(search_kw, output_file, exclusion_role_kw):
+def search_berkeley(search_kw, output_file, exclusion_role_kw, planner=None, pool_size=3):
     all_jobs_df_list = []
-    driver = selenium_utils.setup_driver()
+    planner = planner or query_planner.QueryPlanner()
+
+    def search_keyword(driver, kw):
+        print(f"\nSearch: {kw}...")
+        berkeley_scraper = UCBerkeleyScraper(search_kw=[kw], driver=driver)
+        return planner.run(BASE_URL, [kw], berkeley_scraper.scrape)
+
+    # Fan the keywords out across the run's shared (network-capturing) browsers
+    jobs_dfs = selenium_utils.get_browser_manager().map(
+        search_keyword, list(search_kw), workers=pool_size, capture_network=True
+    )
             
-    # Loop through the list of keywords (index corresponding to relevance)
+    # Loop through the results in keyword order (index corresponding to relevance)
     i = 1
-    for kw in search_kw:
-        print(f"\nSearch #{i}, kw: {kw}...")
-        berkeley_scraper = UCBerkeleyScraper(search_kw=[kw], driver=driver)
-        jobs_df_i = berkeley_scraper.scrape()
-        
+    for kw, jobs_df_i in zip(search_kw, jobs_dfs):
         if jobs_df_i is not None and not jobs_df_i.is_empty():
             jobs_df_i = jobs_df_i.with_columns(
                 pl.lit(kw).alias('kw'),
@@ -206,14 +258,6 @@ def search_berkeley(search_kw, output_file, exclusion_role_kw):
             i += 1
 
     all_jobs = pl.concat(all_jobs_df_list)
-    
-    if driver:
-        try:
-            driver.quit()
-            driver = None
-            print("✓ Browser closed")
-        except Exception as e:
-            print(f"Warning: Error closing driver - {e}")
 
     # Concatenate kw_idx values for duplicate job_ids, then keep first of other columns
     all_jobs = all_jobs.group_by('job_id', maintain_order=True).agg([
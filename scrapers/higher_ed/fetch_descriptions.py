@@ -11,8 +11,10 @@ roughly 6-12s per job, i.e. 30-60 min for a few hundred postings.
 Two things were verified while building this module (Step 0 of the plan):
   1. HigherEdJobs detail pages sit behind an Imperva Incapsula JS challenge, so a
      plain `requests` GET returns a ~1KB stub, not content. Selenium (which already
-     passes the challenge for the search pages) is required. There is therefore no
-     "requests-first" fast path for detail pages on this site.
+     passes the challenge for the search pages) is required to get in - but once
+     it has, its cookies and user agent work for plain HTTP too, so the rest of
+     the postings are fetched concurrently over requests (SessionHandoff), going
+     back to the browser only to renew the cookies when a stub comes back.
   2. The description lives in `<div id="jobDesc">` (plus a short `<div id="jobStatement">`);
      there is no JobPosting JSON-LD. Expired postings render a "no longer an active
      posting" stub.
@@ -26,12 +28,14 @@ is also cached, so it too is paid for only once per posting.
 
 import json
 import os
-import random
+import queue
 import re
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 
 import polars as pl
 from bs4 import BeautifulSoup
@@ -39,9 +43,9 @@ from bs4 import BeautifulSoup
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 
-from scrappy_RA.utils import selenium_utils
+from scrappy_RA.utils import debug_capture, gen_utils, rate_limiter, selenium_utils
 
 
 # --- Configuration ---------------------------------------------------------
@@ -65,6 +69,12 @@ EDU_RE = re.compile(
 
 SUMMARY_CHARS = 500
 
+# A detail page smaller than this is the Incapsula stub, not a posting
+STUB_MAX_BYTES = 2048
+
+# Stubs in a row (each followed by a cookie refresh) before giving up on HTTP
+MAX_REFRESHES_IN_A_ROW = 3
+
 # Cache schema. AI columns stay null until enrich_with_ai() fills them.
 _CACHE_COLUMNS = [
     "job_code",
@@ -84,19 +94,32 @@ _CACHE_COLUMNS = [
 def fetch_description_html(driver, url: str, wait_time: int = 20) -> str:
     """
     Navigate `driver` to `url`, wait for the real content to render, and return
-    the page HTML. No fixed pre-sleep: we wait on the content selector instead
-    and add only a short settle. Returns whatever HTML is present on timeout so
-    the parser can still detect a deleted/blocked stub.
+    the page HTML. No fixed sleeps: we wait on the content selector instead.
+    Returns whatever HTML is present on timeout so the parser can still detect
+    a deleted/blocked stub.
+
+    Requests are paced by the host's shared rate limiter; a challenge stub or a
+    page whose content never rendered makes it back off.
     """
-    driver.get(url)
+    limiter = rate_limiter.get_limiter(url)
+    limiter.acquire()
+    start = time.perf_counter()
+    selenium_utils.navigate(driver, url, wait_time)
+    rendered = True
     try:
         WebDriverWait(driver, wait_time).until(
             EC.presence_of_element_located((By.CSS_SELECTOR, CONTENT_WAIT_SELECTOR))
         )
     except TimeoutException:
-        pass
-    time.sleep(random.uniform(0.4, 0.9))  # brief settle for late-rendering JS
-    return driver.page_source
+        rendered = False
+    latency = time.perf_counter() - start
+    selenium_utils.note_page(driver, timed_out=not rendered)
+    html = driver.page_source
+    limiter.record(latency, challenged=not rendered or selenium_utils.looks_challenged(html))
+    selenium_utils.record_page_weight(driver)
+    if not rendered:
+        debug_capture.capture(url, "not_rendered", html=html, error=True)
+    return html
 
 
 def parse_description(html: str) -> Dict:
@@ -245,18 +268,467 @@ def _load_cache() -> pl.DataFrame:
 
 
 def _write_cache(cache: pl.DataFrame) -> None:
+    # Write then rename, so a crash mid-write can't leave a corrupt cache
     CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
-    cache.write_parquet(CACHE_PATH)
+    tmp_path = CACHE_PATH.with_suffix(".tmp")
+    cache.write_parquet(tmp_path)
+    os.replace(tmp_path, CACHE_PATH)
+
+
+class CacheCommitter:
+    """
+    Adds fetched postings to the description cache as they come in, writing
+    it every `every` postings (and on commit()), so a run that dies part-way
+    keeps what it fetched and the next run skips those postings.
+    """
+
+    def __init__(self, cache: pl.DataFrame, every: int = 10):
+        self.cache = cache
+        self.every = max(1, every)
+        self.pending: List[Dict] = []
+        self.n_desc = 0
+        self.n_deleted = 0
+        self.n_commits = 0
+        self._lock = threading.Lock()
+
+    def add(self, cache_row: Dict) -> None:
+        with self._lock:
+            self.pending.append(cache_row)
+            self.n_desc += bool(cache_row["description"])
+            self.n_deleted += bool(cache_row["deleted"])
+            if len(self.pending) >= self.every:
+                self._commit()
+
+    def commit(self) -> None:
+        """Write any postings not yet in the cache file."""
+        with self._lock:
+            self._commit()
+
+    def _commit(self) -> None:
+        if not self.pending:
+            return
+        cache = pl.concat([self.cache, pl.DataFrame(self.pending, schema=self.cache.schema)])
+        self.cache = cache.unique(subset=["job_code"], keep="last", maintain_order=True)
+        _write_cache(self.cache)
+        self.pending = []
+        self.n_commits += 1
 
 
 # --- Orchestration ---------------------------------------------------------
 
+def _empty_parsed() -> Dict:
+    return {"description": "", "education_requirements_jsonld": "", "deleted": False}
+
+
+def _is_resolved(parsed: Dict) -> bool:
+    """A real description or a confirmed deletion (vs. a challenge/empty page)."""
+    return bool(parsed["description"] or parsed.get("deleted"))
+
+
+def _fetch_and_parse(driver, url: str) -> Dict:
+    try:
+        return parse_description(fetch_description_html(driver, url))
+    except Exception as e:
+        print(f"      fetch error: {e}")
+        return _empty_parsed()
+
+
+def _fetch_serial(driver, rows: List[Dict]):
+    """Yield (row, parsed) for each row, fetching and parsing one at a time."""
+    for i, row in enumerate(rows, 1):
+        title = (row.get("title") or "")[:55]
+        print(f"  [{i}/{len(rows)}] {title}")
+
+        # Fetch, retrying once if the page comes back empty and is not a
+        # confirmed deletion - an empty non-deleted page is usually a bot
+        # challenge/incomplete render, which a slower reload clears (the rate
+        # limiter has already backed off by then).
+        parsed = _empty_parsed()
+        for attempt in range(2):
+            parsed = _fetch_and_parse(driver, row["url"])
+            if _is_resolved(parsed):
+                break
+
+        yield row, parsed
+
+
+def _fetch_pipelined(driver, rows: List[Dict], parse_workers: Optional[int] = None):
+    """
+    Yield (row, parsed) for each row, in order. Each page's HTML goes to the
+    parse pool and the driver moves straight on to the next posting; a
+    posting's result is collected once the following page has loaded, by
+    which point its parse has normally finished. Unresolved pages get the
+    same single retry as the serial path.
+    """
+    from scrappy_RA.scrapers.scraper import get_parse_pool
+    pool = get_parse_pool(parse_workers)
+
+    def finish(row, future):
+        try:
+            parsed = future.result() if future else _empty_parsed()
+        except Exception as e:
+            print(f"      parse error: {e}")
+            parsed = _empty_parsed()
+        if not _is_resolved(parsed):
+            parsed = _fetch_and_parse(driver, row["url"])
+        return row, parsed
+
+    pending = None
+    for i, row in enumerate(rows, 1):
+        title = (row.get("title") or "")[:55]
+        print(f"  [{i}/{len(rows)}] {title}")
+        try:
+            future = pool.submit(parse_description, fetch_description_html(driver, row["url"]))
+        except Exception as e:
+            print(f"      fetch error: {e}")
+            future = None
+
+        if pending:
+            yield finish(*pending)
+        pending = (row, future)
+
+    if pending:
+        yield finish(*pending)
+
+
+# Starts a navigation without blocking the command on it: the current document
+# is tagged so polling can tell it apart from the one that replaces it.
+_START_NAVIGATION_JS = """
+document.__scrappyStale = true;
+setTimeout(() => { window.location.href = arguments[0]; }, 0);
+"""
+
+# 'ready' once the new document has the content, else 'loading'
+_POLL_TAB_JS = """
+if (document.__scrappyStale || document.readyState === 'loading') return 'loading';
+return document.querySelector(arguments[0]) ? 'ready' : 'loading';
+"""
+
+TAB_POLL_SECONDS = 0.1
+
+
+def _fetch_tabs(driver, rows: List[Dict], tabs: int = 4, wait_time: int = 20):
+    """
+    Yield (row, parsed) for each row, in the order they finish. `tabs` window
+    handles are kept open in the one (already challenge-cleared) browser:
+    each is sent to a posting without waiting on it, then they are polled
+    round-robin for the content selector and whichever has rendered is
+    harvested and sent to the next posting, so the page loads overlap.
+    Every navigation goes through the host's rate limiter, and an
+    unresolved page is retried once, as on the serial path.
+    """
+    original = driver.current_window_handle
+    handles = [original]
+    waiting = [(i, row, 0) for i, row in enumerate(rows, 1)]  # (number, row, attempt)
+    busy: Dict[str, tuple] = {}  # handle -> (number, row, attempt, url, start)
+
+    def drop(handle, e):
+        """Forget a tab that can no longer be switched to."""
+        print(f"      lost a tab ({type(e).__name__}); {len(handles) - 1} left")
+        handles.remove(handle)
+        lost = busy.pop(handle, None)
+        if lost:
+            waiting.insert(0, lost[:3])
+
+    def start(handle):
+        """Send `handle` to the next waiting posting; yields (row, empty) for any that fail to start."""
+        while waiting:
+            try:
+                driver.switch_to.window(handle)
+            except WebDriverException as e:
+                drop(handle, e)  # the posting stays queued for a live tab
+                return
+            i, row, attempt = waiting.pop(0)
+            if not attempt:
+                print(f"  [{i}/{len(rows)}] {(row.get('title') or '')[:55]}")
+            rate_limiter.get_limiter(row["url"]).acquire()
+            try:
+                driver.execute_script(_START_NAVIGATION_JS, row["url"])
+            except WebDriverException as e:
+                print(f"      fetch error: {e}")
+                yield row, _empty_parsed()
+                continue
+            busy[handle] = (i, row, attempt, row["url"], time.perf_counter())
+            return
+
+    def fill():
+        """Start every idle tab on a waiting posting."""
+        for handle in list(handles):
+            if handle not in busy:
+                yield from start(handle)
+
+    def harvest(handle, rendered: bool) -> Dict:
+        i, row, attempt, url, started = busy.pop(handle)
+        latency = time.perf_counter() - started
+        html = driver.page_source
+        selenium_utils.note_page(driver, timed_out=not rendered)
+        rate_limiter.get_limiter(url).record(
+            latency, challenged=not rendered or selenium_utils.looks_challenged(html)
+        )
+        selenium_utils.record_page_weight(driver)
+        if not rendered:
+            debug_capture.capture(url, "not_rendered", html=html, error=True)
+        return parse_description(html)
+
+    try:
+        for _ in range(min(tabs, len(rows)) - 1):
+            driver.switch_to.new_window("tab")
+            handles.append(driver.current_window_handle)
+
+        yield from fill()
+
+        while busy:
+            progressed = False
+            for handle in list(busy):
+                i, row, attempt, url, started = busy[handle]
+                try:
+                    driver.switch_to.window(handle)
+                except WebDriverException as e:
+                    drop(handle, e)
+                    progressed = True
+                    continue
+                try:
+                    state = driver.execute_script(_POLL_TAB_JS, CONTENT_WAIT_SELECTOR)
+                    timed_out = state != "ready" and time.perf_counter() - started > wait_time
+                    if state != "ready" and not timed_out:
+                        continue
+                    parsed = harvest(handle, rendered=not timed_out)
+                except Exception as e:
+                    print(f"      fetch error: {e}")
+                    busy.pop(handle, None)
+                    parsed = _empty_parsed()
+                progressed = True
+
+                if not _is_resolved(parsed) and attempt == 0:
+                    waiting.append((i, row, 1))
+                else:
+                    yield row, parsed
+            yield from fill()
+            if not progressed:
+                time.sleep(TAB_POLL_SECONDS)
+
+        # Every tab was lost: the rest are left for the next run
+        if waiting:
+            print(f"      No tabs left; {len(waiting)} postings not fetched")
+            for _, row, _ in waiting:
+                yield row, _empty_parsed()
+            waiting.clear()
+    finally:
+        for handle in handles:
+            if handle == original:
+                continue
+            try:
+                driver.switch_to.window(handle)
+                driver.close()
+            except WebDriverException:
+                pass
+        try:
+            driver.switch_to.window(original)
+        except WebDriverException:
+            pass
+
+
+def looks_like_stub(html: Optional[str]) -> bool:
+    """True if an HTTP-fetched detail page is the challenge stub rather than the posting."""
+    return html is None or len(html) < STUB_MAX_BYTES or selenium_utils.looks_challenged(html)
+
+
+class SessionHandoff:
+    """
+    Fetch detail pages over a pooled requests.Session carrying the cookies and
+    user agent of a Selenium session that has passed the Incapsula challenge.
+    A page that comes back unresolved is loaded in the browser instead; if it
+    was the challenge stub, the browser's refreshed cookies are copied over
+    again. After MAX_REFRESHES_IN_A_ROW stubs with no good page in between,
+    HTTP is given up on and every page goes through the browser.
+    """
+
+    def __init__(self, driver, workers: int = 4):
+        self.driver = driver
+        self.workers = workers
+        self.session = gen_utils.make_session(pool_size=workers)
+        self.headers: Dict[str, str] = {}
+        self.http_enabled = True
+        self.n_http = 0
+        self.n_browser = 0
+        self.n_refreshes = 0
+        self._refreshes_in_a_row = 0
+        self._generation = 0  # bumped each time cookies are copied
+        self._lock = threading.Lock()  # the driver, and the session's cookies
+
+    def _copy_session(self) -> None:
+        """Copy the driver's cookies and user agent into the requests session."""
+        user_agent = self.driver.execute_script("return navigator.userAgent")
+        self.headers = {"User-Agent": user_agent, "Accept-Language": "en-US,en"}
+        self.session.cookies.clear()
+        for cookie in self.driver.get_cookies():
+            self.session.cookies.set(
+                cookie["name"], cookie["value"],
+                domain=cookie.get("domain", ""), path=cookie.get("path", "/"),
+            )
+        self._generation += 1
+
+    def fetch_browser(self, url: str, refresh: bool = True) -> Dict:
+        """Fetch `url` in the browser (retrying once, as _fetch_serial does), then copy its cookies."""
+        with self._lock:
+            parsed = _empty_parsed()
+            for attempt in range(2):
+                parsed = _fetch_and_parse(self.driver, url)
+                self.n_browser += 1
+                if _is_resolved(parsed):
+                    break
+            if refresh:
+                self._copy_session()
+        return parsed
+
+    def fetch(self, url: str) -> Dict:
+        """Fetch and parse one posting, over HTTP while that works."""
+        if not self.http_enabled:
+            return self.fetch_browser(url, refresh=False)
+
+        generation = self._generation
+        content = gen_utils.get_html_requests(url, headers=self.headers, session=self.session, use_cache=False)
+        html = content.decode("utf-8", errors="replace") if content is not None else None
+        stub = looks_like_stub(html)
+        if not stub:
+            parsed = parse_description(html)
+            if _is_resolved(parsed):
+                self.n_http += 1
+                self._refreshes_in_a_row = 0
+                return parsed
+
+        # Only the first stub seen with a given set of cookies renews them
+        refresh = False
+        if stub:
+            # get_html_requests counted the 200 as a success; a stub is a
+            # challenge, so have the limiter back off (a failed request, with
+            # no HTML, was already recorded as an error)
+            if html is not None:
+                rate_limiter.get_limiter(url).record(challenged=True)
+            with self._lock:
+                if generation == self._generation and self.http_enabled:
+                    refresh = True
+                    self.n_refreshes += 1
+                    self._refreshes_in_a_row += 1
+                    if self._refreshes_in_a_row > MAX_REFRESHES_IN_A_ROW:
+                        print("      HTTP keeps getting the challenge stub; using the browser only")
+                        self.http_enabled = False
+                        refresh = False
+        return self.fetch_browser(url, refresh=refresh)
+
+    def report(self) -> None:
+        print(f"  Handoff: {self.n_http} fetched over HTTP, {self.n_browser} browser loads "
+              f"({self.n_refreshes} cookie refreshes).")
+
+
+def _fetch_handoff(driver, rows: List[Dict], workers: int = 4):
+    """
+    Yield (row, parsed) for each row, in order. The first posting is loaded
+    in the browser to pass the challenge; the rest are fetched `workers` at
+    a time over HTTP with its cookies (see SessionHandoff). Requests still
+    go through the host's rate limiter.
+    """
+    handoff = SessionHandoff(driver, workers)
+
+    def fetch(numbered_row):
+        i, row = numbered_row
+        title = (row.get("title") or "")[:55]
+        print(f"  [{i}/{len(rows)}] {title}")
+        try:
+            return row, handoff.fetch(row["url"])
+        except Exception as e:
+            print(f"      fetch error: {e}")
+            return row, _empty_parsed()
+
+    try:
+        if rows:
+            print(f"  [1/{len(rows)}] {(rows[0].get('title') or '')[:55]}")
+            yield rows[0], handoff.fetch_browser(rows[0]["url"])
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # map() yields in submission order, so rows stay in ranking order
+            yield from pool.map(fetch, enumerate(rows[1:], 2))
+    finally:
+        handoff.report()
+        handoff.session.close()
+
+
+def _fetch_workers(rows: List[Dict], workers: int, fetch_share: Callable):
+    """
+    Yield (row, parsed) for each row, in the order they finish, with the rows
+    dealt out across `workers` drivers borrowed from the run's browser manager;
+    each works through its share with `fetch_share(driver, share)` (one of the
+    generators above). All of them draw on the host's one rate limiter, so
+    more drivers overlap page loads without raising the request rate past what
+    the site tolerates.
+    """
+    shares = [rows[k::workers] for k in range(workers)]
+    results: queue.Queue = queue.Queue()
+    finished = object()
+    errors: List[Exception] = []
+
+    def work(driver, share):
+        try:
+            for result in fetch_share(driver, share):
+                results.put(result)
+        except Exception as e:
+            print(f"      browser worker failed: {e}")
+
+    def run():
+        # map() itself can fail (a browser that won't start or warm up), in
+        # which case no work() runs for that share - the sentinel must still come
+        try:
+            selenium_utils.get_browser_manager().map(
+                work, shares, workers=workers, warm_url=rows[0]["url"]
+            )
+        except Exception as e:
+            errors.append(e)
+        finally:
+            results.put(finished)
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    while True:
+        result = results.get()
+        if result is finished:
+            break
+        yield result
+    thread.join()
+    if errors:
+        raise errors[0]
+
+
+def _cache_row(row: Dict, parsed: Dict, today: str) -> Dict:
+    desc = parsed["description"]
+    edu = extract_education_requirements(desc)
+    if not edu and parsed.get("education_requirements_jsonld"):
+        edu = parsed["education_requirements_jsonld"]
+
+    return {
+        "job_code": row["job_code"],
+        "description": desc,
+        "summary": make_summary(desc),
+        "education_requirements": edu,
+        "ai_summary": None,
+        "ai_education_requirements": None,
+        "ai_degree_level": None,
+        "deleted": bool(parsed.get("deleted")),
+        "fetched_date": today,
+    }
+
+
 def fetch_job_descriptions(
     df: pl.DataFrame,
     driver=None,
     ai_enrich: bool = False,
     ai_model: str = "claude-haiku-4-5",
     desc_limit: Optional[int] = None,
+    pipeline: bool = False,
+    parse_workers: Optional[int] = None,
+    handoff: bool = True,
+    http_workers: int = 4,
+    tabs: int = 1,
+    browser_workers: int = 1,
+    commit_every: int = 10,
 ) -> pl.DataFrame:
     """
     Add `description`, `summary`, and `education_requirements` columns to `df`
@@ -270,11 +742,34 @@ def fetch_job_descriptions(
     All rows still get the description columns via the join; postings past the
     cap simply come back null until a later run fetches them.
 
+    With `pipeline`, each page's HTML is parsed in a process pool (see
+    scrapers.scraper.get_parse_pool) while the driver is already loading the
+    next posting, instead of fetch and parse alternating on one thread.
+
+    With `handoff` (the default), only the first posting - and any that come
+    back as a challenge stub - is rendered in the browser; the others are
+    fetched `http_workers` at a time over HTTP with the browser's cookies (see
+    SessionHandoff). `pipeline` and `tabs` apply to the browser-only path.
+
+    With `tabs` > 1, that many tabs of the one browser load postings at once
+    and are harvested as each renders (see _fetch_tabs). With `browser_workers`
+    > 1 and no `driver` passed, the postings are split across that many of the
+    run's browsers (each using `tabs`/`pipeline` as above), all paced by the
+    host's one rate limiter.
+
+    Fetched postings are written to the cache every `commit_every` postings
+    rather than once at the end, so an interrupted run loses at most that
+    many and the next run resumes from where it stopped.
+
     `df` must have `job_code` and `url` columns. If `driver` is None, one is
-    created via selenium_utils.setup_driver() and closed when done.
+    borrowed from the run's browser manager (selenium_utils.get_browser_manager).
     """
     if df is None or df.is_empty():
         return df
+    if handoff and (tabs > 1 or browser_workers > 1):
+        print("  fetch_job_descriptions: `tabs`/`browser_workers` only apply with handoff=False; ignoring them.")
+    elif driver is not None and browser_workers > 1:
+        print("  fetch_job_descriptions: `browser_workers` is ignored when a driver is passed.")
     if "job_code" not in df.columns or "url" not in df.columns:
         print("  fetch_job_descriptions: df is missing 'job_code'/'url'; skipping.")
         return df
@@ -301,78 +796,52 @@ def fetch_job_descriptions(
           f"({n_uncached} uncached{capped}) / "
           f"{df.height} total ({len(cached_codes)} already cached).")
 
-    new_rows: List[Dict] = []
     if to_fetch.height:
-        own_driver = driver is None
-        if own_driver:
-            driver = selenium_utils.setup_driver()
-        try:
-            today = date.today().isoformat()
+        today = date.today().isoformat()
+        rows = list(to_fetch.iter_rows(named=True))
+        committer = CacheCommitter(cache, every=commit_every)
+
+        def fetch_share(driver, share: List[Dict]):
+            """The browser-only fetch of `share` with `driver`."""
+            if tabs > 1:
+                return _fetch_tabs(driver, share, tabs)
+            if pipeline:
+                return _fetch_pipelined(driver, share, parse_workers)
+            return _fetch_serial(driver, share)
+
+        def commit_rows(fetched) -> int:
+            """Add each result of `fetched` to the cache; returns how many stayed unresolved."""
             n_failed = 0
-            for i, row in enumerate(to_fetch.iter_rows(named=True), 1):
-                title = (row.get("title") or "")[:55]
-                print(f"  [{i}/{to_fetch.height}] {title}")
-
-                # Fetch, retrying once if the page comes back empty and is not a
-                # confirmed deletion - an empty non-deleted page is usually a bot
-                # challenge/incomplete render, which a reload after a pause clears.
-                parsed = {"description": "", "education_requirements_jsonld": "",
-                          "deleted": False}
-                for attempt in range(2):
-                    try:
-                        html = fetch_description_html(driver, row["url"])
-                        parsed = parse_description(html)
-                    except Exception as e:
-                        print(f"      fetch error: {e}")
-                        parsed = {"description": "", "education_requirements_jsonld": "",
-                                  "deleted": False}
-                    if parsed["description"] or parsed.get("deleted"):
-                        break
-                    if attempt == 0:
-                        time.sleep(random.uniform(2.5, 4.0))  # let a challenge clear
-
+            for row, parsed in fetched:
                 # Only cache resolved results (real description, or confirmed
                 # deletion). Transient failures are left uncached so the next run
                 # retries them instead of persisting a blank forever.
-                if not (parsed["description"] or parsed.get("deleted")):
+                if not _is_resolved(parsed):
                     n_failed += 1
                     print("      unresolved (challenge/empty) - will retry next run")
-                    time.sleep(random.uniform(0.6, 1.2))
                     continue
+                committer.add(_cache_row(row, parsed, today))
+            return n_failed
 
-                desc = parsed["description"]
-                edu = extract_education_requirements(desc)
-                if not edu and parsed.get("education_requirements_jsonld"):
-                    edu = parsed["education_requirements_jsonld"]
-
-                new_rows.append({
-                    "job_code": row["job_code"],
-                    "description": desc,
-                    "summary": make_summary(desc),
-                    "education_requirements": edu,
-                    "ai_summary": None,
-                    "ai_education_requirements": None,
-                    "ai_degree_level": None,
-                    "deleted": bool(parsed.get("deleted")),
-                    "fetched_date": today,
-                })
-                time.sleep(random.uniform(0.6, 1.2))  # polite pacing
+        try:
+            if driver is not None:
+                fetched = _fetch_handoff(driver, rows, http_workers) if handoff else fetch_share(driver, rows)
+                n_failed = commit_rows(fetched)
+            elif not handoff and browser_workers > 1:
+                n_failed = commit_rows(_fetch_workers(rows, browser_workers, fetch_share))
+            else:
+                # Borrow one of the run's browsers (already past the challenge if
+                # the search used it)
+                with selenium_utils.get_browser_manager().lease(warm_url=rows[0]["url"]) as driver:
+                    fetched = _fetch_handoff(driver, rows, http_workers) if handoff else fetch_share(driver, rows)
+                    n_failed = commit_rows(fetched)
         finally:
-            if own_driver:
-                try:
-                    driver.quit()
-                    print("  Description driver closed.")
-                except Exception:
-                    pass
-
-        if new_rows:
-            cache = pl.concat([cache, pl.DataFrame(new_rows, schema=cache.schema)])
-            cache = cache.unique(subset=["job_code"], keep="last")
-            _write_cache(cache)
-        n_desc = sum(1 for r in new_rows if r["description"])
-        n_del = sum(1 for r in new_rows if r["deleted"])
-        print(f"  Fetched {n_desc} descriptions ({n_del} deleted/expired, "
-              f"{n_failed} unresolved) -> cache now {cache.height} rows.")
+            committer.commit()
+
+        cache = committer.cache
+        print(f"  Fetched {committer.n_desc} descriptions ({committer.n_deleted} deleted/expired, "
+              f"{n_failed} unresolved) -> cache now {cache.height} rows "
+              f"({committer.n_commits} writes).")
 
     # Optional AI enrichment of any cached rows still missing it.
     if ai_enrich:
@@ -1,40 +1,53 @@
 
 
-import os
 from pathlib import Path
-import yaml
 import polars as pl
 
 # Explicit relative import
 from . import higher_ed_scraper
+from scrappy_RA.utils import query_planner
 
 
 # Get the directory where THIS script is located
 BASE_DIR = Path(__file__).resolve().parent     # __file__ is a built-in variable, points to your .py file
 
+REMOTE_BASE_URL = 'https://www.higheredjobs.com/search/remote.cfm'
+LAB_BASE_URL = 'https://www.higheredjobs.com/admin/search.cfm?JobCat=150&CatName=Laboratory%20and%20Research'
+
+
+def plan_higher_ed_module(planner, search_remote_jobs_page=True, search_lab_jobs_page=True):
+    """Register the searches run_higher_ed_module will issue with `planner`."""
+    if search_remote_jobs_page:
+        planner.add('HigherEd remote', REMOTE_BASE_URL, planner.profile['SEARCH_KW_HIGHERED_REMOTE'])
+    if search_lab_jobs_page:
+        planner.add('HigherEd lab', LAB_BASE_URL, planner.profile['SEARCH_KW_HIGHERED_LAB'])
+
 
 def run_higher_ed_module(search_remote_jobs_page=True, search_lab_jobs_page=True,
-                         fetch_desc=True, ai_enrich=False, desc_limit=None):
+                         fetch_desc=True, ai_enrich=False, desc_limit=None, planner=None,
+                         incremental=False, desc_pipeline=False, desc_handoff=True, desc_tabs=1,
+                         desc_browser_workers=1):
     print('Running HigherEd scraper...')
     remote_jobs = None
     lab_jobs = None
     
-    # Get keywords from profile YAML
-    yaml_path = BASE_DIR / ".." / ".." / "profiles" / "profile1.yaml"
-    print(f"Profiles available: {os.listdir(yaml_path.parent)}")
-    with open(yaml_path, "r") as f:
-        profile = yaml.safe_load(f)
+    # Get keywords from the profile YAML (read once per run by the planner)
+    planner = planner or query_planner.QueryPlanner()
+    profile = planner.profile
     EXCLUSION_ROLE_KW = profile['EXCLUSION_ROLE_KW']
     SEARCH_KW = profile['SEARCH_KW_HIGHERED_REMOTE']
 
     # Get remote jobs
     if search_remote_jobs_page:
-        BASE_URL = 'https://www.higheredjobs.com/search/remote.cfm'
+        BASE_URL = REMOTE_BASE_URL
         OUTPUT_FILE='./scrappy_RA/data_saved_locally/higher_ed/higher_ed_remote_jobs.csv'
 
         remote_jobs = higher_ed_scraper.search_higher_ed_category(
             BASE_URL, SEARCH_KW, OUTPUT_FILE, EXCLUSION_ROLE_KW,
-            fetch_desc=fetch_desc, ai_enrich=ai_enrich, desc_limit=desc_limit
+            fetch_desc=fetch_desc, ai_enrich=ai_enrich, desc_limit=desc_limit,
+            planner=planner, incremental=incremental, desc_pipeline=desc_pipeline,
+            desc_handoff=desc_handoff, desc_tabs=desc_tabs,
+            desc_browser_workers=desc_browser_workers
             )
         remote_jobs = remote_jobs.with_columns(
             pl.lit('remote').alias('remote_or_lab'),
@@ -44,13 +57,16 @@ def run_higher_ed_module(search_remote_jobs_page=True, search_lab_jobs_page=True
     
     # Get lab & research jobs (mostly in-person)
     if search_lab_jobs_page:
-        BASE_URL = 'https://www.higheredjobs.com/admin/search.cfm?JobCat=150&CatName=Laboratory%20and%20Research'
+        BASE_URL = LAB_BASE_URL
         OUTPUT_FILE='./scrappy_RA/data_saved_locally/higher_ed/higher_ed_lab_jobs.csv'
         SEARCH_KW = profile['SEARCH_KW_HIGHERED_LAB']
 
         lab_jobs = higher_ed_scraper.search_higher_ed_category(
             BASE_URL, SEARCH_KW, OUTPUT_FILE, EXCLUSION_ROLE_KW,
-            fetch_desc=fetch_desc, ai_enrich=ai_enrich, desc_limit=desc_limit
+            fetch_desc=fetch_desc, ai_enrich=ai_enrich, desc_limit=desc_limit,
+            planner=planner, incremental=incremental, desc_pipeline=desc_pipeline,
+            desc_handoff=desc_handoff, desc_tabs=desc_tabs,
+            desc_browser_workers=desc_browser_workers
             )
         lab_jobs = lab_jobs.with_columns(
             pl.lit('lab').alias('remote_or_lab'),
@@ -5,7 +5,7 @@ import re
 import random
 from typing import Callable, List, Dict
 from urllib.parse import urljoin
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import polars as pl
 from scrappy_RA.scrapers.scraper import Scraper
 
@@ -13,10 +13,38 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from scrappy_RA.utils import selenium_utils
+from scrappy_RA.utils import selenium_utils, gen_utils, query_planner
 
 
 class HigherEdScraper(Scraper):
+    # Incremental crawls track jobs by these columns
+    id_col = 'job_code'
+    date_col = 'posted_date'
+
+    # Only build the job record rows and the next-page link
+    parser_backend = "lxml"
+    restrict_parse = True
+    result_strainer = gen_utils.AnyOfStrainer(
+        SoupStrainer('div', class_=re.compile(r'\brecord\b')),
+        SoupStrainer('a', rel='next')
+    )
+
+    # Read result rows in the browser (see Scraper.extract_page); the fields
+    # are what parse_page reads from each record
+    browser_extract = True
+    extract_spec = {
+        'row': "div[class='row record']",
+        'fields': {
+            'title': {'sel': ['div.col-sm-7', 'a']},
+            'href': {'sel': ['div.col-sm-7', 'a'], 'kind': 'attr:href'},
+            'left_parts': {'sel': 'div.col-sm-7', 'kind': 'children'},
+            'salary': {'sel': ['div.col-sm-7', 'span.job-salary']},
+            'right_parts': {'sel': 'div.col-sm-5', 'kind': 'lines'},
+            'marker': {'sel': 'span.addon-marker', 'kind': 'raw_text'},
+        },
+        'next': "a[rel~='next']",
+    }
+
     # Set HigherEd-specific defaults
     def __init__(
         self,
@@ -66,21 +94,28 @@ class HigherEdScraper(Scraper):
         return False
     '''
     
-    def get_soup(self, url: str) -> BeautifulSoup:
-        """Fetch page using selenium-based soup fetcher."""
+    def _selenium_kwargs(self) -> Dict:
+        """Page-load options shared by fetch_html and load_page."""
+        return dict(
+            wait_selectors=self.wait_selectors,
+            wait_time=self.wait_time,
+            enable_scroll=False,
+            save_debug_html=self.save_debug_html
+            )
+
+    def fetch_html(self, url: str) -> str:
+        """Fetch page HTML using selenium."""
         # self._ensure_driver()
         
         print(url)
         
-        soup = selenium_utils.get_soup_selenium(
-            self.driver,
-            url,
-            self.wait_selectors,
-            self.wait_time,
-            self.sleep_time,
-            self.save_debug_html
-            )
-        return soup
+        html = selenium_utils.get_html_selenium(driver=self.driver, url=url, **self._selenium_kwargs())
+        return html
+
+    def load_page(self, url: str) -> bool:
+        """Load a page in the browser for extract_page; False if it didn't load."""
+        print(url)
+        return selenium_utils.load_page_selenium(driver=self.driver, url=url, **self._selenium_kwargs())
         
     def parse_page(self, soup: BeautifulSoup) -> List[Dict]:
         """
@@ -197,23 +232,84 @@ class HigherEdScraper(Scraper):
                 continue
                                         
         return jobs_on_page
+
+    def jobs_from_rows(self, rows: List[Dict]) -> List[Dict]:
+        """
+        Build job records from rows extracted with extract_spec, the same way
+        parse_page does from the soup.
+        """
+        print(f"Found {len(rows)} jobs on this page")
+
+        jobs_on_page = []
+        for row in rows:
+            job_data = {
+                'title': row['title'] or '',
+                'url': '',
+                'job_code': '',
+                'organization': '',
+                'location': '',
+                'salary': row['salary'] or '',
+                'category': '',
+                'posted_date': '',
+                'priority': 'Yes' if row['marker'] and 'Priority' in row['marker'] else 'No'
+            }
+
+            href = row['href'] or ''
+            if href:
+                job_code_match = re.search(r'JobCode=(\d+)', href)
+                if job_code_match:
+                    job_data['job_code'] = job_code_match.group(1)
+                job_data['url'] = urljoin(self.base_url, href)
+
+            # Left column after the title: [organization, location, salary]
+            text_parts = (row['left_parts'] or [])[1:]
+            if len(text_parts) >= 1:
+                job_data['organization'] = text_parts[0]
+            if len(text_parts) >= 2:
+                job_data['location'] = text_parts[1]
+
+            # Right column: [category, "Posted MM/DD/YYYY"]
+            parts = row['right_parts'] or []
+            if parts:
+                job_data['category'] = parts[0]
+            for part in parts:
+                if 'Posted' in part:
+                    job_data['posted_date'] = part.replace('Posted', '').strip()
+                    break
+
+            if job_data['title'] or job_data['job_code']:
+                jobs_on_page.append(job_data)
+            else:
+                print("Warning: Skipping job record with no title or job code")
+
+        return jobs_on_page
         
         
 def search_higher_ed_category(base_url, search_kw, output_file, exclusion_role_kw,
-                              fetch_desc=False, ai_enrich=False, desc_limit=None):
+                              fetch_desc=False, ai_enrich=False, desc_limit=None,
+                              planner=None, incremental=False, pool_size=3, desc_pipeline=False,
+                              desc_handoff=True, desc_tabs=1, desc_browser_workers=1):
     all_jobs_df_list = []
-    driver = selenium_utils.setup_driver()
+    planner = planner or query_planner.QueryPlanner()
 
-    # Loop through the dictionary items (kw_idx, keywords)
-    for kw_idx, keywords in search_kw.items():
+    def search_group(driver, group):
+        kw_idx, keywords = group
         print(f"Search #{kw_idx} - {keywords}...")
         
-        higher_ed_scraper = HigherEdScraper(base_url=base_url, search_kw=keywords, driver=driver)
-        jobs_df_i = higher_ed_scraper.scrape()
-        
-        # with HigherEdScraper(base_url=base_url, search_kw=keywords, driver=driver) as higher_ed_scraper:
-        #     jobs_df_i = higher_ed_scraper.scrape()
-        
+        # Identical searches already run this session are reused, not repeated.
+        # Result pages are read in the browser (browser_extract), so there is
+        # no HTML to pipeline; desc_pipeline applies to the description fetch.
+        higher_ed_scraper = HigherEdScraper(base_url=base_url, search_kw=keywords, driver=driver,
+                                            incremental=incremental)
+        return planner.run(base_url, keywords, higher_ed_scraper.scrape)
+
+    # Fan the keyword groups out across the run's shared browsers (warmed up
+    # for the site once each)
+    groups = list(search_kw.items())
+    jobs_dfs = selenium_utils.get_browser_manager().map(search_group, groups, workers=pool_size, warm_url=base_url)
+
+    # Loop through the results in keyword-group order (kw_idx, keywords)
+    for (kw_idx, keywords), jobs_df_i in zip(groups, jobs_dfs):
         if jobs_df_i is not None and not jobs_df_i.is_empty():
             jobs_df_i = jobs_df_i.with_columns(
                 pl.lit(str(kw_idx)).alias('kw_idx'),
@@ -223,14 +319,6 @@ def search_higher_ed_category(base_url, search_kw, output_file, exclusion_role_k
             all_jobs_df_list.append(jobs_df_i)
 
     all_jobs = pl.concat(all_jobs_df_list)
-    
-    if driver:
-        try:
-            driver.quit()
-            driver = None
-            print("✓ Browser closed")
-        except Exception as e:
-            print(f"Warning: Error closing driver - {e}")
             
     all_jobs.write_csv("test.csv")
 
@@ -267,7 +355,8 @@ def search_higher_ed_category(base_url, search_kw, output_file, exclusion_role_k
     # Cached by job_code, so re-runs only fetch new postings.
     if fetch_desc:
         from scrappy_RA.scrapers.higher_ed.fetch_descriptions import fetch_job_descriptions
-        jobs = fetch_job_descriptions(jobs, ai_enrich=ai_enrich, desc_limit=desc_limit)
+        jobs = fetch_job_descriptions(jobs, ai_enrich=ai_enrich, desc_limit=desc_limit, pipeline=desc_pipeline,
+                                      handoff=desc_handoff, tabs=desc_tabs, browser_workers=desc_browser_workers)
 
     # Save to CSV (already sorted in the ranking order above).
     try:
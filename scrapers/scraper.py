@@ -1,15 +1,96 @@
 
 
+import os
 import time
-import random
-from typing import Callable, List, Dict, Union
+import atexit
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Iterator, List, Dict, Optional, Tuple, Union
 
 from urllib.parse import urlencode, urlparse, urlunparse, parse_qs, urljoin
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import polars as pl
 
+from scrappy_RA.utils import crawl_state, gen_utils, rate_limiter
+
+
+# One semaphore per host, shared by every Scraper instance in the process, so
+# concurrent prefetches against the same site never exceed the per-host cap.
+_HOST_SEMAPHORES: Dict[str, threading.BoundedSemaphore] = {}
+_HOST_SEMAPHORES_LOCK = threading.Lock()
+
+
+def host_semaphore(url: str, limit: int) -> threading.BoundedSemaphore:
+    """Return the shared semaphore capping concurrent requests to url's host."""
+    host = urlparse(url).netloc
+    with _HOST_SEMAPHORES_LOCK:
+        if host not in _HOST_SEMAPHORES:
+            _HOST_SEMAPHORES[host] = threading.BoundedSemaphore(limit)
+        return _HOST_SEMAPHORES[host]
+
+
+# Process pool of parsers shared by every pipelined Scraper, started on first
+# use so that per-keyword scrapers don't each pay for process start-up.
+_PARSE_POOL: Optional[ProcessPoolExecutor] = None
+_PARSE_POOL_LOCK = threading.Lock()
+
+
+def get_parse_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """Return the shared parser process pool (default: one worker per CPU)."""
+    global _PARSE_POOL
+    with _PARSE_POOL_LOCK:
+        if _PARSE_POOL is None:
+            _PARSE_POOL = ProcessPoolExecutor(max_workers=max_workers or os.cpu_count())
+            atexit.register(_PARSE_POOL.shutdown)
+        return _PARSE_POOL
+
+
+def _parse_html(scraper: "Scraper", html) -> Tuple[List[Dict], float]:
+    """Parse-pool worker: parse one page's HTML with a driver-less copy of the scraper."""
+    start = time.perf_counter()
+    jobs = scraper.parse_page(scraper.make_soup(html))
+    return jobs, time.perf_counter() - start
+
+
 class Scraper:
+    # Only scrapers whose get_soup is safe to call from several threads at once
+    # (i.e. requests-based, no shared Selenium driver) may prefetch pages.
+    supports_prefetch = False
+
+    # BeautifulSoup backend and, with restrict_parse, a SoupStrainer limiting
+    # the tree to what parse_page/has_next_page read. Subclasses set their
+    # own defaults; either can be overridden per instance.
+    parser_backend = "html.parser"
+    restrict_parse = False
+    result_strainer: Optional[SoupStrainer] = None
+
+    # What the pipelined loop parses in-process to run has_next_page while the
+    # full parse happens in the parse pool.
+    pager_strainer = SoupStrainer('a')
+
+    # Columns identifying a job and its posted date; scrapers that set both
+    # can crawl incrementally (see crawl_state).
+    id_col: Optional[str] = None
+    date_col: Optional[str] = None
+
+    # Selenium scrapers that declare an extract_spec (see
+    # selenium_utils.extract_rows) can, with browser_extract, pull each page's
+    # rows out in the browser with one script call instead of serializing the
+    # page and parsing it here. jobs_from_rows turns those rows into the same
+    # records parse_page returns; parse_page stays the fallback.
+    extract_spec: Optional[Dict] = None
+    browser_extract = False
+
+    # Selenium scrapers whose results arrive in XHR responses can, with
+    # capture_network, read them from the browser's network log instead
+    # (capture_results); the page-reading paths are the fallback.
+    capture_network = False
+
+    # Live resources and collected results, left behind when the scraper is
+    # pickled over to a parse worker.
+    _unpicklable_attrs = ('driver', 'semaphore', 'rate_limiter', 'jobs_from_search', 'crawl_state')
+
     def __init__(
         self,
         base_url: str,
@@ -18,7 +99,18 @@ class Scraper:
         kw_param_nm: str="keyword",
         sleep_time: list = [1.5, 3],
         out_cols: List[str] = ['title'],
-        out_df_schema: dict={'title': pl.Utf8}
+        out_df_schema: dict={'title': pl.Utf8},
+        prefetch: bool=False,
+        max_workers: int=4,
+        per_host_limit: int=2,
+        parser_backend: Optional[str]=None,
+        restrict_parse: Optional[bool]=None,
+        pipeline: bool=False,
+        parse_workers: Optional[int]=None,
+        incremental: bool=False,
+        full_crawl_days: int=7,
+        browser_extract: Optional[bool]=None,
+        capture_network: Optional[bool]=None
         ):
         
         self.base_url = base_url
@@ -26,9 +118,34 @@ class Scraper:
         self.kw_join = kw_join
         self.kw_param_nm = kw_param_nm
         self.sleep_time = sleep_time
-        self.jobs_from_search: List[Dict] = []
+        # Pages are paced by the host's shared adaptive limiter (applied in the
+        # fetch helpers); sleep_time only seeds its starting rate.
+        self.rate_limiter = rate_limiter.get_limiter(base_url, rate=rate_limiter.rate_from_sleep_time(sleep_time))
         self.out_cols = out_cols
         self.out_df_schema = out_df_schema
+        self.jobs_from_search = gen_utils.ColumnAccumulator(out_cols, out_df_schema)
+        self.prefetch = prefetch
+        self.max_workers = max_workers
+        self.per_host_limit = per_host_limit
+        if parser_backend is not None:
+            self.parser_backend = parser_backend
+        if restrict_parse is not None:
+            self.restrict_parse = restrict_parse
+        self.pipeline = pipeline
+        self.parse_workers = parse_workers
+        self.incremental = incremental
+        self.full_crawl_days = full_crawl_days
+        self.crawl_state: Optional[crawl_state.CrawlState] = None
+        if browser_extract is not None:
+            self.browser_extract = browser_extract
+        if capture_network is not None:
+            self.capture_network = capture_network
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for attr in self._unpicklable_attrs:
+            state.pop(attr, None)
+        return state
 
     
     def build_search_url(self) -> str:
@@ -58,13 +175,44 @@ class Scraper:
         ))
 
         return url
+
+    def build_page_url(self, page: int) -> str:
+        """Search URL for a 0-indexed results page (page 0 has no page param)."""
+        url = self.build_search_url()
+        if not page == 0:
+            url = f"{url}&page={page}"
+        return url
     
-    def get_soup(self, url: str) -> BeautifulSoup:
+    @property
+    def parse_only(self) -> Optional[SoupStrainer]:
+        """The SoupStrainer to parse with, or None for a full parse."""
+        return self.result_strainer if self.restrict_parse else None
+
+    def make_soup(self, markup) -> BeautifulSoup:
+        """Parse fetched HTML with this scraper's backend and strainer."""
+        return gen_utils.make_soup(markup, self.parser_backend, self.parse_only)
+
+    def fetch_html(self, url: str) -> Optional[Union[str, bytes]]:
         """
-        Fetch a page and return BeautifulSoup object using either requests or selenium.
+        Fetch a page's raw HTML using either requests or selenium (None on failure).
         To be implemented in subclasses.
         """
-        raise NotImplementedError("Subclasses must implement get_soup")
+        raise NotImplementedError("Subclasses must implement fetch_html")
+
+    def load_page(self, url: str) -> bool:
+        """
+        Load a page in the scraper's browser without reading it back, for
+        browser extraction (False on failure). To be implemented in Selenium
+        subclasses that set extract_spec.
+        """
+        raise NotImplementedError("Subclasses must implement load_page")
+
+    def get_soup(self, url: str) -> BeautifulSoup:
+        """Fetch a page and return BeautifulSoup object. Can be overridden."""
+        html = self.fetch_html(url)
+        if html is None:
+            return None
+        return self.make_soup(html)
 
     def parse_page(self, soup: BeautifulSoup) -> List[Dict]:
         """
@@ -72,14 +220,160 @@ class Scraper:
         """
         raise NotImplementedError("Subclasses must implement parse_page")
 
+    def capture_results(self, url: str) -> Optional[List[Dict]]:
+        """
+        All of a search's jobs, read from the network responses that deliver
+        them, or None if nothing could be captured. To be implemented in
+        subclasses that set capture_network.
+        """
+        raise NotImplementedError("Subclasses must implement capture_results")
+
+    def jobs_from_rows(self, rows: List[Dict]) -> List[Dict]:
+        """
+        Turn rows extracted in the browser with extract_spec into the records
+        parse_page would return for the same page. To be implemented in
+        subclasses that set extract_spec.
+        """
+        raise NotImplementedError("Subclasses must implement jobs_from_rows")
+
+    def extract_page(self) -> Tuple[List[Dict], bool]:
+        """
+        Jobs on the loaded page and whether there is a next one, extracted in
+        the browser. Falls back to parse_page on the page source if the script
+        fails or finds no rows.
+        """
+        from scrappy_RA.utils import selenium_utils
+
+        extracted = selenium_utils.extract_rows(self.driver, self.extract_spec)
+        if extracted and extracted['rows']:
+            return self.jobs_from_rows(extracted['rows']), extracted['has_next']
+
+        print("No rows extracted in the browser; parsing page source.", end=" ")
+        soup = self.make_soup(self.driver.page_source)
+        return self.parse_page(soup), self.has_next_page(soup)
+
+    def parse_page_cached(self, url: str, soup: BeautifulSoup, parse: Callable = None) -> List[Dict]:
+        """
+        parse_page, short-circuited when `url` came back 304 Not Modified from
+        the HTTP cache and this scraper already saved a parse result for it.
+        Fresh parse results are saved back to the cache entry, if there is one.
+        """
+        parse = parse or self.parse_page
+        cache = gen_utils.get_http_cache()
+        key = parse.__qualname__  # e.g. 'UMichScraper.parse_page'
+
+        jobs = cache.load_parsed(url, key)
+        if jobs is not None:
+            print(f"{len(jobs)} results (cached)", end="    ")
+            return jobs
+
+        start = time.perf_counter()
+        jobs = parse(soup)
+        cache.store_parsed(url, key, jobs, time.perf_counter() - start)
+        return jobs
+
     def scrape(self) -> pl.DataFrame:
-        """Main scraping loop with pagination."""
-        page = 0
+        """
+        Main scraping loop with pagination. Collects iter_pages() into a
+        DataFrame. With `incremental`, stops at the first page of jobs that are
+        all known and older than the last crawl's watermark, and fills in the
+        rest from the stored results.
+        """
+        self.start_crawl()
+        stopped_early = False
+        for jobs_on_page in self.iter_pages():
+            self.jobs_from_search.extend(jobs_on_page)
+            if self.crawl_state and self.crawl_state.page_is_known(jobs_on_page):
+                print("Only known jobs older than the last crawl. Stopping.")
+                stopped_early = True
+                break
+        return self.finish_crawl(stopped_early)
+
+    def start_crawl(self) -> None:
+        """Load this query's crawl state if crawling incrementally."""
+        if not self.incremental:
+            return
+        if not (self.id_col and self.date_col):
+            print(f"{type(self).__name__} has no id_col/date_col; crawling fully.")
+            return
+        self.crawl_state = crawl_state.CrawlState(
+            self.build_search_url(), self.id_col, self.date_col, self.full_crawl_days
+        )
+        if self.crawl_state.full_crawl_due:
+            print("Full crawl (no recent full crawl on record)")
+        else:
+            print(f"Incremental crawl: {len(self.crawl_state.seen_ids)} known jobs, "
+                  f"watermark {self.crawl_state.watermark}")
+
+    def finish_crawl(self, stopped_early: bool) -> pl.DataFrame:
+        """Build the DataFrame and, when crawling incrementally, merge and save the crawl state."""
+        df = self.to_dataframe()
+        if self.crawl_state is None:
+            return df
+        if stopped_early:
+            df = self.crawl_state.merge(df)
+        self.crawl_state.save(df, full_crawl=not stopped_early)
+        return df
+
+    def stops_early(self) -> bool:
+        """True if this crawl may stop at a known page (so pages shouldn't be fetched ahead)."""
+        return self.crawl_state is not None and not self.crawl_state.full_crawl_due
 
+    def iter_pages(self) -> Iterator[List[Dict]]:
+        """
+        Yield each page's parsed jobs as soon as that page is parsed, in page
+        order. Nothing is accumulated on the scraper, so consumers can process
+        a long crawl incrementally. Pages aren't prefetched when an incremental
+        crawl may stop early. Browser extraction, when enabled, takes the place
+        of prefetching and pipelining (there is no HTML to parse), and network
+        capture, which returns every page's jobs at once, takes precedence
+        over both when it captures anything.
+        """
+        if self.capture_network and getattr(self, 'driver', None) is not None:
+            print("Capturing results from the network", end=" ")
+            jobs = self.capture_results(self.build_page_url(0))
+            if jobs is not None:
+                if jobs:
+                    yield jobs
+                else:
+                    print("No jobs found. Stopping.")
+                return
+            print("Nothing captured; reading the page instead.")
+        if self.browser_extract:
+            if self.extract_spec and getattr(self, 'driver', None) is not None:
+                yield from self._iter_pages_extracted()
+                return
+            print(f"{type(self).__name__} cannot extract in the browser; parsing page source.")
+        if self.prefetch and not self.stops_early():
+            if self.supports_prefetch:
+                yield from self._iter_pages_prefetch()
+                return
+            print(f"{type(self).__name__} does not support prefetch; scraping serially.")
+        if self.pipeline:
+            yield from self._iter_pages_pipelined()
+            return
+        yield from self._iter_pages_serial()
+
+    def iter_jobs(self, unique_on: Optional[str] = None) -> Iterator[Dict]:
+        """
+        Yield jobs one at a time from iter_pages(). With `unique_on` (e.g.
+        'job_id'), jobs whose value in that column was already yielded are
+        skipped, so the stream arrives de-duplicated.
+        """
+        seen = set()
+        for jobs_on_page in self.iter_pages():
+            for job in jobs_on_page:
+                if unique_on:
+                    key = job.get(unique_on)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                yield job
+
+    def _iter_pages_serial(self, page: int = 0) -> Iterator[List[Dict]]:
+        """Fetch pages one at a time, following has_next_page, starting at `page`."""
         while True:
-            url = self.build_search_url()
-            if not page == 0:
-                url = f"{url}&page={page}"
+            url = self.build_page_url(page)
             print(f"Fetching page {page + 1}", end=" ")
             
             soup = self.get_soup(url)
@@ -87,12 +381,12 @@ class Scraper:
                 print("Failed to fetch page. Stopping.")
                 break
 
-            jobs_on_page = self.parse_page(soup)
+            jobs_on_page = self.parse_page_cached(url, soup)
             if not jobs_on_page:
                 print("No jobs found. Stopping.")
                 break
             
-            self.jobs_from_search.extend(jobs_on_page)
+            yield jobs_on_page
 
             # Pagination
             if not self.has_next_page(soup):
@@ -100,9 +394,157 @@ class Scraper:
                 break
 
             page += 1
-            time.sleep(random.uniform(self.sleep_time[0], self.sleep_time[1]))
-            
-        return self.to_dataframe()
+
+    def _iter_pages_extracted(self) -> Iterator[List[Dict]]:
+        """Like the serial loop, but each page is read with extract_page."""
+        page = 0
+        while True:
+            url = self.build_page_url(page)
+            print(f"Fetching page {page + 1}", end=" ")
+            if not self.load_page(url):
+                print("Failed to fetch page. Stopping.")
+                break
+
+            jobs_on_page, has_next = self.extract_page()
+            if not jobs_on_page:
+                print("No jobs found. Stopping.")
+                break
+
+            yield jobs_on_page
+
+            if not has_next:
+                print("Reached last page.")
+                break
+
+            page += 1
+
+    def _iter_pages_pipelined(self) -> Iterator[List[Dict]]:
+        """
+        Like the serial loop, but each page's HTML is handed to the parse pool
+        and the next page is fetched while it parses. Only the pager links are
+        parsed here, to decide whether there is a next page. Pages are yielded
+        in order.
+        """
+        pool = get_parse_pool(self.parse_workers)
+        page = 0
+        url = self.build_page_url(page)
+        print(f"Fetching page {page + 1}", end=" ")
+        html = self.fetch_html(url)
+        if html is None:
+            print("Failed to fetch page. Stopping.")
+            return
+
+        while True:
+            pending = self._submit_parse(pool, url, html)
+            has_next = self.has_next_page(gen_utils.make_soup(html, self.parser_backend, self.pager_strainer))
+
+            # Fetch the next page while this one parses
+            if has_next:
+                page += 1
+                next_url = self.build_page_url(page)
+                print(f"Fetching page {page + 1}", end=" ")
+                next_html = self.fetch_html(next_url)
+
+            jobs_on_page = self._collect_parse(url, pending)
+            if not jobs_on_page:
+                print("No jobs found. Stopping.")
+                break
+            yield jobs_on_page
+
+            if not has_next:
+                print("Reached last page.")
+                break
+            if next_html is None:
+                print("Failed to fetch page. Stopping.")
+                break
+            url, html = next_url, next_html
+
+    def _submit_parse(self, pool: ProcessPoolExecutor, url: str, html) -> Future:
+        """Start parsing `html` in `pool`, or resolve at once from the HTTP cache on a 304."""
+        jobs = gen_utils.get_http_cache().load_parsed(url, self.parse_page.__qualname__)
+        if jobs is not None:
+            print(f"{len(jobs)} results (cached)", end="    ")
+            done = Future()
+            done.set_result((jobs, None))
+            return done
+        return pool.submit(_parse_html, self, html)
+
+    def _collect_parse(self, url: str, pending: Future) -> List[Dict]:
+        """Wait for a _submit_parse result and save fresh ones to the HTTP cache."""
+        jobs, parse_seconds = pending.result()
+        if parse_seconds is not None:
+            gen_utils.get_http_cache().store_parsed(url, self.parse_page.__qualname__, jobs, parse_seconds)
+        return jobs
+
+    def _iter_pages_prefetch(self) -> Iterator[List[Dict]]:
+        """
+        Fetch page 1 serially to learn the last page from its pager, then fetch
+        the remaining pages through a bounded worker pool. Concurrency against
+        each host is capped by a shared semaphore (`per_host_limit`) and request
+        starts by the host's rate limiter. Falls back to the serial loop if the
+        pager can't be read.
+        """
+        print("Fetching page 1", end=" ")
+        url = self.build_page_url(0)
+        soup = self.get_soup(url)
+        if soup is None:
+            print("Failed to fetch page. Stopping.")
+            return
+
+        jobs_on_page = self.parse_page_cached(url, soup)
+        if not jobs_on_page:
+            print("No jobs found. Stopping.")
+            return
+        yield jobs_on_page
+
+        if not self.has_next_page(soup):
+            return
+
+        last_page = self.get_last_page(soup)
+        if last_page is None:
+            print("\nCould not read last page from pager; continuing serially.")
+            yield from self._iter_pages_serial(page=1)
+            return
+
+        pages = list(range(1, last_page + 1))
+        parsers = get_parse_pool(self.parse_workers) if self.pipeline else None
+        print(f"\nPrefetching pages 2-{last_page + 1} "
+              f"({self.max_workers} workers, {self.per_host_limit} per host)")
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            # map() yields in submission order, so results stay in page order
+            fetch_and_parse = lambda page: self._fetch_and_parse(page, parsers)
+            for page, jobs_on_page in zip(pages, pool.map(fetch_and_parse, pages)):
+                if not jobs_on_page:
+                    print(f"No jobs on page {page + 1}. Stopping.")
+                    break
+                yield jobs_on_page
+
+    def _fetch_and_parse(self, page: int, parsers: Optional[ProcessPoolExecutor] = None) -> Optional[List[Dict]]:
+        """
+        Fetch one page while holding the host's concurrency slot, then parse it
+        here or, with `parsers`, in the parse pool.
+        """
+        url = self.build_page_url(page)
+        with host_semaphore(url, self.per_host_limit):
+            html = self.fetch_html(url)
+        if html is None:
+            print(f"Failed to fetch page {page + 1}.")
+            return None
+        if parsers is not None:
+            return self._collect_parse(url, self._submit_parse(parsers, url, html))
+        return self.parse_page_cached(url, self.make_soup(html))
+
+    def get_last_page(self, soup: BeautifulSoup) -> Optional[int]:
+        """
+        Return the 0-indexed last page number from the pager, or None if it
+        can't be determined. Reads the largest `page=` value linked from the
+        page (e.g. a Drupal pager's "Last" link). Can be overridden.
+        """
+        pages = []
+        for link in soup.find_all('a', href=True):
+            values = parse_qs(urlparse(link['href']).query).get('page', [])
+            pages.extend(int(v) for v in values if v.isdigit())
+        return max(pages) if pages else None
 
     def has_next_page(self, soup: BeautifulSoup) -> bool:
         """Determine if there's a next page. Can be overridden."""
@@ -124,16 +566,10 @@ class Scraper:
         """Convert collected jobs to Polars DataFrame."""
         # print(f"Returning {len(self.jobs_from_search)} results")
         
-        if not self.jobs_from_search:
+        df = self.jobs_from_search.to_frame()
+        if df.is_empty():
             print("Returning empty data frame\n")
-            df = pl.DataFrame(schema=self.out_df_schema)
-        
         else:
-            # print(f"Converting jobs to Polars DataFrame...")
-            df = pl.DataFrame(self.jobs_from_search)
-            # Reorder columns for consistency -- Only select columns that exist in the dataframe
-            existing_cols = [col for col in self.out_cols if col in df.columns]
-            df = df.select(existing_cols)
             print(f"✓ Successful -- DataFrame shape: {df.shape}\n")
 
         return df
@@ -1,16 +1,20 @@
 
 
-import os
 from pathlib import Path
-import yaml
 import polars as pl
 
-from .umich_scraper import search_umich
+from .umich_scraper import BASE_URL, search_umich, search_umich_async
+from scrappy_RA.utils import gen_utils, query_planner
 
 BASE_DIR = Path(__file__).resolve().parent     # __file__ is a built-in variable, points to your .py file
 
 
-def run_umich_module():
+def plan_umich_module(planner):
+    """Register the searches run_umich_module will issue with `planner`."""
+    planner.add('UMich', BASE_URL, planner.profile['SEARCH_KW_INDIVIDUAL'])
+
+
+def run_umich_module(use_async=True, planner=None):
 
     # UMICH_DF_SCHEMA = {
     #     'title': pl.Utf8,
@@ -22,16 +26,19 @@ def run_umich_module():
     #     'job_id': pl.Utf8
     #     }
 
-    # Get keywords from profile YAML
-    yaml_path = BASE_DIR / ".." / ".." / "profiles" / "profile1.yaml"
-    print(f"Profiles available: {os.listdir(yaml_path.parent)}")
-    with open(yaml_path, "r") as f:
-        profile = yaml.safe_load(f)
+    # Get keywords from the profile YAML (read once per run by the planner)
+    planner = planner or query_planner.QueryPlanner()
+    profile = planner.profile
     EXCLUSION_ROLE_KW = profile['EXCLUSION_ROLE_KW']
     SEARCH_KW = profile['SEARCH_KW_INDIVIDUAL']
     OUTPUT_FILE='./scrappy_RA/data_to_unify/umich_jobs.csv'
 
-    umich_jobs = search_umich(SEARCH_KW, EXCLUSION_ROLE_KW, OUTPUT_FILE)
+    # The async driver runs all keyword searches at once; output is identical
+    if use_async:
+        umich_jobs = search_umich_async(SEARCH_KW, EXCLUSION_ROLE_KW, OUTPUT_FILE, planner=planner)
+    else:
+        umich_jobs = search_umich(SEARCH_KW, EXCLUSION_ROLE_KW, OUTPUT_FILE, planner=planner)
+    gen_utils.get_http_cache().report()
 
     # Save a backup copy as well
     umich_jobs.write_csv("umich_jobs.csv")
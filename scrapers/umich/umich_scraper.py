@@ -1,15 +1,18 @@
 
 
+import re
 import time
-from typing import Callable, List, Dict
+import asyncio
+from typing import Callable, List, Dict, Tuple
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from urllib.parse import urljoin
 import polars as pl
 
-from scrappy_RA.utils import gen_utils
+from scrappy_RA.utils import gen_utils, query_planner
 from scrappy_RA.scrapers.scraper import Scraper
+from scrappy_RA.scrapers.async_scraper import AsyncScraper
 
 # UMICH_DF_SCHEMA = {
 #     'title': pl.Utf8,
@@ -22,7 +25,26 @@ from scrappy_RA.scrapers.scraper import Scraper
 #     }
 
 
+BASE_URL = "https://careers.umich.edu/search-jobs?career_interest=All&work_location=All&field_job_modes_of_work_target_id=All&position=All&regular_temporary=All&job_id=&department=&title=&keyword="
+
+
 class UMichScraper(Scraper):
+    # Incremental crawls track jobs by these columns
+    id_col = 'job_id'
+    date_col = 'posting_date'
+
+    # requests-based, so pages can be fetched concurrently (see Scraper._iter_pages_prefetch)
+    supports_prefetch = True
+
+    # Only build the results table and the pager links
+    parser_backend = "lxml"
+    restrict_parse = True
+    result_strainer = gen_utils.AnyOfStrainer(
+        SoupStrainer('table', class_=re.compile(r'\bcols-5\b')),
+        SoupStrainer('a', href=re.compile(r'[?&]page=\d')),
+        SoupStrainer('a', rel='next')
+    )
+
     # Set UMich-specific defaults
     def __init__(self, **kwargs):
         
@@ -30,7 +52,7 @@ class UMichScraper(Scraper):
         # self.search_kw = search_kw
         
         super().__init__(
-            base_url="https://careers.umich.edu/search-jobs?career_interest=All&work_location=All&field_job_modes_of_work_target_id=All&position=All&regular_temporary=All&job_id=&department=&title=&keyword=",
+            base_url=BASE_URL,
             kw_param_nm="keyword",  # UMich-specific param name
             out_cols=['title', 'department', 'location', 'posting_date', 'employment_type', 'url', 'job_id'],
             out_df_schema={
@@ -45,14 +67,12 @@ class UMichScraper(Scraper):
             **kwargs
         )
     
-    def get_soup(self, url: str, headers=None) -> BeautifulSoup:
-        """Fetch page using requests-based soup fetcher."""
+    def fetch_html(self, url: str, headers=None) -> bytes:
+        """Fetch page HTML using requests over the shared pooled session."""
         if not headers:    
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'
-            }
+            headers = gen_utils.DEFAULT_HEADERS
         
-        return gen_utils.get_soup_requests(url, headers)
+        return gen_utils.get_html_requests(url, headers, session=gen_utils.get_session())
         
     def parse_page(self, soup: BeautifulSoup) -> List[Dict]:
         """Parse a single UMich job listings page into a list of job dicts."""
@@ -139,16 +159,58 @@ class UMichScraper(Scraper):
         return jobs_on_page
     
 
-def search_umich(search_kw, exclusion_role_kw, output_file):
-    all_jobs_df_list = []
+class AsyncUMichScraper(AsyncScraper, UMichScraper):
+    """UMichScraper whose get_soup/parse_page/scrape are awaitable."""
+    pass
+
+
+def search_umich(search_kw, exclusion_role_kw, output_file, prefetch=True, planner=None):
+    kw_results = []
+    planner = planner or query_planner.QueryPlanner()
 
     # Loop through the list of keywords (index corresponding to relevance)
+    for n, kw in enumerate(search_kw, 1):
+        print(f"Search #{n}, kw: {kw}...")
+        umich_scraper = UMichScraper(search_kw=[kw], prefetch=prefetch)
+        kw_results.append((kw, planner.run(BASE_URL, [kw], umich_scraper.scrape)))
+
+    return combine_umich_results(kw_results, exclusion_role_kw, output_file)
+
+
+def search_umich_async(search_kw, exclusion_role_kw, output_file, per_host_limit=4, planner=None):
+    """
+    Same output as search_umich, but every keyword search runs at once on an
+    event loop. All searches share one semaphore (at most `per_host_limit`
+    requests in flight to careers.umich.edu) and the host's rate limiter.
+    Keywords already searched this session (or repeated) are only searched once.
+    """
+    planner = planner or query_planner.QueryPlanner()
+
+    def search_all(keyword_sets):
+        async def run_all():
+            semaphore = asyncio.Semaphore(per_host_limit)
+            scrapers = [
+                AsyncUMichScraper(search_kw=list(kws), semaphore=semaphore)
+                for kws in keyword_sets
+            ]
+            print(f"Running {len(scrapers)} UMich searches concurrently ({per_host_limit} requests in flight)...")
+            return await asyncio.gather(*(scraper.scrape() for scraper in scrapers))
+        return asyncio.run(run_all())
+
+    jobs_dfs = planner.run_many(BASE_URL, [[kw] for kw in search_kw], search_all)
+    return combine_umich_results(list(zip(search_kw, jobs_dfs)), exclusion_role_kw, output_file)
+
+
+def combine_umich_results(kw_results: List[Tuple[str, pl.DataFrame]], exclusion_role_kw, output_file):
+    """
+    Tag each keyword's results with kw/kw_idx (in keyword order), merge
+    duplicate job_ids, drop excluded titles, and save to `output_file`.
+    """
+    all_jobs_df_list = []
+
+    # kw_idx only advances on keywords that returned results
     i = 1
-    for kw in search_kw:
-        print(f"Search #{i}, kw: {kw}...")
-        umich_scraper = UMichScraper(search_kw=[kw])
-        jobs_df_i = umich_scraper.scrape()
-        
+    for kw, jobs_df_i in kw_results:
         if jobs_df_i is not None and not jobs_df_i.is_empty():
             jobs_df_i = jobs_df_i.with_columns(
                 pl.lit(kw).alias('kw'),
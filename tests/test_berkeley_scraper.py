@@ -0,0 +1,57 @@
+"""
+Rows read from PeopleSoft's AJAX responses (selenium_utils.capture_ps_results)
+must parse to the same jobs as the rendered results page.
+
+berkeley_search_response.xml is the search postback for the rows shown in
+berkeley_results.html: each FIELD carries a fragment of the page's HTML.
+berkeley_extracted_rows.json is what extract_rows returns for that page with
+PS_EXTRACT_SPEC, which the shared selenium_utils.ps_jobs_from_rows (Berkeley
+and Idealist's jobs_from_rows) must turn into the same jobs.
+"""
+
+import json
+from pathlib import Path
+
+from scrappy_RA.scrapers.berkeley.berkeley_scraper import UCBerkeleyScraper
+from scrappy_RA.utils import selenium_utils
+
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+
+def test_captured_response_matches_dom_parse():
+    scraper = UCBerkeleyScraper(search_kw=["research"])
+    body = (FIXTURES / "berkeley_search_response.xml").read_text(encoding="utf-8")
+    page = (FIXTURES / "berkeley_results.html").read_text(encoding="utf-8")
+
+    captured = scraper.parse_page(scraper.make_soup(selenium_utils.ps_response_html(body)))
+    rendered = scraper.parse_page(scraper.make_soup(page))
+
+    assert len(rendered) == 3
+    assert rendered[2]["title"] == "Data Coordinator"
+    assert rendered[2]["job_id"] == "82955"  # from the title: the ID field is empty
+    assert rendered[1]["department"] == "Molecular & Cell Biology"
+    assert captured == rendered
+
+
+def test_jobs_from_rows_matches_parse_page():
+    scraper = UCBerkeleyScraper(search_kw=["research"])
+    page = (FIXTURES / "berkeley_results.html").read_text(encoding="utf-8")
+    rows = json.loads((FIXTURES / "berkeley_extracted_rows.json").read_text(encoding="utf-8"))
+
+    assert set(rows[0]) == set(selenium_utils.PS_EXTRACT_SPEC['fields'])
+    extracted = selenium_utils.ps_jobs_from_rows(rows, scraper.base_url)
+    assert extracted == scraper.parse_page(scraper.make_soup(page))
+    assert scraper.jobs_from_rows(rows) == extracted
+
+
+def test_response_html_and_count():
+    body = (FIXTURES / "berkeley_search_response.xml").read_text(encoding="utf-8")
+    html = selenium_utils.ps_response_html(body)
+
+    assert "<PAGE" not in html and "GENSCRIPT" not in html
+    assert selenium_utils.ps_result_count(html) == 3
+
+
+def test_non_peoplesoft_body_is_returned_as_is():
+    assert selenium_utils.ps_response_html("<ul><li>x</li></ul>") == "<ul><li>x</li></ul>"
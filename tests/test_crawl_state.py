@@ -0,0 +1,82 @@
+"""
+An incremental crawl (Scraper.scrape with incremental=True) fills in the
+results it didn't reach from the stored crawl state - CrawlState.merge runs
+in finish_crawl only when the crawl stopped early at a page of known jobs.
+"""
+
+import polars as pl
+
+from scrappy_RA.scrapers.scraper import Scraper
+from scrappy_RA.utils import crawl_state
+
+
+BASE_URL = "https://jobs.example.edu/search"
+SCHEMA = {'job_id': pl.Utf8, 'posted_date': pl.Utf8}
+
+
+class PagedScraper(Scraper):
+    """Yields canned pages instead of fetching them."""
+    id_col = 'job_id'
+    date_col = 'posted_date'
+
+    def __init__(self, pages, **kwargs):
+        super().__init__(base_url=BASE_URL, search_kw=["research"],
+                         out_cols=list(SCHEMA), out_df_schema=SCHEMA, **kwargs)
+        self.pages = pages
+
+    def iter_pages(self):
+        yield from self.pages
+
+
+def job(job_id, posted_date):
+    return {'job_id': job_id, 'posted_date': posted_date}
+
+
+FIRST_CRAWL = [
+    [job("a", "10/10/2026"), job("b", "10/05/2026")],
+    [job("c", "10/01/2026")],
+]
+
+
+def count_merges(monkeypatch):
+    calls = []
+    merge = crawl_state.CrawlState.merge
+
+    def counting_merge(self, fresh):
+        calls.append(fresh.height)
+        return merge(self, fresh)
+
+    monkeypatch.setattr(crawl_state.CrawlState, 'merge', counting_merge)
+    return calls
+
+
+def test_merge_only_when_stopped_early(tmp_path, monkeypatch):
+    monkeypatch.setattr(crawl_state, 'CRAWL_STATE_DIR', tmp_path)
+    merges = count_merges(monkeypatch)
+
+    # No state on record: a full crawl, nothing to merge
+    df = PagedScraper(FIRST_CRAWL, incremental=True).scrape()
+    assert df['job_id'].to_list() == ["a", "b", "c"]
+    assert merges == []
+
+    # Page 2 is all known and older than the watermark (10/10): stop there
+    # and take "c" from the stored rows
+    second_crawl = [
+        [job("new", "10/15/2026"), job("a", "10/10/2026")],
+        [job("b", "10/05/2026")],
+        [job("never-reached", "09/01/2026")],
+    ]
+    df = PagedScraper(second_crawl, incremental=True).scrape()
+    assert merges == [3]
+    assert df['job_id'].to_list() == ["new", "a", "b", "c"]
+
+
+def test_no_merge_without_incremental(tmp_path, monkeypatch):
+    monkeypatch.setattr(crawl_state, 'CRAWL_STATE_DIR', tmp_path)
+    merges = count_merges(monkeypatch)
+
+    PagedScraper(FIRST_CRAWL, incremental=True).scrape()
+    df = PagedScraper([[job("a", "10/10/2026")], [job("b", "10/05/2026")]]).scrape()
+
+    assert merges == []
+    assert df['job_id'].to_list() == ["a", "b"]
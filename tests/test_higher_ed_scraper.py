@@ -0,0 +1,47 @@
+"""
+HigherEdScraper.jobs_from_rows must build the same jobs from the rows the
+browser extracts (selenium_utils.extract_rows with extract_spec) as
+parse_page builds from the page source.
+
+higher_ed_extracted_rows.json is what extract_rows returns for
+higher_ed_results.html.
+"""
+
+import json
+from pathlib import Path
+
+from scrappy_RA.scrapers.higher_ed.higher_ed_scraper import HigherEdScraper
+
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+BASE_URL = "https://www.higheredjobs.com/search/remote.cfm"
+
+
+def make_scraper() -> HigherEdScraper:
+    return HigherEdScraper(base_url=BASE_URL, search_kw=["research"])
+
+
+def test_jobs_from_rows_matches_parse_page():
+    scraper = make_scraper()
+    html = (FIXTURES / "higher_ed_results.html").read_text(encoding="utf-8")
+    rows = json.loads((FIXTURES / "higher_ed_extracted_rows.json").read_text(encoding="utf-8"))
+
+    parsed = scraper.parse_page(scraper.make_soup(html))
+    extracted = scraper.jobs_from_rows(rows)
+
+    assert len(parsed) == 3
+    assert extracted == parsed
+
+
+def test_fixture_fields():
+    scraper = make_scraper()
+    html = (FIXTURES / "higher_ed_results.html").read_text(encoding="utf-8")
+    first, second, _ = scraper.parse_page(scraper.make_soup(html))
+
+    assert first["job_code"] == "178912345"
+    assert first["url"].startswith("https://www.higheredjobs.com/search/details.cfm?JobCode=178912345")
+    assert (first["organization"], first["location"]) == ("University of Example", "Remote")
+    assert first["posted_date"] == "10/14/2026"
+    assert first["priority"] == "Yes"
+    assert second["salary"] == ""
+    assert second["priority"] == "No"
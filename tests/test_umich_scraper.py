@@ -0,0 +1,36 @@
+"""
+UMichScraper parses with a SoupStrainer (result_strainer) that keeps only the
+results table and the pager links; that must not change what is parsed.
+"""
+
+from pathlib import Path
+
+from scrappy_RA.scrapers.umich.umich_scraper import UMichScraper
+
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+
+def test_strained_parse_matches_full_parse():
+    html = (FIXTURES / "umich_results.html").read_bytes()
+    strained = UMichScraper(search_kw=["research"])
+    full = UMichScraper(search_kw=["research"], restrict_parse=False)
+    assert strained.parse_only is not None and full.parse_only is None
+
+    strained_soup = strained.make_soup(html)
+    full_soup = full.make_soup(html)
+
+    jobs = strained.parse_page(strained_soup)
+    assert len(jobs) == 3
+    assert jobs[1]["title"] == "Data Analyst Senior & Reporting Lead"
+    assert jobs[2]["url"] == "https://careers.umich.edu/job_detail/264850/research-lab-technician"
+    assert jobs == full.parse_page(full_soup)
+    assert strained.has_next_page(strained_soup) is full.has_next_page(full_soup) is True
+
+
+def test_strainer_drops_the_rest_of_the_page():
+    html = (FIXTURES / "umich_results.html").read_bytes()
+    soup = UMichScraper(search_kw=["research"]).make_soup(html)
+
+    assert soup.find("table", class_="hours") is None
+    assert soup.find("a", href="/privacy") is None
@@ -0,0 +1,123 @@
+"""
+Benchmark the Selenium browser profiles (selenium_utils.BROWSER_PROFILES).
+
+For each profile: time a cold driver start, then load a local fixture page a
+few times and time driver.get -> results selector present. The fixture mimics
+a results page: the rows are rendered by script shortly after
+DOMContentLoaded, while a slow iframe holds up the load event - which is what
+the "normal" strategy waits for and "eager"/"none" don't.
+
+Run with:
+    python -m scrappy_RA.utils.browser_benchmark [profile ...]
+"""
+
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+from scrappy_RA.utils import selenium_utils
+
+
+RESULTS_SELECTOR = "div.row.record"
+SLOW_FRAME_SECONDS = 2.0
+N_PAGES = 5
+
+FIXTURE_HTML = """<!DOCTYPE html>
+<html><head><title>Fixture results</title></head>
+<body>
+<div id="results"></div>
+<iframe src="/slow-frame" width="1" height="1"></iframe>
+<script>
+  setTimeout(function () {
+    var html = "";
+    for (var i = 0; i < 25; i++) {
+      html += '<div class="row record"><div class="col-sm-7"><a href="/job?JobCode=' + i +
+              '">Research Assistant ' + i + '</a><br>Fixture University<br>Remote</div>' +
+              '<div class="col-sm-5">Research<br>Posted 10/01/2026</div></div>';
+    }
+    document.getElementById("results").innerHTML = html;
+  }, 200);
+</script>
+</body></html>
+"""
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.startswith("/slow-frame"):
+            time.sleep(SLOW_FRAME_SECONDS)
+            body = b"<html><body>slow</body></html>"
+        else:
+            body = FIXTURE_HTML.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_fixture_server() -> ThreadingHTTPServer:
+    """Serve the fixture page on a free localhost port, in a daemon thread."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def benchmark_profile(profile: str, url: str, n_pages: int = N_PAGES) -> Optional[Dict[str, float]]:
+    """Cold start and median time-to-results for one profile, or None if Chrome wouldn't start."""
+    start = time.perf_counter()
+    try:
+        driver = selenium_utils.setup_driver(profile)
+    except Exception as e:
+        print(f"✗ {profile}: could not start ({str(e).splitlines()[0]})")
+        return None
+    cold_start = time.perf_counter() - start
+
+    page_times: List[float] = []
+    try:
+        for i in range(n_pages):
+            start = time.perf_counter()
+            selenium_utils.navigate(driver, f"{url}?page={i}")
+            WebDriverWait(driver, 30).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, RESULTS_SELECTOR))
+            )
+            page_times.append(time.perf_counter() - start)
+    finally:
+        driver.quit()
+
+    return {"cold_start": cold_start, "median_page": statistics.median(page_times), "max_page": max(page_times)}
+
+
+def run_benchmark(profiles: Optional[List[str]] = None, n_pages: int = N_PAGES) -> Dict[str, Dict[str, float]]:
+    profiles = profiles or list(selenium_utils.BROWSER_PROFILES)
+    server = start_fixture_server()
+    url = f"http://127.0.0.1:{server.server_address[1]}/results"
+    print(f"Benchmarking {len(profiles)} browser profile(s) against {url}\n")
+
+    results = {}
+    try:
+        for profile in profiles:
+            timing = benchmark_profile(profile, url, n_pages)
+            if timing:
+                results[profile] = timing
+    finally:
+        server.shutdown()
+
+    print(f"\n{'profile':<10} {'cold start':>11} {'median page':>12} {'max page':>9}")
+    for profile, t in results.items():
+        print(f"{profile:<10} {t['cold_start']:>10.2f}s {t['median_page']:>11.2f}s {t['max_page']:>8.2f}s")
+    return results
+
+
+if __name__ == "__main__":
+    run_benchmark(sys.argv[1:] or None)
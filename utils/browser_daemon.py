@@ -0,0 +1,121 @@
+"""
+A long-lived local Chrome that runs attach to instead of launching their own.
+
+Starts `--browsers` Chrome processes, browser n listening for remote debugging
+on port + n with the persistent profile selenium_utils.slot_profile_dir(n), and
+keeps them up until interrupted. A run attaches to them with
+
+    selenium_utils.configure_browsers(USER_DATA_DIR, DEBUGGER_ADDRESS)
+
+(__main__ does this), DriverPool slot n going to browser n. Because the
+browsers outlive each run, the start-up cost and the first bot challenge are
+paid once rather than on every launch; drivers that find no browser on their
+port launch one as usual.
+
+Run with:
+    python -m scrappy_RA.utils.browser_daemon [--browsers 3] [--port 9222] [--headed]
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import time
+from typing import List, Optional
+
+from scrappy_RA.utils import selenium_utils
+
+
+CHROME_BINARIES = ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome")
+
+STARTUP_TIMEOUT = 20
+
+
+def find_chrome() -> Optional[str]:
+    """Path of the Chrome binary ($CHROME_BINARY, else the first one on PATH)."""
+    if os.environ.get("CHROME_BINARY"):
+        return os.environ["CHROME_BINARY"]
+    for name in CHROME_BINARIES:
+        path = shutil.which(name)
+        if path:
+            return path
+    return None
+
+
+def chrome_command(chrome: str, port: int, slot: int, profile: str, headless: Optional[bool]) -> List[str]:
+    profile_dir = selenium_utils.slot_profile_dir(selenium_utils.USER_DATA_DIR, slot)
+    profile_dir.mkdir(parents=True, exist_ok=True)
+    return [
+        chrome,
+        f"--remote-debugging-port={port}",
+        "--remote-debugging-address=127.0.0.1",
+        f"--user-data-dir={profile_dir}",
+        "--hide-crash-restore-bubble",
+        *selenium_utils.chrome_arguments(profile, headless),
+        "about:blank",
+    ]
+
+
+def start_browsers(n_browsers: int, port: int, profile: str, headless: Optional[bool]) -> List[subprocess.Popen]:
+    """Launch the browsers (skipping ports already answering) and wait until each answers."""
+    chrome = find_chrome()
+    if chrome is None:
+        print(f"✗ No Chrome binary found (tried $CHROME_BINARY and {', '.join(CHROME_BINARIES)})")
+        return []
+
+    processes = []
+    for slot in range(n_browsers):
+        address = f"127.0.0.1:{port + slot}"
+        if selenium_utils.debugger_reachable(address):
+            print(f"  ↺ {address} already has a browser; leaving it")
+            continue
+        process = subprocess.Popen(
+            chrome_command(chrome, port + slot, slot, profile, headless),
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        while not selenium_utils.debugger_reachable(address):
+            if process.poll() is not None or time.monotonic() > deadline:
+                print(f"✗ Browser for {address} did not start")
+                process.kill()
+                break
+            time.sleep(0.2)
+        else:
+            print(f"✓ Browser {slot} listening on {address}")
+            processes.append(process)
+    return processes
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--browsers", type=int, default=3, help="browsers to keep running (one per pool slot)")
+    parser.add_argument("--port", type=int, default=int(selenium_utils.DEBUGGER_ADDRESS.rsplit(":", 1)[1]))
+    parser.add_argument("--profile", default=selenium_utils.DEFAULT_BROWSER_PROFILE,
+                        choices=list(selenium_utils.BROWSER_PROFILES))
+    parser.add_argument("--headed", action="store_true", help="show the browser windows")
+    args = parser.parse_args(argv)
+
+    processes = start_browsers(args.browsers, args.port, args.profile, False if args.headed else None)
+    if not processes:
+        sys.exit(1)
+
+    print("Browser daemon running; Ctrl-C to stop.")
+    try:
+        while any(p.poll() is None for p in processes):
+            time.sleep(1)
+        print("⚠ All browsers exited.")
+    except KeyboardInterrupt:
+        print("\nStopping browsers...")
+    finally:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+
+if __name__ == "__main__":
+    main()
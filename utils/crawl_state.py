@@ -0,0 +1,127 @@
+"""
+Incremental crawl state ("watermarks").
+
+For each (site, query) - a query being the full search URL - we keep the rows
+the last crawl returned. From those come the set of job IDs already seen and
+the watermark: the newest posted date among them. An incremental crawl stops
+paginating at the first page whose jobs are all known and all posted before the
+watermark, then fills in the rest of the results from the stored rows, so the
+output is the same shape as a full crawl.
+
+Stopping early can miss edits to old postings (or, on sites not sorted by
+date, new postings deep in the results), and never notices removed ones, so a
+full crawl is forced once the last one is `full_crawl_days` old.
+
+State is one parquet file per site under CRAWL_STATE_DIR.
+"""
+
+import threading
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+import polars as pl
+
+
+CRAWL_STATE_DIR = Path("./scrappy_RA/data_saved_locally/crawl_state")
+
+# Posted-date formats seen across the supported sites
+DATE_FORMATS = ("%m/%d/%Y", "%m/%d/%y", "%Y-%m-%d", "%B %d, %Y", "%b %d, %Y")
+
+_STATE_LOCK = threading.Lock()
+
+
+def parse_posted_date(value) -> Optional[date]:
+    """Parse a scraped posted-date string, or None if it matches no known format."""
+    if not value:
+        return None
+    value = str(value).strip()
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+class CrawlState:
+    def __init__(
+        self,
+        query_url: str,
+        id_col: str,
+        date_col: str,
+        full_crawl_days: int = 7,
+        state_dir: Optional[Path] = None,
+    ):
+        self.site = urlparse(query_url).netloc
+        self.query = query_url
+        self.id_col = id_col
+        self.date_col = date_col
+        self.full_crawl_days = full_crawl_days
+        self.path = Path(state_dir or CRAWL_STATE_DIR) / f"{self.site}.parquet"
+
+        self.previous = self._load()
+        self.seen_ids = set(self.previous[id_col].to_list()) if self.previous is not None else set()
+        dates = [parse_posted_date(d) for d in self.previous[date_col].to_list()] if self.previous is not None else []
+        dates = [d for d in dates if d]
+        self.watermark: Optional[date] = max(dates) if dates else None
+
+        last_full = self.previous['full_crawl_date'][0] if self.previous is not None else None
+        self.last_full_crawl = date.fromisoformat(last_full) if last_full else None
+        self.full_crawl_due = (
+            self.last_full_crawl is None
+            or self.watermark is None
+            or (date.today() - self.last_full_crawl).days >= full_crawl_days
+        )
+
+    def _load(self) -> Optional[pl.DataFrame]:
+        if not self.path.exists():
+            return None
+        try:
+            rows = pl.read_parquet(self.path).filter(pl.col('query') == self.query)
+        except Exception as e:
+            print(f"  Warning: could not read crawl state ({e}); doing a full crawl.")
+            return None
+        return rows if not rows.is_empty() else None
+
+    def page_is_known(self, jobs_on_page: List[Dict]) -> bool:
+        """True if every job on the page was seen before and is older than the watermark."""
+        if self.full_crawl_due or not jobs_on_page:
+            return False
+        for job in jobs_on_page:
+            if job.get(self.id_col) not in self.seen_ids:
+                return False
+            posted = parse_posted_date(job.get(self.date_col))
+            if posted is None or posted >= self.watermark:
+                return False
+        return True
+
+    def merge(self, fresh: pl.DataFrame) -> pl.DataFrame:
+        """Fresh rows, followed by stored rows for jobs the crawl stopped before reaching."""
+        if self.previous is None:
+            return fresh
+        fresh_ids = set(fresh[self.id_col].to_list())
+        rest = (
+            self.previous
+            .filter(~pl.col(self.id_col).is_in(list(fresh_ids)))
+            .select(fresh.columns)
+            .cast(fresh.schema)
+        )
+        return pl.concat([fresh, rest])
+
+    def save(self, results: pl.DataFrame, full_crawl: bool) -> None:
+        """Replace this query's stored rows with `results`."""
+        full_crawl_date = date.today().isoformat() if full_crawl else (
+            self.last_full_crawl.isoformat() if self.last_full_crawl else None
+        )
+        rows = results.with_columns(
+            pl.lit(self.query).alias('query'),
+            pl.lit(full_crawl_date, dtype=pl.Utf8).alias('full_crawl_date'),
+        )
+        with _STATE_LOCK:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            if self.path.exists():
+                others = pl.read_parquet(self.path).filter(pl.col('query') != self.query)
+                rows = pl.concat([others, rows], how='diagonal_relaxed')
+            rows.write_parquet(self.path)
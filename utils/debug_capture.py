@@ -0,0 +1,202 @@
+"""
+Debug HTML capture, kept off the scraping hot path.
+
+Pages used to be written to selenium_page_init.html / page_debug.html on every
+load: a synchronous disk write plus an extra page_source round trip (and a
+prettify) per page. Instead, a page is captured only when
+
+  - something went wrong (a timeout, a failed search or scroll) and
+    `on_error` is set, or
+  - it is picked by `sample_rate` (the fraction of ordinary pages to keep),
+
+and the HTML is compressed (zstd if the `zstandard` package is installed,
+else gzip) and written by a background thread. Captures land in a ring
+buffer under DEBUG_CAPTURE_DIR: one file per capture, named
+<timestamp>-<seq>_<reason>_<host-and-path>_<hash>.html.zst|.gz, with only the
+newest `max_files` kept.
+
+Usage:
+    debug_capture.capture(url, "timeout", driver=driver, error=True)
+    debug_capture.capture(url, "page", html=html)            # sampled
+"""
+
+import atexit
+import gzip
+import hashlib
+import itertools
+import queue
+import random
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlparse
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+DEBUG_CAPTURE_DIR = Path("./scrappy_RA/data_saved_locally/debug_html")
+
+# Tie-breaker for captures of the same URL within a millisecond
+_SEQUENCE = itertools.count()
+
+
+def _compress(html: str):
+    """(compressed bytes, file suffix) with the best codec available."""
+    data = html.encode("utf-8", errors="replace")
+    if zstandard is not None:
+        return zstandard.ZstdCompressor(level=3).compress(data), ".html.zst"
+    return gzip.compress(data, compresslevel=6), ".html.gz"
+
+
+def _file_stem(url: str, reason: str) -> str:
+    parts = urlparse(url)
+    slug = re.sub(r"[^A-Za-z0-9]+", "-", f"{parts.netloc}{parts.path}").strip("-")[:60]
+    digest = hashlib.sha1(url.encode()).hexdigest()[:8]
+    stamp = time.strftime("%Y%m%d-%H%M%S") + f"{time.time() % 1:.3f}"[1:]
+    return f"{stamp}-{next(_SEQUENCE) % 1000:03d}_{reason}_{slug}_{digest}"
+
+
+class DebugCapture:
+    def __init__(
+        self,
+        sample_rate: float = 0.0,
+        on_error: bool = True,
+        capture_dir: Optional[Path] = None,
+        max_files: int = 200,
+        queue_size: int = 32,
+    ):
+        """
+        Args:
+            sample_rate: Fraction of ordinary (non-error) pages to capture.
+            on_error: Capture every page reported with error=True.
+            capture_dir: Where captures go (default DEBUG_CAPTURE_DIR).
+            max_files: Size of the ring buffer; older captures are deleted.
+            queue_size: Captures waiting to be written; more are dropped.
+        """
+        self.sample_rate = sample_rate
+        self.on_error = on_error
+        self.capture_dir = Path(capture_dir or DEBUG_CAPTURE_DIR)
+        self.max_files = max_files
+        self.n_captured = 0
+        self.n_dropped = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._writer: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def wants(self, error: bool = False) -> bool:
+        """Whether a page (an error page, with `error`) should be captured."""
+        if error:
+            return self.on_error
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def capture(self, url: str, reason: str, driver=None, html: Optional[str] = None, error: bool = False) -> bool:
+        """
+        Queue a page for writing if it is wanted. The HTML is read from
+        `driver` only then; pass `html` if it's already at hand. Returns True
+        if the page was queued.
+        """
+        if not self.wants(error):
+            return False
+        if html is None:
+            if driver is None:
+                return False
+            try:
+                html = driver.page_source
+            except Exception:
+                return False
+        self._start_writer()
+        try:
+            self._queue.put_nowait((url, reason, html))
+        except queue.Full:
+            self.n_dropped += 1
+            return False
+        return True
+
+    def _start_writer(self) -> None:
+        with self._lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name="debug-capture", daemon=True)
+                self._writer.start()
+
+    def _write_loop(self) -> None:
+        while True:
+            url, reason, html = self._queue.get()
+            try:
+                self._write(url, reason, html)
+            except Exception as e:
+                print(f"  Warning: could not write debug capture ({e})")
+            finally:
+                self._queue.task_done()
+
+    def _write(self, url: str, reason: str, html: str) -> None:
+        data, suffix = _compress(html)
+        self.capture_dir.mkdir(parents=True, exist_ok=True)
+        (self.capture_dir / f"{_file_stem(url, reason)}{suffix}").write_bytes(data)
+        self.n_captured += 1
+
+        # Ring buffer: names start with the timestamp, so oldest sort first
+        files = sorted(p for p in self.capture_dir.iterdir() if p.name.endswith((".html.zst", ".html.gz")))
+        for old in files[:max(0, len(files) - self.max_files)]:
+            old.unlink(missing_ok=True)
+
+    def flush(self) -> None:
+        """Wait for queued captures to be written."""
+        if self._writer is not None:
+            self._queue.join()
+
+    def report(self) -> None:
+        self.flush()
+        if self.n_captured or self.n_dropped:
+            dropped = f", {self.n_dropped} dropped (writer busy)" if self.n_dropped else ""
+            print(f"\nDebug captures: {self.n_captured} written to {self.capture_dir}{dropped}")
+
+
+def read_capture(path) -> str:
+    """Decompress a capture back to its HTML."""
+    path = Path(path)
+    data = path.read_bytes()
+    if path.name.endswith(".zst"):
+        if zstandard is None:
+            raise ImportError("reading .zst captures needs the `zstandard` package")
+        data = zstandard.ZstdDecompressor().decompressobj().decompress(data)
+    else:
+        data = gzip.decompress(data)
+    return data.decode("utf-8", errors="replace")
+
+
+_CAPTURE: Optional[DebugCapture] = None
+_CAPTURE_LOCK = threading.Lock()
+
+
+def get_debug_capture() -> DebugCapture:
+    """Return the process-wide DebugCapture, creating it (errors only) on first use."""
+    global _CAPTURE
+    with _CAPTURE_LOCK:
+        if _CAPTURE is None:
+            _CAPTURE = DebugCapture()
+            atexit.register(_CAPTURE.flush)
+        return _CAPTURE
+
+
+def configure_debug_capture(**kwargs) -> DebugCapture:
+    """
+    Replace the process-wide DebugCapture, e.g. configure_debug_capture(sample_rate=0.05).
+    Accepts the same arguments as DebugCapture().
+    """
+    global _CAPTURE
+    with _CAPTURE_LOCK:
+        if _CAPTURE is not None:
+            _CAPTURE.flush()
+        _CAPTURE = DebugCapture(**kwargs)
+        atexit.register(_CAPTURE.flush)
+        return _CAPTURE
+
+
+def capture(url: str, reason: str, driver=None, html: Optional[str] = None, error: bool = False) -> bool:
+    """DebugCapture.capture on the process-wide instance."""
+    return get_debug_capture().capture(url, reason, driver=driver, html=html, error=error)
@@ -1,26 +1,389 @@
 
 
 import time
-from typing import Callable
+import json
+import hashlib
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlencode, urlparse, urlunparse, parse_qs
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import builder_registry
 import polars as pl
 
+from scrappy_RA.utils import rate_limiter
 
-def get_soup_requests(url, headers=None):
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'
+}
+
+# urllib3 only decodes brotli when the `brotli` package is importable, so only
+# advertise it in that case.
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+# --- HTML parsing ----------------------------------------------------------
+
+class AnyOfStrainer(SoupStrainer):
+    """
+    SoupStrainer that keeps a top-level tag if any of `strainers` would, e.g.
+    the result container *and* the pagination links. A plain SoupStrainer
+    can only AND its rules together.
+    """
+    def __init__(self, *strainers: SoupStrainer):
+        super().__init__()
+        self.strainers = strainers
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:
+        return any(s.allow_tag_creation(nsprefix, name, attrs) for s in self.strainers)
+
+    def allow_string_creation(self, string: str) -> bool:
+        return False
+
+    def __repr__(self) -> str:
+        return f"AnyOfStrainer{self.strainers!r}"
+
+
+@lru_cache(maxsize=None)
+def resolve_parser(features: str) -> str:
+    """Return `features` if that BeautifulSoup backend is installed, else html.parser."""
+    if builder_registry.lookup(features) is None:
+        print(f"Parser backend '{features}' not available; using html.parser.")
+        return "html.parser"
+    return features
+
+
+def make_soup(markup, features: str="html.parser", parse_only: Optional[SoupStrainer]=None) -> BeautifulSoup:
+    """
+    Parse markup with the chosen backend ('html.parser', 'lxml', ...). With
+    `parse_only`, only the matching parts of the page are built into a tree.
+    """
+    return BeautifulSoup(markup, resolve_parser(features), parse_only=parse_only)
+
+
+# --- Shared HTTP session ---------------------------------------------------
+
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def make_session(
+    pool_size: int=10,
+    retries: int=3,
+    backoff_factor: float=1.0,
+    status_forcelist: tuple=(429, 500, 502, 503, 504)
+) -> requests.Session:
+    """
+    Build a keep-alive requests.Session with a connection pool of `pool_size`
+    per host and exponential-backoff retries on connection errors and on the
+    statuses in `status_forcelist`. Retry-After is honored on 429/503.
+    """
+    retry = Retry(
+        total=retries,
+        connect=retries,
+        read=retries,
+        status=retries,
+        backoff_factor=backoff_factor,  # sleeps backoff_factor * 2**(n-1) seconds
+        status_forcelist=status_forcelist,
+        allowed_methods=frozenset(['GET', 'HEAD']),
+        respect_retry_after_header=True,
+        raise_on_status=False  # hand the final response back to raise_for_status()
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update(DEFAULT_HEADERS)
+    session.headers.update({
+        'Accept-Encoding': ACCEPT_ENCODING,
+        'Connection': 'keep-alive'
+    })
+    return session
+
+
+def get_session() -> requests.Session:
+    """Return the module-level pooled session, creating it on first use."""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            _SESSION = make_session()
+        return _SESSION
+
+
+def configure_session(**kwargs) -> requests.Session:
+    """
+    Replace the module-level session, e.g. configure_session(pool_size=20).
+    Accepts the same arguments as make_session().
+    """
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is not None:
+            _SESSION.close()
+        _SESSION = make_session(**kwargs)
+        return _SESSION
+
+
+# --- Conditional-GET cache -------------------------------------------------
+
+HTTP_CACHE_DIR = Path("./scrappy_RA/data_saved_locally/http_cache")
+
+
+class HttpCache:
+    """
+    On-disk HTTP cache keyed by URL. Each entry is a body file plus a JSON
+    sidecar holding the ETag/Last-Modified validators, the time it was stored,
+    and (optionally) parse results saved by scrapers. The next fetch of the URL
+    sends If-None-Match/If-Modified-Since; on a 304 the cached body is reused
+    and scrapers can reuse the cached parse result as well.
+
+    Entries older than `ttl_days` are dropped rather than revalidated, and at
+    most `max_entries` are kept (oldest evicted first).
+    """
+    def __init__(self, cache_dir: Path = HTTP_CACHE_DIR, ttl_days: float = 7, max_entries: int = 5000):
+        self.cache_dir = Path(cache_dir)
+        self.ttl_seconds = ttl_days * 86400
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        self.parse_hits = 0
+        self.parse_seconds_saved = 0.0
+        self._not_modified = set()  # URLs revalidated with a 304 this run
+        self._lock = threading.Lock()
+        self._evicted = False
+
+    def _paths(self, url: str):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return self.cache_dir / f"{key}.body", self.cache_dir / f"{key}.json"
+
+    def _read_meta(self, url: str) -> Optional[Dict]:
+        body_path, meta_path = self._paths(url)
+        if not (meta_path.exists() and body_path.exists()):
+            return None
+        try:
+            meta = json.loads(meta_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        if time.time() - meta.get('stored_at', 0) > self.ttl_seconds:
+            self._remove(url)
+            return None
+        return meta
+
+    def _write_meta(self, url: str, meta: Dict) -> None:
+        _, meta_path = self._paths(url)
+        tmp_path = meta_path.with_suffix('.tmp')
+        tmp_path.write_text(json.dumps(meta), encoding='utf-8')
+        tmp_path.replace(meta_path)
+
+    def _remove(self, url: str) -> None:
+        for path in self._paths(url):
+            path.unlink(missing_ok=True)
+
+    def validators(self, url: str) -> Dict[str, str]:
+        """Conditional-request headers for a cached URL (empty if not cached)."""
+        meta = self._read_meta(url)
+        if not meta:
+            return {}
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    def store(self, url: str, response: requests.Response) -> None:
+        """Save a 200 response if it carries a validator; drops stale parse results."""
+        with self._lock:
+            self.misses += 1
+            self._not_modified.discard(url)
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not (etag or last_modified):
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._evict_once()
+        body_path, _ = self._paths(url)
+        body_path.write_bytes(response.content)
+        self._write_meta(url, {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'stored_at': time.time(),
+            'size': len(response.content),
+            'parsed': {}
+        })
+
+    def revalidated(self, url: str) -> Optional[bytes]:
+        """Record a 304 for `url` and return its cached body."""
+        body_path, _ = self._paths(url)
+        try:
+            body = body_path.read_bytes()
+        except OSError:
+            return None
+        with self._lock:
+            self.hits += 1
+            self.bytes_saved += len(body)
+            self._not_modified.add(url)
+        return body
+
+    def load_parsed(self, url: str, key: str) -> Optional[List[Dict]]:
+        """Parse result saved under `key`, only if `url` was a 304 this run."""
+        if url not in self._not_modified:
+            return None
+        meta = self._read_meta(url)
+        parsed = (meta or {}).get('parsed', {}).get(key)
+        if parsed is None:
+            return None
+        with self._lock:
+            self.parse_hits += 1
+            self.parse_seconds_saved += parsed.get('parse_seconds', 0.0)
+        return parsed['jobs']
+
+    def store_parsed(self, url: str, key: str, jobs: List[Dict], parse_seconds: float) -> None:
+        """Attach a parse result to a cached URL (no-op if the URL isn't cached)."""
+        meta = self._read_meta(url)
+        if meta is None:
+            return
+        meta.setdefault('parsed', {})[key] = {'jobs': jobs, 'parse_seconds': parse_seconds}
+        self._write_meta(url, meta)
+
+    def _evict_once(self) -> None:
+        """Drop expired entries, then the oldest beyond max_entries (once per run)."""
+        with self._lock:
+            if self._evicted:
+                return
+            self._evicted = True
+        entries = []
+        for meta_path in self.cache_dir.glob('*.json'):
+            try:
+                stored_at = json.loads(meta_path.read_text(encoding='utf-8')).get('stored_at', 0)
+            except (OSError, ValueError):
+                stored_at = 0
+            entries.append((stored_at, meta_path))
+        entries.sort(reverse=True)
+        cutoff = time.time() - self.ttl_seconds
+        for i, (stored_at, meta_path) in enumerate(entries):
+            if stored_at < cutoff or i >= self.max_entries:
+                meta_path.unlink(missing_ok=True)
+                meta_path.with_suffix('.body').unlink(missing_ok=True)
+
+    def report(self) -> None:
+        total = self.hits + self.misses
+        if not total:
+            return
+        print(f"HTTP cache: {self.hits}/{total} pages not modified "
+              f"({self.bytes_saved / 1024:,.0f} KB not re-downloaded), "
+              f"{self.parse_hits} parses reused ({self.parse_seconds_saved:.2f}s saved)")
+
+
+_HTTP_CACHE: Optional[HttpCache] = None
+
+
+def get_http_cache() -> HttpCache:
+    """Return the module-level HTTP cache, creating it on first use."""
+    global _HTTP_CACHE
+    with _SESSION_LOCK:
+        if _HTTP_CACHE is None:
+            _HTTP_CACHE = HttpCache()
+        return _HTTP_CACHE
+
+
+def get_html_requests(url, headers=None, session=None, use_cache=True) -> Optional[bytes]:
+    """
+    GET `url` over the pooled session and return the response body, or None
+    on failure. With `use_cache`, a 304 from the HTTP cache returns the
+    stored body. Requests are paced by the host's shared rate limiter, which
+    is fed each response's status and latency.
+    """
     if not headers:    
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'
-        }
-    
-    try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-    except requests.RequestException as e:
-        print(f"Request failed: {e}")
+        headers = DEFAULT_HEADERS
+    if session is None:
+        session = get_session()
+    cache = get_http_cache() if use_cache else None
+    limiter = rate_limiter.get_limiter(url)
+
+    def fetch(request_headers):
+        limiter.acquire()
+        start = time.perf_counter()
+        try:
+            response = session.get(url, headers=request_headers, timeout=30)
+            limiter.record(time.perf_counter() - start, response.status_code)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            if getattr(e, 'response', None) is None:
+                limiter.record(time.perf_counter() - start, error=True)
+            print(f"Request failed: {e}")
+            return None
+        return response
+
+    response = fetch({**headers, **cache.validators(url)} if cache else dict(headers))
+    if response is None:
+        return None
+
+    if cache and response.status_code == 304:
+        content = cache.revalidated(url)
+        if content is not None:
+            return content
+        # The cached body is gone (e.g. evicted) but its validators weren't:
+        # ask again unconditionally rather than keep the empty 304 body
+        response = fetch(dict(headers))
+        if response is None:
+            return None
+    if cache:
+        cache.store(url, response)
+    return response.content
+
+
+def get_soup_requests(url, headers=None, session=None, use_cache=True, features="html.parser", parse_only=None):
+    content = get_html_requests(url, headers, session, use_cache)
+    if content is None:
         return None
+    return make_soup(content, features, parse_only)
 
-    return BeautifulSoup(response.content, "html.parser")
+
+def build_search_url(base_url: str, search_kw: str, kw_param_nm: str) -> str:
+    """Return base_url with `kw_param_nm=search_kw` added to its query string."""
+    parsed = urlparse(base_url)
+    params = parse_qs(parsed.query)
+    params[kw_param_nm] = [search_kw]
+    return urlunparse(parsed._replace(query=urlencode(params, doseq=True)))
+
+
+class ColumnAccumulator:
+    """
+    Collects parsed jobs straight into one list per output column, then builds
+    the DataFrame once with a declared schema - no per-row dicts kept around,
+    no schema inference, no column re-select. Every frame it builds has the
+    same columns and dtypes (even an all-empty-string page or no rows at
+    all), so per-keyword frames always pl.concat cleanly.
+    """
+    def __init__(self, out_cols: list, out_df_schema: dict=None):
+        out_df_schema = out_df_schema or {}
+        # Columns missing from the declared schema default to strings
+        self.schema = {col: out_df_schema.get(col, pl.Utf8) for col in out_cols}
+        self.columns = {col: [] for col in self.schema}
+        self.n_rows = 0
+
+    def __len__(self) -> int:
+        return self.n_rows
+
+    def extend(self, jobs: list[dict]) -> None:
+        """Append a page of jobs; keys outside the schema are dropped, missing ones become null."""
+        for col, values in self.columns.items():
+            values.extend(job.get(col) for job in jobs)
+        self.n_rows += len(jobs)
+
+    def to_frame(self) -> pl.DataFrame:
+        return pl.DataFrame(self.columns, schema=self.schema)
 
 
 def scrape_requests(
@@ -36,11 +399,10 @@ def scrape_requests(
     The parser function must accept (soup, base_url) and return a list[dict].
     """
 
-    all_jobs = []
+    all_jobs = ColumnAccumulator(out_cols, out_df_schema)
     page = 0
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'
-    }
+    headers = DEFAULT_HEADERS
+    session = get_session()
 
     print("Starting job listing scrape...")
 
@@ -51,7 +413,7 @@ def scrape_requests(
             url = f"{build_search_url(base_url, search_kw, kw_param_nm)}&page={page}"
 
         print(f"\nFetching page {page + 1}: {url}")
-        soup = get_soup_requests(url, headers)
+        soup = get_soup_requests(url, headers, session)
         if not soup:
             print("Failed to fetch page.")
             break
@@ -74,21 +436,13 @@ def scrape_requests(
             break
 
         page += 1
-        time.sleep(1)
         
     # Make Data Frame
     if all_jobs:
         print(f"\nConverting {len(all_jobs)} jobs to Polars DataFrame...")
         
         try:
-            # Convert list of dicts to Polars DataFrame
-            df = pl.DataFrame(all_jobs)
-            
-            # Reorder columns for consistency            
-            # Only select columns that exist in the dataframe
-            existing_cols = [col for col in out_cols if col in df.columns]
-            df = df.select(existing_cols)
-            
+            df = all_jobs.to_frame()
             print(f"✓ Successful -- DataFrame shape: {df.shape}")
             
             return df
@@ -98,11 +452,7 @@ def scrape_requests(
             return None
     else:
         print("No jobs found to save.")
-        empty_df = pl.DataFrame(
-            data=[],
-            schema=out_df_schema
-        )
-        return empty_df
+        return all_jobs.to_frame()
 
 
 
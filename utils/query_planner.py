@@ -0,0 +1,166 @@
+"""
+Cross-module search planning.
+
+Every module used to re-read the profile YAML and issue its own searches, even
+when another module (or another keyword group) had already run exactly the same
+search. A QueryPlanner is built once per run: it loads the profile once, collects
+every (site, base_url, keyword set) the enabled modules will search, prints the
+plan, and then memoizes results so each unique search is issued only once.
+
+Keyword sets are compared as sets (order and surrounding whitespace ignored);
+the same keywords against a different base_url (e.g. HigherEd's remote vs lab
+pages) are different listings and are searched separately.
+
+Results are returned untagged, so each module still applies its own kw/kw_idx
+labels to whatever it gets back. Searches run from several threads at once
+are deduplicated too: a duplicate waits for the first one's result.
+"""
+
+import threading
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+from urllib.parse import urlparse
+
+import yaml
+import polars as pl
+
+
+PROFILE_PATH = Path(__file__).resolve().parent / ".." / "profiles" / "profile1.yaml"
+
+QueryKey = Tuple[str, str, frozenset]
+
+
+def query_key(base_url: str, keywords: Sequence[str]) -> QueryKey:
+    """(site, base_url, keyword set) identifying one search."""
+    return (urlparse(base_url).netloc, base_url, frozenset(kw.strip() for kw in keywords))
+
+
+def load_profile(profile_path: Path = PROFILE_PATH) -> dict:
+    print(f"Profiles available: {sorted(p.name for p in Path(profile_path).parent.iterdir())}")
+    with open(profile_path, "r") as f:
+        return yaml.safe_load(f)
+
+
+class QueryPlanner:
+    def __init__(self, profile_path: Path = PROFILE_PATH):
+        self.profile_path = profile_path
+        self._profile: Optional[dict] = None
+        self.planned: List[Tuple[str, QueryKey]] = []   # (label, key), in plan order
+        self.results: Dict[QueryKey, Future] = {}  # one per search, set when it finishes
+        self.n_run = 0
+        self.n_reused = 0
+        self._lock = threading.Lock()
+
+    @property
+    def profile(self) -> dict:
+        """The profile YAML, read on first use and shared by every module."""
+        if self._profile is None:
+            self._profile = load_profile(self.profile_path)
+        return self._profile
+
+    def add(self, label: str, base_url: str, search_kw: Union[List[str], Dict]) -> None:
+        """
+        Register a module's searches. `search_kw` is either a dict of
+        {kw_idx: [keywords]} (one search per group) or a list of keywords
+        (one search per keyword), matching what the search functions take.
+        """
+        groups = search_kw.values() if isinstance(search_kw, dict) else ([kw] for kw in search_kw)
+        for keywords in groups:
+            self.planned.append((label, query_key(base_url, keywords)))
+
+    def print_plan(self) -> None:
+        """Print the searches each module will issue and how many are duplicates."""
+        print(f"\n{'='*50}")
+        print("Search plan")
+        print(f"{'='*50}")
+        first_label: Dict[QueryKey, str] = {}
+        duplicates: List[Tuple[str, QueryKey]] = []
+        counts: Dict[str, List[int]] = {}
+        for label, key in self.planned:
+            total_unique = counts.setdefault(label, [0, 0])
+            total_unique[0] += 1
+            if key in first_label:
+                duplicates.append((label, key))
+            else:
+                first_label[key] = label
+                total_unique[1] += 1
+
+        for label, (total, unique) in counts.items():
+            print(f"  {label}: {total} searches, {unique} to run")
+        for label, key in duplicates:
+            print(f"  ↺ {label} reuses {first_label[key]}: {sorted(key[2])}")
+        print(f"  {len(self.planned)} searches planned, {len(first_label)} unique "
+              f"({len(duplicates)} saved)\n")
+
+    def run(self, base_url: str, keywords: Sequence[str], search: Callable[[], pl.DataFrame]) -> Optional[pl.DataFrame]:
+        """
+        Return `search()`'s result, running it only the first time this query
+        is seen; a concurrent call for the same query waits for that result.
+        """
+        key = query_key(base_url, keywords)
+        with self._lock:
+            future = self.results.get(key)
+            first = future is None
+            if first:
+                future = self.results[key] = Future()
+                self.n_run += 1
+            else:
+                self.n_reused += 1
+        if not first:
+            print(f"↺ Reusing results of an identical earlier search ({', '.join(keywords)})")
+            return future.result()
+
+        try:
+            future.set_result(search())
+        except BaseException as e:
+            self._forget(key, future, e)
+            raise
+        return future.result()
+
+    def run_many(
+        self,
+        base_url: str,
+        keyword_sets: List[Sequence[str]],
+        search_many: Callable[[List[Sequence[str]]], List[pl.DataFrame]],
+    ) -> List[Optional[pl.DataFrame]]:
+        """
+        Batch version of run() for drivers that search many queries at once:
+        `search_many` is called with the keyword sets not already searched
+        (each only once) and must return their results in the same order.
+        Returns a result for every entry of `keyword_sets`.
+        """
+        pending: Dict[QueryKey, Sequence[str]] = {}
+        with self._lock:
+            futures = []
+            for keywords in keyword_sets:
+                key = query_key(base_url, keywords)
+                if key not in self.results:
+                    self.results[key] = Future()
+                    pending[key] = keywords
+                futures.append(self.results[key])
+            self.n_run += len(pending)
+            self.n_reused += len(keyword_sets) - len(pending)
+
+        if pending:
+            try:
+                for key, result in zip(pending, search_many(list(pending.values()))):
+                    self.results[key].set_result(result)
+            except BaseException as e:
+                for key in pending:
+                    if not self.results[key].done():
+                        self._forget(key, self.results[key], e)
+                raise
+        return [future.result() for future in futures]
+
+    def _forget(self, key: QueryKey, future: Future, error: BaseException) -> None:
+        """Fail a search's waiters and drop it, so a later call can try again."""
+        future.set_exception(error)
+        with self._lock:
+            if self.results.get(key) is future:
+                del self.results[key]
+                self.n_run -= 1
+
+    def report(self) -> None:
+        if self.n_run or self.n_reused:
+            print(f"\nSearches: {self.n_run} run, {self.n_reused} reused from identical searches")
@@ -0,0 +1,165 @@
+"""
+Adaptive per-domain rate limiting, shared by every scraper in the process.
+
+Each host gets one DomainRateLimiter: a token bucket whose refill rate is
+tuned AIMD-style (additive increase, multiplicative decrease). While
+responses come back fast and clean the rate creeps up by `increase` requests/s
+per response; a 429/503, a bot-challenge stub, an error or a latency spike cuts
+it by `decrease`. This replaces the fixed random sleeps that were either too
+slow on a good day or too aggressive on a bad one.
+
+Usage:
+    limiter = rate_limiter.get_limiter(url)
+    limiter.acquire()                      # blocks until a token is free
+    ... fetch ...
+    limiter.record(latency=1.2, status=200, challenged=False)
+
+rate_limiter.report_all() prints the achieved request rate per host.
+"""
+
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+
+# Statuses that mean "slow down"
+THROTTLE_STATUSES = (429, 503)
+
+
+class DomainRateLimiter:
+    def __init__(
+        self,
+        host: str,
+        rate: float = 0.5,
+        min_rate: float = 0.1,
+        max_rate: float = 4.0,
+        burst: float = 1.0,
+        increase: float = 0.05,
+        decrease: float = 0.5,
+        spike_factor: float = 3.0,
+        spike_floor: float = 5.0,
+    ):
+        """
+        Args:
+            host: Host this limiter paces (for reporting).
+            rate: Starting rate, in requests per second.
+            min_rate / max_rate: Bounds the adapted rate stays within.
+            burst: Bucket capacity - requests that may go back to back.
+            increase: Requests/s added after each clean, fast response.
+            decrease: Factor the rate is multiplied by on a bad response.
+            spike_factor / spike_floor: A response counts as a latency spike if
+                it took more than spike_factor x the running average and more
+                than spike_floor seconds.
+        """
+        self.host = host
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.rate = min(max(rate, min_rate), max_rate)
+        self.burst = burst
+        self.increase = increase
+        self.decrease = decrease
+        self.spike_factor = spike_factor
+        self.spike_floor = spike_floor
+
+        self._tokens = burst
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+        self.avg_latency: Optional[float] = None
+        self.n_requests = 0
+        self.n_backoffs = 0
+        self.first_request: Optional[float] = None
+        self.last_request: Optional[float] = None
+
+    def _reserve(self) -> float:
+        """Take a token (possibly going into debt) and return how long to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate)
+            self._last_refill = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+            start = now + wait
+            self.n_requests += 1
+            if self.first_request is None:
+                self.first_request = start
+            self.last_request = start
+            return wait
+
+    def acquire(self) -> float:
+        """Block until this host may be requested again. Returns seconds waited."""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def record(
+        self,
+        latency: Optional[float] = None,
+        status: Optional[int] = None,
+        challenged: bool = False,
+        error: bool = False,
+    ) -> None:
+        """Feed back one response's outcome and adapt the rate."""
+        with self._lock:
+            spike = (
+                latency is not None
+                and self.avg_latency is not None
+                and latency > max(self.spike_factor * self.avg_latency, self.spike_floor)
+            )
+            if latency is not None and not spike:
+                self.avg_latency = latency if self.avg_latency is None else 0.8 * self.avg_latency + 0.2 * latency
+
+            if error or challenged or spike or status in THROTTLE_STATUSES:
+                self.rate = max(self.min_rate, self.rate * self.decrease)
+                self.n_backoffs += 1
+                # Start the slower schedule now rather than after banked tokens
+                self._tokens = min(self._tokens, 0.0)
+            else:
+                self.rate = min(self.max_rate, self.rate + self.increase)
+
+    @property
+    def achieved_rate(self) -> float:
+        """Requests per second actually issued so far."""
+        if self.n_requests < 2 or self.last_request == self.first_request:
+            return 0.0
+        return (self.n_requests - 1) / (self.last_request - self.first_request)
+
+    def report(self) -> None:
+        avg = f"{self.avg_latency:.2f}s" if self.avg_latency is not None else "n/a"
+        print(f"  {self.host}: {self.n_requests} requests at {self.achieved_rate:.2f}/s "
+              f"(current limit {self.rate:.2f}/s, {self.n_backoffs} backoffs, avg latency {avg})")
+
+
+_LIMITERS: Dict[str, DomainRateLimiter] = {}
+_LIMITERS_LOCK = threading.Lock()
+
+
+def get_limiter(url_or_host: str, **kwargs) -> DomainRateLimiter:
+    """
+    Return the shared limiter for a URL's host, creating it on first use.
+    `kwargs` (see DomainRateLimiter) only apply when the limiter is created.
+    """
+    host = urlparse(url_or_host).netloc or url_or_host
+    with _LIMITERS_LOCK:
+        if host not in _LIMITERS:
+            _LIMITERS[host] = DomainRateLimiter(host, **kwargs)
+        return _LIMITERS[host]
+
+
+def rate_from_sleep_time(sleep_time: list) -> float:
+    """Requests/s matching the midpoint of an old [min, max] random sleep."""
+    return 1.0 / max(sum(sleep_time) / len(sleep_time), 0.01)
+
+
+def report_all() -> None:
+    """Print the achieved request rate for every host that was rate limited."""
+    with _LIMITERS_LOCK:
+        limiters = [l for l in _LIMITERS.values() if l.n_requests]
+    if not limiters:
+        return
+    print("\nRequest rates by host:")
+    for limiter in limiters:
+        limiter.report()
@@ -1,17 +1,32 @@
 
 
 import os
+import re
+import json
 import time
+import base64
+import queue
 import random
-from typing import List, Dict, Callable
+import threading
+import atexit
+import shutil
+import weakref
+import urllib.request
+from functools import lru_cache
+from pathlib import Path
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import List, Dict, Callable, Iterator, Optional
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 from selenium_stealth import stealth
 
 
@@ -19,7 +34,160 @@ from bs4 import BeautifulSoup
 
 import polars as pl
 
-from . import gen_utils
+from . import gen_utils, rate_limiter, debug_capture
+
+
+# Text that only appears on a bot-challenge interstitial (Imperva Incapsula)
+CHALLENGE_MARKERS = ("_Incapsula_Resource", "Incapsula incident", "Request unsuccessful")
+
+
+def looks_challenged(html: str) -> bool:
+    """True if `html` is a bot-challenge stub rather than the real page."""
+    return any(marker in html for marker in CHALLENGE_MARKERS)
+
+
+def page_challenged(driver) -> bool:
+    """looks_challenged for the page loaded in `driver`, checked in the browser."""
+    try:
+        return driver.execute_script(
+            "const html = document.documentElement.outerHTML;"
+            "return arguments[0].some(m => html.includes(m));",
+            list(CHALLENGE_MARKERS),
+        )
+    except WebDriverException:
+        return looks_challenged(driver.page_source)
+
+
+# --- Resource blocking -----------------------------------------------------
+# We only ever read DOM text, so images, media, fonts and third-party trackers
+# are dropped before they are requested. Images are blocked with a Chrome
+# content setting; everything else with CDP Network.setBlockedURLs patterns.
+
+BLOCKED_EXTENSIONS = (
+    # media
+    'mp4', 'webm', 'ogg', 'mp3', 'wav', 'm4a',
+    # fonts
+    'woff', 'woff2', 'ttf', 'otf', 'eot',
+)
+STYLESHEET_EXTENSIONS = ('css',)
+
+TRACKER_DOMAINS = (
+    'google-analytics.com', 'googletagmanager.com', 'googleadservices.com',
+    'googlesyndication.com', 'doubleclick.net', 'adservice.google.com',
+    'facebook.net', 'connect.facebook.com', 'bat.bing.com', 'clarity.ms',
+    'hotjar.com', 'scorecardresearch.com', 'quantserve.com', 'adnxs.com',
+    'linkedin.com/px', 'snap.licdn.com', 'ads-twitter.com', 'taboola.com',
+    'outbrain.com', 'criteo.com', 'nr-data.net', 'newrelic.com',
+)
+
+# Hosts exempt from the host-specific blocking: their images are allowed (a
+# content-setting exception) and any TRACKER_DOMAINS entry naming them is
+# dropped. The media/font/CSS extension patterns still apply to every host -
+# Network.setBlockedURLs has no way to except one - so a site that needs those
+# must be loaded with block_resources=False. The Incapsula challenge is served
+# from the site's own host under /_Incapsula_Resource, which none of the
+# patterns match.
+RESOURCE_ALLOWLIST = ('incapsula.com', 'imperva.com')
+
+
+def blocked_url_patterns(block_stylesheets: bool=False, allowlist=RESOURCE_ALLOWLIST) -> List[str]:
+    """
+    URL patterns (CDP wildcard syntax) for Network.setBlockedURLs. `allowlist`
+    only removes tracker patterns; the extension patterns match on any host.
+    """
+    extensions = BLOCKED_EXTENSIONS + (STYLESHEET_EXTENSIONS if block_stylesheets else ())
+    patterns = [f'*.{ext}' for ext in extensions] + [f'*.{ext}?*' for ext in extensions]
+    patterns += [
+        f'*{domain}*' for domain in TRACKER_DOMAINS
+        if not any(allowed in domain for allowed in allowlist)
+    ]
+    return patterns
+
+
+def apply_resource_blocking(driver, block_stylesheets: bool=False, allowlist=RESOURCE_ALLOWLIST) -> None:
+    """Start blocking media, fonts (and optionally CSS) and trackers on this driver's tab."""
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {
+        'urls': blocked_url_patterns(block_stylesheets, allowlist)
+    })
+
+
+def image_blocking_prefs(allowlist=RESOURCE_ALLOWLIST) -> Dict:
+    """Chrome prefs turning images off, except on allowlisted hosts."""
+    return {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.content_settings.exceptions.images": {
+            f"[*.]{host},*": {"setting": 1} for host in allowlist
+        },
+    }
+
+
+# Bytes transferred for the document and every subresource, per the page's
+# Resource Timing entries. Cross-origin responses without Timing-Allow-Origin
+# report 0, so this is a lower bound.
+_PAGE_BYTES_JS = """
+const nav = performance.getEntriesByType('navigation')[0];
+let total = nav ? nav.transferSize : 0;
+for (const r of performance.getEntriesByType('resource')) total += r.transferSize || 0;
+return total;
+"""
+
+_PAGE_WEIGHT = {'pages': 0, 'bytes': 0}
+_PAGE_WEIGHT_LOCK = threading.Lock()
+
+
+def page_bytes(driver) -> int:
+    """Bytes transferred so far by the current page (see _PAGE_BYTES_JS)."""
+    try:
+        return int(driver.execute_script(_PAGE_BYTES_JS) or 0)
+    except WebDriverException:
+        return 0
+
+
+def record_page_weight(driver) -> int:
+    """Add the current page's transfer size to the run totals and return it."""
+    n_bytes = page_bytes(driver)
+    with _PAGE_WEIGHT_LOCK:
+        _PAGE_WEIGHT['pages'] += 1
+        _PAGE_WEIGHT['bytes'] += n_bytes
+    return n_bytes
+
+
+def report_page_weight() -> None:
+    """Print the average transfer size of the pages loaded in Selenium this run."""
+    with _PAGE_WEIGHT_LOCK:
+        pages, n_bytes = _PAGE_WEIGHT['pages'], _PAGE_WEIGHT['bytes']
+    if pages:
+        print(f"\nSelenium pages: {pages} loaded, {n_bytes / pages / 1024:.0f} KB transferred per page on average")
+
+
+def compare_page_weight(url: str, wait_selectors: Optional[str]=None, wait_time: int=30) -> Dict[str, int]:
+    """
+    Load `url` in a full-fidelity browser and in a resource-blocking one and
+    print the bytes each transferred, e.g.
+
+        python -c "from scrappy_RA.utils import selenium_utils as s; s.compare_page_weight('https://www.higheredjobs.com/search/remote.cfm')"
+    """
+    weights = {}
+    for label, block in (('full', False), ('blocked', True)):
+        driver = setup_driver(block_resources=block)
+        try:
+            start = time.perf_counter()
+            navigate(driver, url, wait_time)
+            if wait_selectors:
+                try:
+                    WebDriverWait(driver, wait_time).until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, wait_selectors))
+                    )
+                except TimeoutException:
+                    print(f"Timeout waiting for {wait_selectors} ({label})")
+            weights[label] = page_bytes(driver)
+            print(f"  {label:>7}: {weights[label] / 1024:.0f} KB in {time.perf_counter() - start:.1f}s")
+        finally:
+            driver.quit()
+    if weights.get('full'):
+        print(f"  Blocking saves {1 - weights['blocked'] / weights['full']:.0%} of bytes")
+    return weights
 
 '''
 def setup_driver():
@@ -44,32 +212,207 @@ def setup_driver():
     return driver
 '''
 
-def setup_driver():
-    """Setup and return a configured Selenium WebDriver"""
-    print("Setting up Selenium WebDriver...")
+# Browser profiles selectable in setup_driver. "full" is the old windowed,
+# full-load Chrome; the others run headless (no display needed on servers).
+# With the eager/none strategies driver.get returns before subresources finish,
+# so callers rely on their explicit WebDriverWaits for the content they read
+# (navigate() covers the extra wait "none" needs).
+BROWSER_PROFILES = {
+    'full':     {'headless': False, 'page_load_strategy': 'normal', 'window_size': '1920,1080', 'background_networking': True},
+    'headless': {'headless': True,  'page_load_strategy': 'normal', 'window_size': '1920,1080', 'background_networking': True},
+    'eager':    {'headless': True,  'page_load_strategy': 'eager',  'window_size': '1366,768',  'background_networking': False},
+    'none':     {'headless': True,  'page_load_strategy': 'none',   'window_size': '1366,768',  'background_networking': False},
+}
+DEFAULT_BROWSER_PROFILE = 'eager'
+
+# Chrome's own background traffic (updates, sync, metrics, field trials) and
+# throttling of background tabs/timers
+NO_BACKGROUND_NETWORKING_ARGS = (
+    '--disable-background-networking',
+    '--disable-component-update',
+    '--disable-default-apps',
+    '--disable-sync',
+    '--disable-domain-reliability',
+    '--metrics-recording-only',
+    '--no-first-run',
+    '--disable-background-timer-throttling',
+    '--disable-renderer-backgrounding',
+    '--disable-backgrounding-occluded-windows',
+)
+
+
+# --- Persistent profiles and the browser daemon ----------------------------
+# With a user-data dir, cookies (including the bot-challenge ones) and Chrome's
+# HTTP cache survive between runs. Each concurrently running browser needs its
+# own dir, so a driver's `slot` (its process-wide pool slot; 0 otherwise) picks
+# <user_data_dir>/slot-<n>. With a debugger address, drivers attach to an
+# already running browser (see utils/browser_daemon) instead of launching one:
+# slot n attaches to port + n, and falls back to launching if nothing answers.
+USER_DATA_DIR = Path("./scrappy_RA/data_saved_locally/chrome_profile")
+DEBUGGER_ADDRESS = "127.0.0.1:9222"
+
+# Run-wide defaults for setup_driver's user_data_dir / debugger_address
+_BROWSER_DEFAULTS: Dict = {'user_data_dir': None, 'debugger_address': None}
+
+
+def configure_browsers(user_data_dir=None, debugger_address: Optional[str]=None) -> None:
+    """
+    Set the user-data dir and/or daemon address every setup_driver call in
+    this run uses unless it passes its own, e.g.
+    configure_browsers(USER_DATA_DIR, DEBUGGER_ADDRESS).
+    """
+    _BROWSER_DEFAULTS['user_data_dir'] = user_data_dir
+    _BROWSER_DEFAULTS['debugger_address'] = debugger_address
+
+
+def slot_profile_dir(user_data_dir, slot: int=0) -> Path:
+    """The profile directory a driver in `slot` uses."""
+    return (Path(user_data_dir) / f"slot-{slot}").resolve()
+
+
+def slot_address(debugger_address: str, slot: int=0) -> str:
+    """The remote-debugging address a driver in `slot` attaches to."""
+    host, port = debugger_address.rsplit(':', 1)
+    return f"{host}:{int(port) + slot}"
+
+
+def debugger_reachable(address: str, timeout: float=1.0) -> bool:
+    """True if a browser is answering on the remote-debugging `address`."""
+    try:
+        with urllib.request.urlopen(f"http://{address}/json/version", timeout=timeout) as response:
+            return response.status == 200
+    except (OSError, ValueError):
+        return False
+
+
+def chrome_arguments(profile: str=DEFAULT_BROWSER_PROFILE, headless: Optional[bool]=None) -> List[str]:
+    """Command-line switches for a Chrome using one of BROWSER_PROFILES."""
+    settings = BROWSER_PROFILES[profile]
+    if headless is None:
+        headless = settings['headless']
+    args = [
+        '--disable-blink-features=AutomationControlled',
+        '--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        f"--window-size={settings['window_size']}",
+        '--disable-dev-shm-usage',
+        '--no-sandbox',
+        '--disable-gpu',
+        '--disable-extensions',
+    ]
+    if headless:
+        args.insert(0, '--headless=new')
+    else:
+        args.append('--start-maximized')
+    if not settings['background_networking']:
+        args.extend(NO_BACKGROUND_NETWORKING_ARGS)
+    return args
+
+
+# --- Driver binary and launch accounting ----------------------------------
+
+@lru_cache(maxsize=None)
+def chromedriver_path() -> Optional[str]:
+    """
+    Resolve the chromedriver binary once per process: $CHROMEDRIVER, then PATH,
+    then webdriver_manager's cached download if that package is installed.
+    None leaves it to Selenium Manager, which re-resolves on every launch.
+    """
+    path = os.environ.get('CHROMEDRIVER') or shutil.which('chromedriver')
+    if path:
+        return path
+    try:
+        from webdriver_manager.chrome import ChromeDriverManager
+    except ImportError:
+        return None
+    try:
+        return ChromeDriverManager().install()
+    except Exception as e:
+        print(f"⚠ webdriver_manager could not fetch chromedriver ({e}); using Selenium Manager")
+        return None
+
+
+_LAUNCH_STATS = {'launched': 0, 'attached': 0, 'recycled': 0, 'seconds': 0.0}
+_LAUNCH_STATS_LOCK = threading.Lock()
+
+
+def report_launches() -> None:
+    """Print how many browsers this run started (or attached to) and the time it took."""
+    with _LAUNCH_STATS_LOCK:
+        stats = dict(_LAUNCH_STATS)
+    n = stats['launched'] + stats['attached']
+    if not n:
+        return
+    print(f"\nBrowsers: {stats['launched']} launched, {stats['attached']} attached, "
+          f"{stats['recycled']} recycled, "
+          f"{stats['seconds']:.1f}s total start-up ({stats['seconds'] / n:.1f}s each)")
+
+
+def setup_driver(profile: str=DEFAULT_BROWSER_PROFILE, headless: Optional[bool]=None,
+                 block_resources: bool=True, block_stylesheets: bool=False,
+                 resource_allowlist=RESOURCE_ALLOWLIST, capture_network: bool=False,
+                 user_data_dir=None, debugger_address: Optional[str]=None, slot: int=0):
+    """
+    Setup and return a configured Selenium WebDriver using one of
+    BROWSER_PROFILES (`headless` overrides the profile's setting). With
+    `block_resources`, images, media, fonts and tracker requests are dropped
+    (see apply_resource_blocking); `block_stylesheets` drops CSS too, which can
+    break pages whose scrolling or clicks depend on layout. `capture_network`
+    turns on Chrome's performance log so responses can be read back with
+    NetworkCapture.
+
+    `user_data_dir` keeps a persistent profile and `debugger_address` attaches
+    to a running browser instead of launching one (both default to
+    configure_browsers(); see slot_profile_dir / slot_address for `slot`).
+    """
+    start = time.perf_counter()
+    settings = BROWSER_PROFILES[profile]
+    if user_data_dir is None:
+        user_data_dir = _BROWSER_DEFAULTS['user_data_dir']
+    if debugger_address is None:
+        debugger_address = _BROWSER_DEFAULTS['debugger_address']
+
     chrome_options = Options()
-    
-    # Your good Chrome options
-    chrome_options.add_argument('--disable-blink-features=AutomationControlled')
-    chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-    chrome_options.add_experimental_option('useAutomationExtension', False)
-    chrome_options.add_argument('--window-size=1920,1080')
-    chrome_options.add_argument('--start-maximized')
-    chrome_options.add_argument('--disable-dev-shm-usage')
-    chrome_options.add_argument('--no-sandbox')
-    chrome_options.add_argument('--disable-gpu')
-    chrome_options.add_argument('--disable-extensions')
-    
-    prefs = {
-        "profile.default_content_setting_values.notifications": 2,
-        "credentials_enable_service": False,
-        "profile.password_manager_enabled": False,
-        "intl.accept_languages": "en-US,en"
-    }
-    chrome_options.add_experimental_option("prefs", prefs)
-    
-    driver = webdriver.Chrome(options=chrome_options)
+    chrome_options.page_load_strategy = settings['page_load_strategy']
+    if capture_network:
+        chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+
+    address = slot_address(debugger_address, slot) if debugger_address else None
+    attached = bool(address and debugger_reachable(address))
+    if attached:
+        # The running browser already has its switches; chromedriver rejects
+        # most launch-only options when attaching
+        print(f"Attaching Selenium WebDriver to the browser at {address}...")
+        chrome_options.debugger_address = address
+    else:
+        if address:
+            print(f"⚠ No browser listening at {address}; launching one.")
+        print(f"Setting up Selenium WebDriver ({profile} profile)...")
+        for arg in chrome_arguments(profile, headless):
+            chrome_options.add_argument(arg)
+        if user_data_dir:
+            profile_dir = slot_profile_dir(user_data_dir, slot)
+            profile_dir.mkdir(parents=True, exist_ok=True)
+            chrome_options.add_argument(f"--user-data-dir={profile_dir}")
+            chrome_options.add_argument('--hide-crash-restore-bubble')
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        chrome_options.add_experimental_option('useAutomationExtension', False)
+
+        prefs = {
+            "profile.default_content_setting_values.notifications": 2,
+            "credentials_enable_service": False,
+            "profile.password_manager_enabled": False,
+            "intl.accept_languages": "en-US,en"
+        }
+        if block_resources:
+            prefs.update(image_blocking_prefs(resource_allowlist))
+        chrome_options.add_experimental_option("prefs", prefs)
+        if capture_network:
+            chrome_options.add_experimental_option('perfLoggingPrefs', {'enableNetwork': True, 'enablePage': False})
+
+    service = Service(executable_path=chromedriver_path()) if chromedriver_path() else None
+    driver = webdriver.Chrome(options=chrome_options, service=service)
+    if block_resources:
+        apply_resource_blocking(driver, block_stylesheets, resource_allowlist)
     
     # Let selenium-stealth handle the heavy lifting
     stealth(driver,
@@ -80,16 +423,620 @@ def setup_driver():
         renderer="Intel Iris OpenGL Engine",
         fix_hairline=True,
     )
-    
+
+    with _LAUNCH_STATS_LOCK:
+        _LAUNCH_STATS['attached' if attached else 'launched'] += 1
+        _LAUNCH_STATS['seconds'] += time.perf_counter() - start
     return driver
 
 
-def get_soup_selenium(
+def navigate(driver, url: str, wait_time: int=30) -> None:
+    """
+    driver.get(url). Under the "none" page-load strategy get() returns before
+    the new document exists, so also wait until it has replaced the old one
+    (otherwise a following wait could match elements on the previous page).
+
+    A PooledDriver that is due for recycling (see DriverHealth) gets a fresh
+    browser first, and one whose browser fails the load is recycled and the
+    load retried once. A fresh browser is warmed up for the host (see
+    BrowserManager.warm_up) before loading the page, so it isn't met by the
+    bot challenge without cookies.
+    """
+    if not isinstance(driver, PooledDriver):
+        _navigate(driver, url, wait_time)
+        return
+    if driver.maybe_recycle():
+        _rewarm(driver, url)
+    try:
+        _navigate(driver, url, wait_time)
+    except TimeoutException:
+        note_page(driver, timed_out=True)
+        raise
+    except WebDriverException as e:
+        driver.recycle(f"error: {str(e).splitlines()[0]}")
+        _rewarm(driver, url)
+        _navigate(driver, url, wait_time)
+
+
+def _rewarm(driver: "PooledDriver", url: str) -> None:
+    """Warm a just-recycled browser up for `url`'s host (not from within a warm-up)."""
+    if driver.warming:
+        return
+    driver.warming = True
+    try:
+        get_browser_manager().warm_up(driver, url)
+    finally:
+        driver.warming = False
+
+
+def _navigate(driver, url: str, wait_time: int) -> None:
+    if driver.capabilities.get('pageLoadStrategy') != 'none':
+        driver.get(url)
+        return
+    try:
+        driver.execute_script("window.__scrappyStale = true")
+    except WebDriverException:
+        pass
+    driver.get(url)
+    WebDriverWait(driver, wait_time).until(
+        lambda d: d.execute_script("return !window.__scrappyStale && document.readyState !== 'loading'")
+    )
+
+
+# --- Driver health -----------------------------------------------------------
+# Chrome renderers grow over long sessions, and a crashed or hung browser only
+# fails one call at a time. Pooled drivers are therefore replaced, before
+# their next page load, once they have served RECYCLE_AFTER_PAGES pages, their
+# page's JS heap (CDP Performance.getMetrics; sampled every HEAP_CHECK_EVERY
+# pages) passes MAX_HEAP_MB, or MAX_TIMEOUTS_IN_A_ROW loads in a row timed out;
+# and at once when a load fails with a WebDriverException (see navigate).
+RECYCLE_AFTER_PAGES = 150
+MAX_HEAP_MB = 768
+MAX_TIMEOUTS_IN_A_ROW = 3
+HEAP_CHECK_EVERY = 10
+
+
+class DriverHealth:
+    """Wear on one browser: pages served, consecutive timeouts, last heap sample."""
+
+    def __init__(self):
+        self.pages = 0
+        self.timeouts_in_a_row = 0
+        self.heap_mb: Optional[float] = None
+
+    def recycle_reason(self) -> Optional[str]:
+        """Why the browser should be replaced now, or None."""
+        if self.pages >= RECYCLE_AFTER_PAGES:
+            return f"{self.pages} pages served"
+        if self.heap_mb is not None and self.heap_mb > MAX_HEAP_MB:
+            return f"JS heap at {self.heap_mb:.0f} MB"
+        if self.timeouts_in_a_row >= MAX_TIMEOUTS_IN_A_ROW:
+            return f"{self.timeouts_in_a_row} timeouts in a row"
+        return None
+
+
+def heap_mb(driver) -> Optional[float]:
+    """The current page's total JS heap in MB (CDP Performance.getMetrics), or None."""
+    try:
+        driver.execute_cdp_cmd('Performance.enable', {})
+        metrics = driver.execute_cdp_cmd('Performance.getMetrics', {})['metrics']
+    except (WebDriverException, KeyError):
+        return None
+    values = {m['name']: m['value'] for m in metrics}
+    return values['JSHeapTotalSize'] / 2**20 if 'JSHeapTotalSize' in values else None
+
+
+def note_page(driver, timed_out: bool=False) -> None:
+    """Count a page load against a pooled driver's health (no-op for other drivers)."""
+    if not isinstance(driver, PooledDriver):
+        return
+    health = driver.health
+    health.pages += 1
+    health.timeouts_in_a_row = health.timeouts_in_a_row + 1 if timed_out else 0
+    if health.pages % HEAP_CHECK_EVERY == 0:
+        health.heap_mb = heap_mb(driver)
+
+
+class PooledDriver:
+    """
+    A driver leased from a DriverPool. Attribute access goes to the current
+    WebDriver, so it can be passed anywhere a driver is expected; recycle()
+    swaps a fresh browser in underneath.
+    """
+
+    def __init__(self, pool: "DriverPool", driver):
+        self._pool = pool
+        self.webdriver = driver
+        self.warming = False  # inside a warm-up, which mustn't start another
+
+    def __getattr__(self, name):
+        if name == 'webdriver':  # not set yet (e.g. while unpickling)
+            raise AttributeError(name)
+        return getattr(self.webdriver, name)
+
+    @property
+    def health(self) -> DriverHealth:
+        return self._pool.health(self.webdriver)
+
+    def recycle(self, reason: str) -> None:
+        """Quit the current browser and start a replacement in its slot."""
+        print(f"\n↻ Recycling browser ({reason})")
+        self._pool._discard(self.webdriver, replace=True)
+        self.webdriver = self._pool._start_driver()
+        with _LAUNCH_STATS_LOCK:
+            _LAUNCH_STATS['recycled'] += 1
+
+    def maybe_recycle(self) -> bool:
+        """Recycle the browser if it is worn out; True if it was."""
+        reason = self.health.recycle_reason()
+        if reason:
+            self.recycle(reason)
+        return bool(reason)
+
+
+# Upper bound on browsers per pool - each Chrome costs a few hundred MB
+MAX_POOL_SIZE = 6
+
+
+class _SlotAllocator:
+    """
+    Hands out the lowest free slot number. One allocator is shared by every
+    DriverPool in the process, so browsers in different pools (e.g. the
+    BrowserManager's default and capture_network pools) never get the same
+    profile dir or daemon port.
+    """
+
+    def __init__(self):
+        self._in_use: set = set()
+        self._lock = threading.Lock()
+
+    def take(self) -> int:
+        with self._lock:
+            slot = next(n for n in range(len(self._in_use) + 1) if n not in self._in_use)
+            self._in_use.add(slot)
+            return slot
+
+    def give(self, slot: int) -> None:
+        with self._lock:
+            self._in_use.discard(slot)
+
+
+_BROWSER_SLOTS = _SlotAllocator()
+
+
+class DriverPool:
+    """
+    A capped pool of Selenium drivers for running searches in parallel. Drivers
+    are started on demand (up to `size`, with the given browser profile) and
+    handed out one caller at a time:
+
+        with DriverPool(size=3) as pool:
+            with pool.lease() as driver:
+                ...
+
+    A driver is health-checked before every lease; one that no longer responds
+    (crashed renderer, closed window) is quit and replaced. Leases hand out a
+    PooledDriver, which also replaces worn-out browsers mid-lease (see
+    DriverHealth). Each driver holds a
+    numbered slot while it runs, unique across all pools, so that concurrent
+    browsers get their own profile directory / daemon port (see setup_driver).
+    """
+    def __init__(self, size: int=3, profile: str=DEFAULT_BROWSER_PROFILE, **driver_options):
+        self.size = max(1, min(size, MAX_POOL_SIZE))
+        self.profile = profile
+        self.driver_options = driver_options  # passed on to setup_driver
+        self._idle: queue.Queue = queue.Queue()
+        self._drivers: List = []
+        self._slots: Dict[int, int] = {}  # id(driver) -> slot (from _BROWSER_SLOTS)
+        self._health: Dict[int, DriverHealth] = {}  # id(driver) -> wear
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def _start_driver(self):
+        """Start a driver into a slot already reserved (as None) in self._drivers."""
+        slot = _BROWSER_SLOTS.take()
+        try:
+            driver = setup_driver(self.profile, slot=slot, **self.driver_options)
+        except Exception:
+            with self._lock:
+                self._drivers.remove(None)
+            _BROWSER_SLOTS.give(slot)
+            raise
+        with self._lock:
+            self._drivers[self._drivers.index(None)] = driver
+            self._slots[id(driver)] = slot
+            self._health[id(driver)] = DriverHealth()
+        return driver
+
+    def health(self, driver) -> DriverHealth:
+        """The wear record of one of this pool's drivers."""
+        with self._lock:
+            return self._health.setdefault(id(driver), DriverHealth())
+
+    def _discard(self, driver, replace: bool=False) -> None:
+        """Quit `driver`, keeping its slot reserved if it is about to be replaced."""
+        with self._lock:
+            if driver in self._drivers:
+                i = self._drivers.index(driver)
+                if replace:
+                    self._drivers[i] = None
+                else:
+                    del self._drivers[i]
+            slot = self._slots.pop(id(driver), None)
+            self._health.pop(id(driver), None)
+        if slot is not None:
+            _BROWSER_SLOTS.give(slot)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    @staticmethod
+    def is_healthy(driver) -> bool:
+        """True if the driver's browser still answers a trivial script."""
+        try:
+            driver.execute_script("return document.readyState")
+            return True
+        except WebDriverException:
+            return False
+
+    def acquire(self, timeout: Optional[float]=None):
+        """Take an idle driver, starting one if under the size cap, else wait for a return."""
+        try:
+            driver = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                can_grow = len(self._drivers) < self.size
+                if can_grow:
+                    self._drivers.append(None)  # reserve the slot before the slow start-up
+            if can_grow:
+                return self._start_driver()
+            driver = self._idle.get(timeout=timeout)
+
+        if not self.is_healthy(driver):
+            print("⚠ Pooled driver stopped responding; replacing it.")
+            self._discard(driver, replace=True)
+            driver = self._start_driver()
+        return driver
+
+    def release(self, driver, healthy: bool=True) -> None:
+        """Return a leased driver; unhealthy ones are quit instead of reused."""
+        if healthy:
+            self._idle.put(driver)
+        else:
+            self._discard(driver)
+
+    @contextmanager
+    def lease(self, timeout: Optional[float]=None) -> Iterator["PooledDriver"]:
+        driver = PooledDriver(self, self.acquire(timeout))
+        try:
+            yield driver
+        except BaseException:
+            self.release(driver.webdriver, healthy=self.is_healthy(driver.webdriver))
+            raise
+        else:
+            self.release(driver.webdriver)
+
+    def map(self, fn: Callable, items: List, workers: Optional[int]=None) -> List:
+        """
+        Run `fn(driver, item)` for every item across the pool (at most
+        `workers` at a time, default the pool size), each call on its own
+        leased driver. Results are returned in `items` order.
+        """
+        def run(item):
+            with self.lease() as driver:
+                return fn(driver, item)
+
+        workers = max(1, min(workers or self.size, self.size, len(items) or 1))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(run, items))
+
+    def close(self) -> None:
+        """Quit every driver the pool started."""
+        with self._lock:
+            drivers = [d for d in self._drivers if d is not None]
+            self._drivers = []
+            slots = list(self._slots.values())
+            self._slots = {}
+            self._health = {}
+        for slot in slots:
+            _BROWSER_SLOTS.give(slot)
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                print(f"Warning: Error closing driver - {e}")
+        if drivers:
+            print(f"✓ Closed {len(drivers)} pooled browser(s)")
+
+
+# --- Run-scoped browser manager ---------------------------------------------
+# One set of browsers for the whole run: every module and stage borrows from
+# the manager instead of starting (and quitting) its own, so a run pays for
+# each launch and each site's bot challenge once. Drivers with different
+# options (e.g. capture_network) come from separate pools.
+
+class BrowserManager:
+    def __init__(self, size: int=3, profile: str=DEFAULT_BROWSER_PROFILE):
+        self.size = size
+        self.profile = profile
+        self._pools: Dict[tuple, DriverPool] = {}
+        self._warmed = weakref.WeakKeyDictionary()  # driver -> hosts warmed up
+        self._lock = threading.Lock()
+
+    def pool(self, **driver_options) -> DriverPool:
+        """The shared pool of drivers started with `driver_options` (see setup_driver)."""
+        key = tuple(sorted(driver_options.items()))
+        with self._lock:
+            if key not in self._pools:
+                self._pools[key] = DriverPool(self.size, self.profile, **driver_options)
+            return self._pools[key]
+
+    def warm_up(self, driver, url: str, wait_time: int=30) -> bool:
+        """
+        Load `url`'s site root in `driver` once, waiting for any bot challenge
+        to clear, so later pages on that host start with its cookies. Returns
+        False if the challenge didn't clear (it will be tried again next time).
+        """
+        parts = urlparse(url)
+        browser = driver.webdriver if isinstance(driver, PooledDriver) else driver
+        with self._lock:
+            hosts = self._warmed.setdefault(browser, set())
+            if parts.netloc in hosts:
+                return True
+
+        print(f"Warming up {parts.netloc}...")
+        limiter = rate_limiter.get_limiter(url)
+        limiter.acquire()
+        start = time.perf_counter()
+        try:
+            navigate(driver, f"{parts.scheme}://{parts.netloc}/", wait_time)
+            deadline = time.monotonic() + wait_time
+            while page_challenged(driver) and time.monotonic() < deadline:
+                time.sleep(0.5)
+            cleared = not page_challenged(driver)
+            note_page(driver, timed_out=not cleared)
+        except WebDriverException as e:
+            print(f"⚠ Warm-up failed: {str(e).splitlines()[0]}")
+            cleared = False
+        limiter.record(time.perf_counter() - start, challenged=not cleared)
+
+        if cleared:
+            with self._lock:
+                hosts.add(parts.netloc)
+        return cleared
+
+    @contextmanager
+    def lease(self, warm_url: Optional[str]=None, **driver_options) -> Iterator:
+        """Borrow a driver (warmed up for `warm_url`'s host, if given) for a `with` block."""
+        with self.pool(**driver_options).lease() as driver:
+            if warm_url:
+                self.warm_up(driver, warm_url)
+            yield driver
+
+    def map(self, fn: Callable, items: List, workers: Optional[int]=None,
+            warm_url: Optional[str]=None, **driver_options) -> List:
+        """DriverPool.map on the shared pool, warming each driver up for `warm_url` first."""
+        def run(driver, item):
+            if warm_url:
+                self.warm_up(driver, warm_url)
+            return fn(driver, item)
+
+        return self.pool(**driver_options).map(run, items, workers)
+
+    def close(self) -> None:
+        """Quit every browser the run started."""
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools = {}
+        for pool in pools:
+            pool.close()
+
+
+_BROWSER_MANAGER: Optional[BrowserManager] = None
+_BROWSER_MANAGER_LOCK = threading.Lock()
+
+
+def get_browser_manager() -> BrowserManager:
+    """Return the run's browser manager, creating it on first use (closed at exit)."""
+    global _BROWSER_MANAGER
+    with _BROWSER_MANAGER_LOCK:
+        if _BROWSER_MANAGER is None:
+            _BROWSER_MANAGER = BrowserManager()
+            atexit.register(_BROWSER_MANAGER.close)
+        return _BROWSER_MANAGER
+
+
+# PeopleSoft result grids: one <li class="ps_grid-row"> per job. The count is
+# read from the last number in the results header ("237 Jobs Found", "1-50 of
+# 237"); if no element matches, loading ends after `no_change_threshold` idle
+# scrolls instead.
+PS_ROW_SELECTOR = "li.ps_grid-row"
+PS_RESULTS_COUNT_SELECTOR = "[id*='JOB_COUNT'], [id*='JOBCOUNT'], [id*='RSLT_COUNT']"
+
+
+# --- In-browser extraction -------------------------------------------------
+# A scraper's extract_spec names its result rows and, per field, where to find
+# the value inside a row, so one execute_script call returns just the rows as
+# JSON instead of shipping the whole page source to be parsed here:
+#
+#   {'row': css, 'row_id_re': regex or None, 'next': css or None,
+#    'fields': {name: {'sel': css | [css, css, ...] | None,   # None = the row
+#                      'id_re': regex,   # first match of the last css whose id matches
+#                      'kind': 'text' | 'raw_text' | 'lines' | 'children' | 'attr:NAME'}}}
+#
+# Kinds mirror what the parse_page methods read with BeautifulSoup:
+#   text      get_text(strip=True)
+#   raw_text  get_text()
+#   lines     get_text('|', strip=True) split on '|'
+#   children  each direct child's stripped text, skipping <br>
+#   attr:NAME the attribute's value
+# A field whose element isn't there comes back as null (None).
+_EXTRACT_ROWS_JS = """
+const [spec] = arguments;
+const SKIP = new Set(['SCRIPT', 'STYLE', 'TEMPLATE']);
+const strings = (node) => {
+  const out = [];
+  const walker = document.createTreeWalker(node, NodeFilter.SHOW_TEXT);
+  for (let n = walker.nextNode(); n; n = walker.nextNode()) {
+    if (n.parentElement && SKIP.has(n.parentElement.tagName)) continue;
+    const t = n.data.trim();
+    if (t) out.push(t);
+  }
+  return out;
+};
+const locate = (row, field) => {
+  const sels = field.sel == null ? [] : [].concat(field.sel);
+  let el = row;
+  sels.forEach((sel, i) => {
+    if (!el) return;
+    if (field.id_re && i === sels.length - 1) {
+      const re = new RegExp(field.id_re);
+      el = Array.from(el.querySelectorAll(sel)).find(e => re.test(e.id)) || null;
+    } else {
+      el = el.querySelector(sel);
+    }
+  });
+  return el;
+};
+const value = (el, kind) => {
+  if (!el) return null;
+  if (kind === 'text') return strings(el).join('');
+  if (kind === 'raw_text') return el.textContent;
+  if (kind === 'lines') return strings(el).join('|').split('|').map(p => p.trim()).filter(p => p);
+  if (kind === 'children') {
+    const out = [];
+    for (const c of el.childNodes) {
+      let t = '';
+      if (c.nodeType === Node.ELEMENT_NODE) {
+        if (c.tagName === 'BR') continue;
+        t = strings(c).join('');
+      } else if (c.nodeType === Node.TEXT_NODE || c.nodeType === Node.COMMENT_NODE) {
+        t = c.data.trim();
+      }
+      if (t) out.push(t);
+    }
+    return out;
+  }
+  if (kind.startsWith('attr:')) return el.getAttribute(kind.slice(5));
+  return null;
+};
+let rows = Array.from(document.querySelectorAll(spec.row));
+if (spec.row_id_re) {
+  const re = new RegExp(spec.row_id_re);
+  rows = rows.filter(r => re.test(r.id));
+}
+return {
+  rows: rows.map(row => {
+    const out = {};
+    for (const [name, field] of Object.entries(spec.fields)) {
+      out[name] = value(locate(row, field), field.kind || 'text');
+    }
+    return out;
+  }),
+  has_next: spec.next ? document.querySelector(spec.next) !== null : false,
+};
+"""
+
+
+def extract_rows(driver, spec: Dict) -> Optional[Dict]:
+    """
+    Run an extract_spec against the page loaded in `driver`. Returns
+    {'rows': [{field: value}], 'has_next': bool}, or None if the script failed.
+    """
+    try:
+        return driver.execute_script(_EXTRACT_ROWS_JS, spec)
+    except WebDriverException as e:
+        print(f"\n⚠ In-browser extraction failed: {str(e).splitlines()[0]}")
+        return None
+
+
+# The PeopleSoft candidate-gateway result grid (Berkeley, Idealist)
+PS_EXTRACT_SPEC = {
+    'row': PS_ROW_SELECTOR,
+    'row_id_re': r'^HRS_AGNT_RSLT_I\$\d+_row_\d+$',
+    'fields': {
+        'title': {'sel': 'span', 'id_re': r'^SCH_JOB_TITLE\$\d+$'},
+        'job_id': {'sel': 'span', 'id_re': r'^HRS_APP_JBSCH_I_HRS_JOB_OPENING_ID\$\d+$'},
+        'location': {'sel': 'span', 'id_re': r'^LOCATION\$\d+$'},
+        'department': {'sel': 'span', 'id_re': r'^HRS_APP_JBSCH_I_HRS_DEPT_DESCR\$\d+$'},
+        'posted_date': {'sel': 'span', 'id_re': r'^SCH_OPENED\$\d+$'},
+        'onclick': {'sel': None, 'kind': 'attr:onclick'},
+    },
+    'next': "a[rel~='next']",
+}
+
+
+def ps_jobs_from_rows(rows: List[Dict], base_url: str) -> List[Dict]:
+    """
+    Build job records from grid rows extracted with PS_EXTRACT_SPEC, the same
+    way the PeopleSoft scrapers' parse_page does from the soup.
+    """
+    print(f"Found {len(rows)} jobs on this page")
+
+    jobs_on_page = []
+    for row in rows:
+        job_data = {
+            'title': '',
+            'job_id': '',
+            'location': row['location'] or '',
+            'department': row['department'] or '',
+            'posted_date': row['posted_date'] or '',
+            'url': ''
+        }
+
+        # Some titles have the job ID embedded ("Title, Job ID 82838")
+        full_title = row['title']
+        if full_title is not None:
+            job_data['title'] = full_title
+            job_id_match = re.search(r',\s*Job ID\s+(\d+)$', full_title)
+            if job_id_match:
+                job_data['job_id'] = job_id_match.group(1)
+                job_data['title'] = re.sub(r',\s*Job ID\s+\d+$', '', full_title).strip()
+        else:
+            print(row)
+
+        # The dedicated Job ID field wins when it isn't blank
+        job_data['job_id'] = row['job_id'] or job_data['job_id']
+
+        if row['onclick'] and job_data['job_id']:
+            job_data['url'] = f"{base_url}?JobCode={job_data['job_id']}"
+
+        if job_data['title'] or job_data['job_id']:
+            jobs_on_page.append(job_data)
+        else:
+            print("Warning: Skipping job record with no title or job ID")
+
+    return jobs_on_page
+
+
+def get_soup_selenium(driver, url, *args, features: str="html.parser", parse_only=None, **kwargs):
+    """
+    Load a URL in Selenium (see get_html_selenium) and return BeautifulSoup.
+    The page source is parsed with the `features` backend, restricted to
+    `parse_only` (a SoupStrainer) if given.
+    """
+    html = get_html_selenium(driver, url, *args, **kwargs)
+    return gen_utils.make_soup(html, features, parse_only)
+
+
+def get_html_selenium(driver, url, *args, **kwargs) -> str:
+    """Load a URL in Selenium (see load_page_selenium) and return the page source."""
+    load_page_selenium(driver, url, *args, **kwargs)
+    return driver.page_source
+
+
+def load_page_selenium(
     driver,
     url,
     wait_selectors=None,
     wait_time=30,
-    sleep_time=[1.5, 3],
     enable_scroll=True,
     scroll_container_id: str="win0divHRS_AGNT_RSLT_I$grid$0",
     enable_search_box=False,
@@ -97,21 +1044,29 @@ def get_soup_selenium(
     search_button_id: str='HRS_SCH_WRK_FLU_HRS_SEARCH_BTN',
     search_kw: str='data',
     no_results_id: str='win0divHRS_SCH_WRK_HRS_CC_NO_RSLT',
-    save_debug_html=True
-    ):
+    save_debug_html=True,
+    scroll_row_selector: str=PS_ROW_SELECTOR,
+    scroll_count_selector: Optional[str]=PS_RESULTS_COUNT_SELECTOR,
+    scroll_end_selector: Optional[str]=None
+    ) -> bool:
     """
-    Load a URL in Selenium, wait for an element, return BeautifulSoup.
+    Load a URL in Selenium and wait for an element, running the search box and
+    infinite scroll if enabled. The page is left in the driver for the caller
+    to read (page_source, or extract_rows without serializing it). Returns
+    False if there is nothing worth reading: the wait timed out, or the search
+    failed or found no results.
+    The load is paced by, and its latency reported to, the host's rate limiter.
+    With save_debug_html the page is offered to debug_capture's sampling;
+    timeouts and failed searches/scrolls are captured regardless.
     """
     # Navigate to the URL
-    driver.get(url)
+    limiter = rate_limiter.get_limiter(url)
+    limiter.acquire()
+    start = time.perf_counter()
+    navigate(driver, url, wait_time)
 
-    # Save the page source for debugging
-    if save_debug_html:
-        with open(f'selenium_page_init.html', 'w', encoding='utf-8') as f:
-            f.write(driver.page_source)
-        print(f"\nSaved page source to selenium_page_init.html")
-    
     # Wait for job records to load - try multiple selectors                
+    timed_out = False
     try:
         if wait_selectors:
             WebDriverWait(driver, wait_time).until(
@@ -119,8 +1074,10 @@ def get_soup_selenium(
             )
             
     except TimeoutException:
+        timed_out = True
         print("Timeout waiting for job records to load")
-        print("If enabled, check selenium_page.html to see what loaded")
+    limiter.record(time.perf_counter() - start, challenged=page_challenged(driver))
+    record_page_weight(driver)
     
     # Wait for and interact with search box
     if enable_search_box:
@@ -136,32 +1093,92 @@ def get_soup_selenium(
                 )
             print(f"kw_has_results: {kw_has_results}")
             if not kw_has_results:
-                soup = BeautifulSoup(driver.page_source, 'html.parser')
-                return soup
+                note_page(driver)
+                return False
+            timed_out = False  # the results the search waited for are in
                     
         except Exception as e:
             print(f"Search did not work: {e}")
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
-            return soup
+            note_page(driver, timed_out)
+            debug_capture.capture(url, "search", driver=driver, error=True)
+            return False
         
     
     # Scroll down page to load all jobs    
     if enable_scroll:
         print("Starting to scroll and load all jobs...")
         try:
-            n_jobs_top_to_bottom = scroll_and_load_all(driver, scroll_container_id)
+            n_jobs_top_to_bottom = scroll_and_load_all(
+                driver, scroll_container_id, wait_time=wait_time,
+                row_selector=scroll_row_selector, count_selector=scroll_count_selector,
+                end_selector=scroll_end_selector
+                )
             print(f"{n_jobs_top_to_bottom} found")
             
         except Exception as e:
             print(f"Scroll Error: {e}")
-            
-    else:
-        time.sleep(random.uniform(sleep_time[0], sleep_time[1]))
-    
-    # Get page source and parse with BeautifulSoup
-    soup = BeautifulSoup(driver.page_source, 'html.parser')
-    
-    return soup
+            debug_capture.capture(url, "scroll", driver=driver, error=True)
+
+    # Judge the page on its final state: a search page's first wait times out
+    # until the search brings the results in
+    note_page(driver, timed_out)
+
+    # Keep the page for debugging: always on a timeout, sampled otherwise
+    if timed_out:
+        if debug_capture.capture(url, "timeout", driver=driver, error=True):
+            print(f"  Saved the page to {debug_capture.get_debug_capture().capture_dir}")
+    elif save_debug_html:
+        debug_capture.capture(url, "page", driver=driver)
+
+    return not timed_out
+
+
+# Waits out a PeopleSoft search postback: resolves once the processing
+# indicator is gone and either a fresh results element or the no-results
+# message is in the DOM ("fresh" = not one tagged as stale before the click).
+_SEARCH_POSTBACK_JS = """
+const [resultsSel, noResultsId, busySel, timeoutMs, done] = arguments;
+const visible = (el) => el.getClientRects().length > 0 && getComputedStyle(el).visibility !== 'hidden';
+const busy = () => Array.from(document.querySelectorAll(busySel)).some(visible);
+const classify = () => {
+  const none = document.getElementById(noResultsId);
+  if (none && !none.__scrappyStale) return 'none';
+  const results = document.querySelector(resultsSel);
+  if (results && !results.__scrappyStale) return 'results';
+  return null;
+};
+let finished = false, sawBusy = false, timer = null;
+const observer = new MutationObserver(check);
+function finish(outcome) {
+  if (finished) return;
+  finished = true;
+  observer.disconnect();
+  clearTimeout(timer);
+  done({outcome: outcome, saw_busy: sawBusy});
+}
+function check() {
+  if (busy()) { sawBusy = true; return; }
+  const outcome = classify();
+  if (outcome) finish(outcome);
+}
+observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true, attributeFilter: ['style', 'class']});
+timer = setTimeout(() => finish(null), timeoutMs);
+check();
+"""
+
+_MARK_STALE_JS = """
+const [resultsSel, noResultsId] = arguments;
+document.querySelectorAll(resultsSel).forEach((el) => { el.__scrappyStale = true; });
+const none = document.getElementById(noResultsId);
+if (none) none.__scrappyStale = true;
+"""
+
+# PeopleSoft's "Processing..." overlays (classic and fluid)
+PS_BUSY_SELECTOR = "#processing, #WAIT_win0, #pt_processing"
+
+# Click-to-classified time of every search-box search this run
+_SEARCH_LATENCIES: List[float] = []
+_SEARCH_LATENCIES_LOCK = threading.Lock()
 
 
 def get_search_box_results(
@@ -171,8 +1188,16 @@ def get_search_box_results(
     search_kw,
     no_results_id,
     wait_selectors,   # <-- you set this
-    wait_time=10
+    wait_time=10,
+    postback_timeout=20,
+    busy_selector=PS_BUSY_SELECTOR
 ):
+    """
+    Type `search_kw` into the search box, submit, and wait for the postback:
+    returns True if results came back, False for no results. The wait is
+    event-driven (see _SEARCH_POSTBACK_JS) rather than a fixed countdown, and
+    each search's latency is recorded for report_search_latencies().
+    """
     print(f"Searching for: {search_kw}")
 
     # Type search kw
@@ -182,214 +1207,344 @@ def get_search_box_results(
     search_box.clear()
     search_box.send_keys(search_kw)
 
-    # Click search
-    driver.find_element(By.ID, search_button_id).click()
-
-    # Wait for page load
-    total_seconds = 10
-    for i in range(total_seconds, 0, -1):
-        print(f"Waiting... {i} seconds remaining ", end="\r")
-        time.sleep(1)
+    # Anything already on the page belongs to the previous state
+    driver.execute_script(_MARK_STALE_JS, wait_selectors, no_results_id)
 
-    # Race: either results OR no-results
+    # Click search and wait for the postback to land
+    driver.find_element(By.ID, search_button_id).click()
+    start = time.perf_counter()
+    driver.set_script_timeout(postback_timeout + 5)
     try:
-        WebDriverWait(driver, wait_time).until(
-            lambda d: (
-                d.find_elements(By.CSS_SELECTOR, wait_selectors) or
-                d.find_elements(By.ID, no_results_id)
-            )
+        status = driver.execute_async_script(
+            _SEARCH_POSTBACK_JS, wait_selectors, no_results_id, busy_selector, int(postback_timeout * 1000)
         )
-    except TimeoutException:
-        print("⚠ Neither results nor no-results appeared — treating as NO RESULTS.")
+    except WebDriverException:
+        status = {'outcome': None, 'saw_busy': False}
+    latency = time.perf_counter() - start
+    with _SEARCH_LATENCIES_LOCK:
+        _SEARCH_LATENCIES.append(latency)
+
+    if status['outcome'] == 'none':
+        print(f"No results found ({latency:.1f}s).")
         return False
+    if status['outcome'] == 'results':
+        print(f"Results found ({latency:.1f}s).")
+        return True
 
-    # Final classification
+    # Timed out waiting for a fresh state: fall back to what is on the page
     if driver.find_elements(By.ID, no_results_id):
         print("No results found.")
         return False
-
     if driver.find_elements(By.CSS_SELECTOR, wait_selectors):
         print("Results found.")
         return True
 
-    print("⚠ Unexpected state — treating as NO RESULTS.")
+    print("⚠ Neither results nor no-results appeared — treating as NO RESULTS.")
     return False
+
+
+def report_search_latencies() -> None:
+    """Print the distribution of search-box postback latencies seen this run."""
+    with _SEARCH_LATENCIES_LOCK:
+        latencies = sorted(_SEARCH_LATENCIES)
+    if not latencies:
+        return
+    pick = lambda q: latencies[min(len(latencies) - 1, int(q * len(latencies)))]
+    print(f"\nSearch-box latency over {len(latencies)} searches: "
+          f"median {pick(0.5):.1f}s, p90 {pick(0.9):.1f}s, max {latencies[-1]:.1f}s")
         
 
-def scroll_and_load_all(driver, scroll_container_id=None, max_scrolls=100, wait_time=15, 
-                        no_change_threshold=3, poll_frequency=0.5, verbose=False):
+# In-page loader for one scroll step: scrolls the container (or page) and
+# resolves as soon as a MutationObserver sees new result rows attach, or the
+# end sentinel appear, or after timeoutMs. Only a small status object crosses
+# the WebDriver wire, never the DOM.
+_SCROLL_STEP_JS = """
+const [containerId, rowSel, countSel, endSel, timeoutMs, done] = arguments;
+const container = containerId ? document.getElementById(containerId) : null;
+const root = container || document.body;
+const countRows = () => root.querySelectorAll(rowSel).length;
+const readTotal = () => {
+  const el = countSel ? document.querySelector(countSel) : null;
+  const nums = el ? el.textContent.replace(/,/g, '').match(/\\d+/g) : null;
+  return nums ? parseInt(nums[nums.length - 1], 10) : null;
+};
+const atEnd = () => !!(endSel && document.querySelector(endSel));
+const before = countRows();
+const status = () => ({rows: countRows(), total: readTotal(), ended: atEnd(), grew: countRows() > before});
+
+const total = readTotal();
+if (atEnd() || (total !== null && before >= total)) { done(status()); return; }
+
+let finished = false, timer = null;
+const observer = new MutationObserver(() => {
+  if (countRows() > before || atEnd()) finish();
+});
+function finish() {
+  if (finished) return;
+  finished = true;
+  observer.disconnect();
+  clearTimeout(timer);
+  done(status());
+}
+observer.observe(root, {childList: true, subtree: true});
+timer = setTimeout(finish, timeoutMs);
+if (container) { container.scrollTop = container.scrollHeight; }
+else { window.scrollTo(0, document.body.scrollHeight); }
+"""
+
+def scroll_and_load_all(driver, scroll_container_id=None, max_scrolls=100, wait_time=15,
+                        no_change_threshold=2, row_selector=PS_ROW_SELECTOR,
+                        count_selector=PS_RESULTS_COUNT_SELECTOR, end_selector=None,
+                        verbose=False):
     """
-    Scroll until all content is loaded with smart waiting for content changes.
-    Uses JavaScript to avoid stale element references.
-    
+    Scroll an infinite-scroll list until every result row is loaded.
+
+    Each step runs _SCROLL_STEP_JS, which returns as soon as new rows attach,
+    so there is no polling and no page_source transfer. Loading is complete
+    when the row count reaches the grid's results counter (`count_selector`)
+    or the `end_selector` sentinel appears; without either, after
+    `no_change_threshold` scrolls that add nothing within `wait_time` seconds.
+
     Args:
         driver: Selenium WebDriver instance
         scroll_container_id: ID of scrollable container (None = scroll entire page)
         max_scrolls: Maximum number of scroll attempts
-        wait_time: Maximum seconds to wait for content to change after each scroll
-        no_change_threshold: Number of scrolls with no change before stopping
-        poll_frequency: How often to check for changes (in seconds). Default 0.5s.
-    
+        wait_time: Maximum seconds to wait for new rows after each scroll
+        no_change_threshold: Idle scrolls before stopping when there's no counter/sentinel
+        row_selector: CSS selector matching one result row
+        count_selector: Element whose text holds the total number of results
+        end_selector: Element that only exists once the list is exhausted
+
     Returns:
-        Number of times content changed
+        Number of result rows loaded
     """
-    # Determine what to scroll
-    scroll_entire_page = False
-    
-    if scroll_container_id:
-        # Check if container exists using JavaScript
-        exists = driver.execute_script(
-            f"return document.getElementById('{scroll_container_id}') !== null"
-        )
-        
-        if exists:
-            scroll_entire_page = False
-            if verbose:
-                print(f"✓ Found scroll container: {scroll_container_id}")
-            
-            # Check if element is scrollable using JavaScript
-            scroll_info = driver.execute_script(f"""
-                var elem = document.getElementById('{scroll_container_id}');
-                return {{
-                    scrollHeight: elem.scrollHeight,
-                    clientHeight: elem.clientHeight,
-                    scrollTop: elem.scrollTop
-                }};
-            """)
-            
-            if verbose:
-                print(f"DEBUG: scrollHeight={scroll_info['scrollHeight']}, clientHeight={scroll_info['clientHeight']}")
-                print(f"DEBUG: Is scrollable? {scroll_info['scrollHeight'] > scroll_info['clientHeight']}")
-        else:
-            print(f"✗ Could not find container '{scroll_container_id}'")
-            print("Falling back to scrolling entire page")
-            scroll_container_id = None
-            scroll_entire_page = True
-    else:
-        scroll_entire_page = True
+    if scroll_container_id and not driver.execute_script(
+        "return document.getElementById(arguments[0]) !== null", scroll_container_id
+    ):
+        print(f"✗ Could not find container '{scroll_container_id}'")
+        print("Falling back to scrolling entire page")
+        scroll_container_id = None
+    elif not scroll_container_id:
         print("Scrolling entire page (no container specified)")
-    
-    # Custom expected condition using JavaScript - no element references!
-    class content_has_changed:
-        def __init__(self, container_id, is_page, initial_length):
-            self.container_id = container_id
-            self.is_page = is_page
-            self.initial_length = initial_length
-            self.checks = 0
-        
-        def __call__(self, driver):
-            self.checks += 1
-            try:
-                if self.is_page:
-                    current_length = len(driver.page_source)
-                else:
-                    # Use JavaScript to get innerHTML length directly - no element reference needed
-                    current_length = driver.execute_script(
-                        f"return document.getElementById('{self.container_id}').innerHTML.length"
-                    )
-                
-                if current_length > self.initial_length:
-                    print(f"  ✓ Content changed after {self.checks} checks ({poll_frequency}s intervals)")
-                    return True
-                return False
-            except Exception as e:
-                # Element might be temporarily unavailable
-                return False
-    
+
+    driver.set_script_timeout(wait_time + 5)
+    status = {'rows': 0, 'total': None, 'ended': False}
     no_change_count = 0
-    content_changes = 0
-    scroll_count = 0
-    
-    # Get initial content length using JavaScript
-    if scroll_entire_page:
-        previous_content_length = len(driver.page_source)
-    else:
-        previous_content_length = driver.execute_script(
-            f"return document.getElementById('{scroll_container_id}').innerHTML.length"
+    for scroll_count in range(1, max_scrolls + 1):
+        status = driver.execute_async_script(
+            _SCROLL_STEP_JS, scroll_container_id, row_selector, count_selector,
+            end_selector, int(wait_time * 1000)
         )
-    
-    if verbose:
-        print(f"Initial content length: {previous_content_length} characters")
-        print(f"Starting scroll loop (checking every {poll_frequency}s, max wait {wait_time}s per scroll)\n")
-    
-    while scroll_count < max_scrolls:
-        # Get scroll position before using JavaScript
-        if not scroll_entire_page:
-            scroll_info_before = driver.execute_script(f"""
-                var elem = document.getElementById('{scroll_container_id}');
-                return {{
-                    scrollTop: elem.scrollTop,
-                    scrollHeight: elem.scrollHeight
-                }};
-            """)
-            print(f"Scroll {scroll_count + 1}: scrollTop={scroll_info_before['scrollTop']}, scrollHeight={scroll_info_before['scrollHeight']}")
-        
-        # Scroll down using JavaScript
-        if scroll_entire_page:
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        else:
-            driver.execute_script(f"""
-                var elem = document.getElementById('{scroll_container_id}');
-                elem.scrollTop = elem.scrollHeight;
-            """)
-        
-        # Wait for content to change with custom polling interval
-        try:
-            print(f"  Waiting for content (max {wait_time}s, polling every {poll_frequency}s)...")
-            WebDriverWait(driver, wait_time, poll_frequency=poll_frequency).until(
-                content_has_changed(scroll_container_id, scroll_entire_page, previous_content_length)
-            )
-            
-            # Content changed - get new length using JavaScript
-            if scroll_entire_page:
-                current_content_length = len(driver.page_source)
-            else:
-                current_content_length = driver.execute_script(
-                    f"return document.getElementById('{scroll_container_id}').innerHTML.length"
-                )
-            
-            content_changes += 1
-            change_amount = current_content_length - previous_content_length
-            print(f"  ✓ Content loaded: {previous_content_length:,} → {current_content_length:,} chars (+{change_amount:,})")
-            previous_content_length = current_content_length
+        if verbose:
+            print(f"Scroll {scroll_count}: {status}")
+
+        if status['ended'] or (status['total'] is not None and status['rows'] >= status['total']):
+            print(f"  ✓ All {status['rows']} rows loaded after {scroll_count} scrolls")
+            return status['rows']
+
+        if status['grew']:
             no_change_count = 0
-            
-        except TimeoutException:
-            # No content change detected within wait_time
+            of_total = f" of {status['total']}" if status['total'] is not None else ""
+            print(f"  ✓ {status['rows']}{of_total} rows loaded", end="\r")
+        else:
             no_change_count += 1
-            print(f"  ✗ No change detected within {wait_time}s (attempt {no_change_count}/{no_change_threshold})")
-        
-        # Get scroll position after using JavaScript
-        if not scroll_entire_page:
+            print(f"  ✗ No new rows within {wait_time}s (attempt {no_change_count}/{no_change_threshold})")
+            if no_change_count >= no_change_threshold:
+                print(f"Finished loading: {status['rows']} rows after {scroll_count} scrolls")
+                return status['rows']
+
+    print(f"\n⚠ Reached maximum scroll limit ({max_scrolls}) with {status['rows']} rows")
+    return status['rows']
+
+
+# --- Network capture -------------------------------------------------------
+# PeopleSoft delivers the search results, and each lazy-loaded batch of rows,
+# in AJAX postbacks whose XML wraps every changed region of the page in
+# <FIELD id='...'><![CDATA[html]]></FIELD>. With the performance log on
+# (setup_driver(capture_network=True)) the rows can be read straight from those
+# responses with CDP Network.getResponseBody, without waiting for them to
+# render or serializing the DOM afterwards.
+
+# PeopleSoft component requests (…/psc/<site>/…/<COMPONENT>.GBL)
+PS_AJAX_URL_RE = re.compile(r'/psc/.*\.GBL')
+_PS_FIELD_RE = re.compile(r'<FIELD[^>]*><!\[CDATA\[(.*?)\]\]></FIELD>', re.S)
+
+
+class NetworkCapture:
+    """
+    Reads the bodies of finished responses whose URL matches `url_re` from a
+    driver's performance log. The log is drained on every read, so each
+    response is returned once.
+    """
+
+    def __init__(self, driver, url_re=PS_AJAX_URL_RE):
+        self.driver = driver
+        self.url_re = re.compile(url_re) if isinstance(url_re, str) else url_re
+        self._pending: Dict[str, str] = {}   # requestId -> url, until loading finishes
+
+    def clear(self) -> None:
+        """Drop everything logged so far."""
+        self.driver.get_log('performance')
+        self._pending.clear()
+
+    def poll(self) -> List[Dict]:
+        """[{'url', 'body'}] for matching responses that finished since the last call."""
+        finished = []
+        for entry in self.driver.get_log('performance'):
+            message = json.loads(entry['message'])['message']
+            method, params = message.get('method'), message.get('params', {})
+            if method == 'Network.responseReceived':
+                if self.url_re.search(params['response']['url']):
+                    self._pending[params['requestId']] = params['response']['url']
+            elif method == 'Network.loadingFinished' and params.get('requestId') in self._pending:
+                finished.append(params['requestId'])
+            elif method == 'Network.loadingFailed':
+                self._pending.pop(params.get('requestId'), None)
+
+        responses = []
+        for request_id in finished:
+            url = self._pending.pop(request_id)
             try:
-                scroll_info_after = driver.execute_script(f"""
-                    var elem = document.getElementById('{scroll_container_id}');
-                    return {{
-                        scrollTop: elem.scrollTop,
-                        scrollHeight: elem.scrollHeight
-                    }};
-                """)
-                if verbose:
-                    print(f"  After: scrollTop={scroll_info_after['scrollTop']}, scrollHeight={scroll_info_after['scrollHeight']}")
-                    print(f"  Position changed: {scroll_info_before['scrollTop'] != scroll_info_after['scrollTop']}, Height changed: {scroll_info_before['scrollHeight'] != scroll_info_after['scrollHeight']}\n")
-            except Exception as e:
-                print(f"  (Could not get post-scroll position: {e})\n")
-        
-        if no_change_count >= no_change_threshold:
-            print(f"\n{'='*60}")
-            print(f"Finished loading after {scroll_count + 1} scrolls")
-            print(f"Content changed {content_changes} times")
-            print(f"Final content length: {previous_content_length:,} characters")
-            print(f"{'='*60}")
+                result = self.driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+            except WebDriverException:
+                continue  # already evicted from the browser's buffer
+            body = result['body']
+            if result.get('base64Encoded'):
+                body = base64.b64decode(body).decode('utf-8', errors='replace')
+            responses.append({'url': url, 'body': body})
+        return responses
+
+    def wait(self, timeout: float, poll_interval: float=0.1) -> List[Dict]:
+        """poll() until at least one response arrives, or [] after `timeout` seconds."""
+        deadline = time.monotonic() + timeout
+        while True:
+            responses = self.poll()
+            if responses or time.monotonic() >= deadline:
+                return responses
+            time.sleep(poll_interval)
+
+
+def ps_response_html(body: str) -> str:
+    """The HTML of a PeopleSoft AJAX response's FIELDs (the body itself if it isn't one)."""
+    fragments = _PS_FIELD_RE.findall(body)
+    return "".join(fragments) if fragments else body
+
+
+def ps_result_count(html: str, count_selector: str=PS_RESULTS_COUNT_SELECTOR) -> Optional[int]:
+    """The total from a results header in `html` ("237 Jobs Found", "1-50 of 237"), if any."""
+    header = gen_utils.make_soup(html, "lxml").select_one(count_selector)
+    numbers = re.findall(r'\d+', header.get_text().replace(',', '')) if header else []
+    return int(numbers[-1]) if numbers else None
+
+
+_SCROLL_TO_END_JS = """
+const container = arguments[0] ? document.getElementById(arguments[0]) : null;
+if (container) { container.scrollTop = container.scrollHeight; }
+else { window.scrollTo(0, document.body.scrollHeight); }
+"""
+
+
+def capture_ps_results(
+    driver,
+    url,
+    parse: Callable[[str], List[Dict]],
+    search_kw: str,
+    search_box_id: str='HRS_SCH_WRK_HRS_SCH_TEXT100',
+    search_button_id: str='HRS_SCH_WRK_FLU_HRS_SEARCH_BTN',
+    no_results_id: str='win0divHRS_SCH_WRK_HRS_CC_NO_RSLT',
+    scroll_container_id: Optional[str]="win0divHRS_AGNT_RSLT_I$grid$0",
+    wait_time: int=10,
+    max_batches: int=100,
+    count_selector: str=PS_RESULTS_COUNT_SELECTOR,
+    url_re=PS_AJAX_URL_RE
+    ) -> Optional[List[Dict]]:
+    """
+    Run a PeopleSoft search and read the result rows from its AJAX responses.
+    `parse` turns a response's HTML into jobs. The grid is still scrolled, but
+    only to make PeopleSoft request the next batch: loading stops as soon as
+    the response carrying the last row (per the results count) arrives, or
+    when a scroll draws no response within `wait_time`.
+
+    Returns None if nothing usable was captured (no performance log, no
+    response, or rows that didn't parse), so the caller can read the DOM
+    instead; [] means the search had no results.
+    """
+    try:
+        capture = NetworkCapture(driver, url_re)
+        capture.clear()
+    except WebDriverException as e:
+        print(f"⚠ No performance log to capture from ({str(e).splitlines()[0]})")
+        return None
+
+    try:
+        return _capture_ps_search(
+            driver, capture, url, parse, search_kw, search_box_id, search_button_id,
+            no_results_id, scroll_container_id, wait_time, max_batches, count_selector
+            )
+    except WebDriverException as e:
+        # Timed-out search box, failed navigation, ...: let the DOM path try
+        print(f"⚠ Network capture failed ({type(e).__name__})")
+        rate_limiter.get_limiter(url).record(error=True)
+        debug_capture.capture(url, "capture", driver=driver, error=True)
+        return None
+
+
+def _capture_ps_search(driver, capture, url, parse, search_kw, search_box_id, search_button_id,
+                       no_results_id, scroll_container_id, wait_time, max_batches, count_selector):
+    """capture_ps_results past setting up the capture; browser errors propagate."""
+    limiter = rate_limiter.get_limiter(url)
+    limiter.acquire()
+    start = time.perf_counter()
+    navigate(driver, url, wait_time)
+    search_box = WebDriverWait(driver, wait_time).until(
+        EC.presence_of_element_located((By.ID, search_box_id))
+    )
+    note_page(driver)
+    limiter.record(time.perf_counter() - start, challenged=page_challenged(driver))
+
+    print(f"Searching for: {search_kw}")
+    search_box.clear()
+    search_box.send_keys(search_kw)
+    capture.clear()  # only the search's own responses from here on
+    driver.find_element(By.ID, search_button_id).click()
+    start = time.perf_counter()
+    responses = capture.wait(wait_time)
+    if not responses:
+        print("⚠ No search response captured.")
+        return None
+    latency = time.perf_counter() - start
+    with _SEARCH_LATENCIES_LOCK:
+        _SEARCH_LATENCIES.append(latency)
+
+    # Batches may repeat rows, so collect them keyed on their contents
+    jobs: Dict[tuple, Dict] = {}
+    total = None
+    for batch in range(max_batches):
+        for response in responses:
+            html = ps_response_html(response['body'])
+            for job in parse(html):
+                jobs.setdefault(tuple(job.items()), job)
+            total = ps_result_count(html, count_selector) or total
+            if not jobs and batch == 0 and no_results_id in html:
+                print(f"No results found ({latency:.1f}s).")
+                return []
+
+        if not jobs:
+            print("⚠ Search response had no rows.")
+            return None
+        if total is not None and len(jobs) >= total:
+            print(f"All {total} rows captured.")
             break
-        
-        scroll_count += 1
-    
-    if scroll_count >= max_scrolls:
-        print(f"\n⚠ Reached maximum scroll limit ({max_scrolls})")
-        print(f"Content changed {content_changes} times")
-    
-    return content_changes
+
+        driver.execute_script(_SCROLL_TO_END_JS, scroll_container_id)
+        responses = capture.wait(wait_time)
+        if not responses:
+            print(f"No further batches ({len(jobs)} rows).")
+            break
+    else:
+        print(f"\n⚠ Reached maximum batch limit ({max_batches}) with {len(jobs)} rows")
+
+    return list(jobs.values())
 
 
 def scrape_selenium(
@@ -407,7 +1562,7 @@ def scrape_selenium(
         base_url: The search results URL
     """
     page = 1
-    all_jobs = []
+    all_jobs = gen_utils.ColumnAccumulator(out_cols)
     
     driver = setup_driver()
     
@@ -426,17 +1581,9 @@ def scrape_selenium(
                     url=url,
                     wait_selectors=wait_selectors,
                     wait_time=30,
-                    sleep_time=[1.5, 3],
-                    save_debug_html=True
+                    save_debug_html=save_debug_html
                 )
                 
-                # Save HTML for debugging
-                if save_debug_html:
-                    with open('page_debug.html', 'w', encoding='utf-8') as f:
-                        f.write(soup.prettify())
-                    print("Saved first page HTML to page_debug.html")
-                    
-                
                 jobs = parser(soup, base_url)
                 if not jobs:
                     print("No jobs found on this page → stopping.")
@@ -454,13 +1601,12 @@ def scrape_selenium(
                         print("\nReached last page.")
                         break
                     
-                    # Scroll to button and click
+                    # Scroll to button and click (the click loads a page, so it
+                    # waits its turn with the host's rate limiter)
                     driver.execute_script("arguments[0].scrollIntoView();", next_button)
                     time.sleep(1)
+                    rate_limiter.get_limiter(url).acquire()
                     next_button.click()
-                    
-                    # Wait for new page to load
-                    time.sleep(random.uniform(2, 4))
                     page += 1
                     
                 except NoSuchElementException:
@@ -471,7 +1617,8 @@ def scrape_selenium(
                     break
     
             except Exception as e:
-                print(f"Fatal error during scraping: {e}")
+                print(f"Fatal error during scraping: {e}. Stopping.")
+                break
             
     finally:
         # Always close the browser
@@ -483,14 +1630,7 @@ def scrape_selenium(
         print(f"\nConverting {len(all_jobs)} jobs to Polars DataFrame...")
         
         try:
-            # Convert list of dicts to Polars DataFrame
-            df = pl.DataFrame(all_jobs)
-            
-            # Reorder columns for consistency
-            # Only select columns that exist in the dataframe
-            existing_cols = [col for col in out_cols if col in df.columns]
-            df = df.select(existing_cols)
-            
+            df = all_jobs.to_frame()
             print(f"✓ Successful -- DataFrame shape: {df.shape}")
             
             return df